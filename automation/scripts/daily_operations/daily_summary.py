@@ -6,68 +6,218 @@
 # All metrics must come from real sources or manual input.
 # See INTEGRATION_ROADMAP.md for implementation details.
 
+import copy
 import json
 import os
-from datetime import datetime, timedelta
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+from record_store import open_store
 
 class DailySummaryGenerator:
-    def __init__(self, base_path: str = "."):
+    # Manually logged data the summary is built from: section -> storage collection
+    DATA_COLLECTIONS = {
+        "health": "health",
+        "learning": "learning",
+        "productivity": "tasks",
+    }
+    
+    # Shared across instances so callers like the Telegram bot can construct a
+    # generator per request: data_dir -> (date, file signature, summary data)
+    _cache: Dict[str, Tuple[str, tuple, Dict[str, Any]]] = {}
+    _cache_lock = threading.Lock()
+    
+    # Parsed collections shared by every generator, so summaries for many dates
+    # read each collection once: (data_dir, collection) -> (signature, records, by date)
+    _read_cache: Dict[Tuple[str, str], Tuple[tuple, List[Dict[str, Any]], Dict[str, Dict[str, Any]]]] = {}
+    _read_cache_lock = threading.Lock()
+    
+    # Collectors only read shared data, so they run side by side
+    _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="summary-collect")
+    
+    def __init__(self, base_path: str = ".", data_dir: Optional[str] = None, verbose: bool = True,
+                 for_date: Optional[date] = None):
         self.base_path = Path(base_path)
-        self.today = datetime.now()
+        self.data_dir = Path(data_dir) if data_dir else Path(__file__).parent / "outputs"
+        self.verbose = verbose
+        self.today = datetime.combine(for_date, datetime.now().time()) if for_date else datetime.now()
+        self._stores = {}
         self.summary_data = {
             "date": self.today.strftime("%Y-%m-%d"),
             "sections": {},
             "reflections": {}  # Добавляем поле для ответов на вопросы
         }
     
+    def _warn(self, *lines: str):
+        """Print data source warnings when running as a script"""
+        if self.verbose:
+            for line in lines:
+                print(line)
+    
+    def _store(self, name: str):
+        """The storage collection behind one of the summary sections"""
+        if name not in self._stores:
+            self._stores[name] = open_store(self.DATA_COLLECTIONS[name], self.data_dir)
+        return self._stores[name]
+    
+    def _records(self, name: str) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """All records of a section's collection and an index by date, reloaded only after a write.
+        
+        The returned objects are shared between generators and must not be modified.
+        """
+        store = self._store(name)
+        key = (str(self.data_dir), self.DATA_COLLECTIONS[name])
+        signature = store.signature()
+        with self._read_cache_lock:
+            cached = self._read_cache.get(key)
+        if cached and cached[0] == signature:
+            return cached[1], cached[2]
+        
+        records = store.load()
+        by_date = {record['date']: record for record in records if record.get('date')}
+        with self._read_cache_lock:
+            self._read_cache[key] = (signature, records, by_date)
+        return records, by_date
+    
+    def _today_entry(self, name: str) -> Optional[Dict[str, Any]]:
+        return self._records(name)[1].get(self.summary_data["date"])
+    
     def collect_health_data(self) -> Dict[str, Any]:
-        """Collect health metrics for the day"""
+        """Collect health metrics logged for the day"""
         # TODO: Connect to real health tracking APIs (Apple Health, Google Fit, Fitbit)
-        # For now, return None to indicate no real data available
-        print("⚠️  WARNING: Health data not connected to real sources")
-        print("   Please implement integrations with health tracking apps")
-        return None
+        entry = self._today_entry("health")
+        if not entry or not entry.get('metrics'):
+            self._warn("⚠️  WARNING: No health data logged today",
+                       "   Log metrics with health_logger.py or /log_health")
+            return None
+        
+        return {
+            "metrics": {name: metric.get('value') for name, metric in entry['metrics'].items()},
+            "notes": [note.get('note') for note in entry.get('notes', []) if note.get('note')]
+        }
     
     def collect_productivity_data(self) -> Dict[str, Any]:
-        """Collect productivity metrics"""
+        """Collect task metrics from the task manager"""
         # TODO: Connect to real productivity tools (Todoist, Notion, RescueTime, Toggl, GitHub)
-        # For now, return None to indicate no real data available
-        print("⚠️  WARNING: Productivity data not connected to real sources")
-        print("   Please implement integrations with productivity tools")
-        return None
+        tasks, _ = self._records("productivity")
+        if not tasks:
+            self._warn("⚠️  WARNING: No task data available",
+                       "   Add tasks with task_manager.py or /add_task")
+            return None
+        
+        today = self.summary_data["date"]
+        
+        def completed_on(task: Dict[str, Any]) -> str:
+            return task.get('completed_date') or str(task.get('completed') or '')[:10]
+        
+        completed_today = [
+            task['title'] for task in tasks
+            if task.get('status') == 'completed' and completed_on(task) == today
+        ]
+        # As of the summary date: created by then and not yet completed by then
+        pending = [
+            task for task in tasks
+            if (task.get('created_date') or '') <= today
+            and (task.get('status') != 'completed' or completed_on(task) > today)
+        ]
+        
+        return {
+            "completed_today": completed_today,
+            "pending": len(pending),
+            "high_priority_pending": sum(1 for task in pending if task.get('priority') == 'high'),
+            "due_today": sum(1 for task in pending if task.get('due_date') == today),
+            "overdue": sum(1 for task in pending if task.get('due_date') and task['due_date'] < today),
+        }
     
     def collect_learning_data(self) -> Dict[str, Any]:
-        """Collect learning progress"""
+        """Collect learning activities logged for the day"""
         # TODO: Connect to real learning platforms (Coursera, Udemy, Notion, Obsidian)
-        # For now, return None to indicate no real data available
-        print("⚠️  WARNING: Learning data not connected to real sources")
-        print("   Please implement integrations with learning platforms")
-        return None
+        entry = self._today_entry("learning")
+        if not entry or not entry.get('activities'):
+            self._warn("⚠️  WARNING: No learning activity logged today",
+                       "   Log activities with learning_tracker.py or /log_learning")
+            return None
+        
+        return {
+            "total_minutes": entry.get('total_time', 0),
+            "activities": [
+                {
+                    "type": activity.get('type'),
+                    "duration": activity.get('duration'),
+                    "description": activity.get('description', '')
+                }
+                for activity in entry['activities']
+            ]
+        }
     
     def collect_finance_data(self) -> Dict[str, Any]:
         """Collect financial data"""
         # TODO: Connect to real financial tools (Banking APIs, YNAB, Mint)
         # For now, return None to indicate no real data available
-        print("⚠️  WARNING: Finance data not connected to real sources")
-        print("   Please implement integrations with financial tools")
+        self._warn("⚠️  WARNING: Finance data not connected to real sources",
+                   "   Please implement integrations with financial tools")
         return None
     
     def analyze_patterns(self) -> List[str]:
         """Analyze patterns and generate insights"""
         # TODO: Implement real pattern analysis based on actual data
         # For now, return empty list since we have no real data
-        print("⚠️  WARNING: Pattern analysis requires real data")
+        self._warn("⚠️  WARNING: Pattern analysis requires real data")
         return []
     
     def generate_recommendations(self) -> List[str]:
         """Generate personalized recommendations"""
         # TODO: Implement real recommendations based on actual data patterns
         # For now, return empty list since we have no real data
-        print("⚠️  WARNING: Recommendations require real data analysis")
+        self._warn("⚠️  WARNING: Recommendations require real data analysis")
         return []
     
+    def _data_signature(self) -> tuple:
+        """Storage signature of every collection, so any write invalidates the cache"""
+        return tuple((name, self._store(name).signature()) for name in sorted(self.DATA_COLLECTIONS))
+    
+    def collect_summary_data(self) -> Dict[str, Any]:
+        """Collect all sections into the structured summary, without reflections"""
+        collectors = {
+            "health": self.collect_health_data,
+            "productivity": self.collect_productivity_data,
+            "learning": self.collect_learning_data,
+            "finance": self.collect_finance_data,
+        }
+        futures = {name: self._executor.submit(collect) for name, collect in collectors.items()}
+        for name, future in futures.items():
+            self.summary_data["sections"][name] = future.result()
+        self.summary_data["insights"] = self.analyze_patterns()
+        self.summary_data["recommendations"] = self.generate_recommendations()
+        self.summary_data["has_real_data"] = any(
+            data is not None for data in self.summary_data['sections'].values()
+        )
+        self.summary_data["generated_at"] = datetime.now().isoformat()
+        return self.summary_data
+    
+    def get_summary_data(self) -> Dict[str, Any]:
+        """
+        Structured summary for in-process callers such as the Telegram bot.
+        Cached per day and data directory; any write to the logged data
+        triggers a rebuild.
+        """
+        cache_key = str(self.data_dir.resolve())
+        signature = self._data_signature()
+        
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached and cached[0] == self.summary_data["date"] and cached[1] == signature:
+                return copy.deepcopy(cached[2])
+        
+        data = self.collect_summary_data()
+        with self._cache_lock:
+            self._cache[cache_key] = (data["date"], signature, copy.deepcopy(data))
+        return data
+    
     def collect_reflections(self) -> Dict[str, str]:
         """Collect user reflections for the day"""
         print("\n📝 Daily Reflection Questions")
@@ -93,25 +243,20 @@ class DailySummaryGenerator:
             print("\n❌ Reflection collection cancelled.")
             return {}
     
-    def create_summary(self) -> str:
+    def create_summary(self, interactive: bool = True) -> str:
         """Create the complete daily summary"""
         # Collect all data
-        self.summary_data["sections"]["health"] = self.collect_health_data()
-        self.summary_data["sections"]["productivity"] = self.collect_productivity_data()
-        self.summary_data["sections"]["learning"] = self.collect_learning_data()
-        self.summary_data["sections"]["finance"] = self.collect_finance_data()
-        self.summary_data["insights"] = self.analyze_patterns()
-        self.summary_data["recommendations"] = self.generate_recommendations()
-        
-        # Collect reflections
-        self.summary_data["reflections"] = self.collect_reflections()
+        self.collect_summary_data()
         
-        # Check if we have any real data
-        has_real_data = any(
-            data is not None for data in self.summary_data['sections'].values()
-        )
+        # Collect reflections (needs a person at the terminal, so never in parallel)
+        if interactive:
+            self.summary_data["reflections"] = self.collect_reflections()
         
-        if not has_real_data:
+        return self.render_summary()
+    
+    def render_summary(self) -> str:
+        """Render the collected summary data as Markdown"""
+        if not self.summary_data["has_real_data"]:
             summary = f"""# Daily Summary - {self.today.strftime('%B %d, %Y')}
 
 ## ⚠️ No Real Data Available
@@ -167,15 +312,25 @@ Until integrations are implemented, consider adding manual input forms for daily
         if self.summary_data['sections']['health']:
             health_data = self.summary_data['sections']['health']
             summary_parts.append("## 🏃 Health & Wellness")
-            # Add health data formatting here when real data is available
+            summary_parts.extend(f"- {name.title()}: {value}" for name, value in health_data['metrics'].items())
         
         if self.summary_data['sections']['productivity']:
+            productivity = self.summary_data['sections']['productivity']
             summary_parts.append("## 💼 Productivity")
-            # Add productivity data formatting here when real data is available
+            summary_parts.append(f"- Completed today: {len(productivity['completed_today'])}")
+            summary_parts.extend(f"  - {title}" for title in productivity['completed_today'])
+            summary_parts.append(f"- Pending: {productivity['pending']} ({productivity['high_priority_pending']} high priority)")
+            if productivity['overdue']:
+                summary_parts.append(f"- Overdue: {productivity['overdue']}")
         
         if self.summary_data['sections']['learning']:
+            learning = self.summary_data['sections']['learning']
             summary_parts.append("## 📚 Learning & Growth")
-            # Add learning data formatting here when real data is available
+            summary_parts.append(f"- Total: {learning['total_minutes']:g} minutes")
+            summary_parts.extend(
+                f"- {activity['type']}: {activity['duration']:g} min {activity['description']}".rstrip()
+                for activity in learning['activities']
+            )
         
         if self.summary_data['sections']['finance']:
             summary_parts.append("## 💰 Finance")
@@ -202,8 +357,8 @@ Until integrations are implemented, consider adding manual input forms for daily
         
         return "\n".join(summary_parts)
     
-    def save_summary(self, summary: str):
-        """Save the summary to file"""
+    def save_summary(self, summary: str) -> Path:
+        """Save the summary to file and return the markdown path"""
         # Create output directory
         output_dir = self.base_path / "automation" / "outputs" / "daily_summaries"
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -221,6 +376,7 @@ Until integrations are implemented, consider adding manual input forms for daily
         
         print(f"✅ Summary saved to {filepath}")
         print(f"📊 Data saved to {json_filepath}")
+        return filepath
     
     def send_notification(self, summary: str):
         """Send summary notification (placeholder)"""
@@ -229,7 +385,34 @@ Until integrations are implemented, consider adding manual input forms for daily
         print("   Slack: ✅")
         print("   Mobile: ✅")
 
+def generate_range(start: date, end: date, base_path: str = ".", data_dir: Optional[str] = None) -> List[Path]:
+    """Create and save non-interactive summaries for every date from start to end, inclusive."""
+    saved = []
+    day = start
+    while day <= end:
+        generator = DailySummaryGenerator(base_path, data_dir, verbose=False, for_date=day)
+        summary = generator.create_summary(interactive=False)
+        saved.append(generator.save_summary(summary))
+        day += timedelta(days=1)
+    return saved
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--range":
+        if len(sys.argv) < 4:
+            print("Usage: python daily_summary.py --range <start_date> <end_date>")
+            return
+        
+        try:
+            start, end = date.fromisoformat(sys.argv[2]), date.fromisoformat(sys.argv[3])
+        except ValueError:
+            print("Error: dates must be YYYY-MM-DD")
+            return
+        
+        print(f"🚀 Generating daily summaries from {start} to {end}...")
+        saved = generate_range(start, end)
+        print(f"\n✨ Generated {len(saved)} daily summaries")
+        return
+    
     print("🚀 Starting Daily Summary Generation...")
     
     generator = DailySummaryGenerator()
@@ -12,10 +12,16 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any
 
+from record_store import open_store
+
 class DailySummaryBotGenerator:
     def __init__(self, base_path: str = "."):
         self.base_path = Path(base_path)
         self.today = datetime.now()
+        # Health, learning and tasks are read from the daily operations record store
+        self.health_store = open_store("health")
+        self.learning_store = open_store("learning")
+        self.task_store = open_store("tasks")
         self.summary_data = {
             "date": self.today.strftime("%Y-%m-%d"),
             "sections": {},
@@ -26,14 +32,12 @@ class DailySummaryBotGenerator:
         """Collect health metrics for the day from existing data files."""
         try:
             # Check for existing health data
-            health_file = self.base_path / "automation" / "outputs" / "health_data.json"
-            if health_file.exists():
-                with open(health_file, 'r') as f:
-                    health_data = json.load(f)
-                    # Get today's data
-                    today_str = self.today.strftime("%Y-%m-%d")
-                    if today_str in health_data:
-                        return health_data[today_str]
+            today_entry = self.health_store.get(self.today.strftime("%Y-%m-%d"))
+            if today_entry:
+                return {
+                    metric: data.get('value') if isinstance(data, dict) else data
+                    for metric, data in today_entry.get('metrics', {}).items()
+                }
             
             # Check for health logs in the system
             health_logs_dir = self.base_path / "automation" / "outputs" / "health_logs"
@@ -52,13 +56,17 @@ class DailySummaryBotGenerator:
         """Collect learning progress from existing data files."""
         try:
             # Check for learning data
-            learning_file = self.base_path / "automation" / "outputs" / "learning_data.json"
-            if learning_file.exists():
-                with open(learning_file, 'r') as f:
-                    learning_data = json.load(f)
-                    today_str = self.today.strftime("%Y-%m-%d")
-                    if today_str in learning_data:
-                        return learning_data[today_str]
+            today_entry = self.learning_store.get(self.today.strftime("%Y-%m-%d"))
+            if today_entry:
+                activities = today_entry.get('activities', [])
+                return {
+                    "study_time": today_entry.get('total_time', 0),
+                    "topics": list(dict.fromkeys(
+                        activity.get('course') or activity.get('type') for activity in activities
+                        if activity.get('course') or activity.get('type')
+                    )),
+                    "activities": activities
+                }
             
             return None
         except Exception as e:
@@ -68,21 +76,15 @@ class DailySummaryBotGenerator:
     def collect_task_data(self) -> Dict[str, Any]:
         """Collect task completion data."""
         try:
-            # Check for task data
-            task_file = self.base_path / "automation" / "outputs" / "tasks.json"
-            if task_file.exists():
-                with open(task_file, 'r') as f:
-                    task_data = json.load(f)
-                    # Get today's tasks
-                    today_str = self.today.strftime("%Y-%m-%d")
-                    today_tasks = [task for task in task_data.get('tasks', []) 
-                                 if task.get('date') == today_str]
-                    if today_tasks:
-                        return {
-                            "total_tasks": len(today_tasks),
-                            "completed_tasks": len([t for t in today_tasks if t.get('completed', False)]),
-                            "tasks": today_tasks
-                        }
+            # Get today's tasks; creation date is indexed in storage
+            today_str = self.today.strftime("%Y-%m-%d")
+            today_tasks = self.task_store.query(date_from=today_str, date_to=today_str)
+            if today_tasks:
+                return {
+                    "total_tasks": len(today_tasks),
+                    "completed_tasks": len([t for t in today_tasks if t.get('status') == 'completed']),
+                    "tasks": today_tasks
+                }
             
             return None
         except Exception as e:
@@ -7,54 +7,46 @@ Part of the Personal System automation suite.
 import json
 import os
 import sys
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 # Add the automation directory to the path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from record_store import open_store
+from rollups import ENTRY_METRIC, summarize
+
+# Metrics averaged in the range summaries; the rest stay under 'metrics'
+AVERAGED_METRICS = ('steps', 'sleep', 'water')
+
+# Metrics whose values are stored as numbers
+NUMERIC_METRICS = ['steps', 'sleep', 'water', 'weight', 'calories', 'meditation', 'stress', 'energy']
+
 class HealthLogger:
     def __init__(self):
         self.data_dir = Path(__file__).parent.parent / "outputs"
         self.data_file = self.data_dir / "health_data.json"
-        self._ensure_data_file()
-    
-    def _ensure_data_file(self):
-        """Ensure data file exists with proper structure."""
-        if not self.data_file.exists():
-            self.data_file.parent.mkdir(exist_ok=True)
-            with open(self.data_file, 'w') as f:
-                json.dump([], f)
+        self.store = open_store("health", self.data_dir)
     
     def _load_data(self) -> List[Dict[str, Any]]:
-        """Load health data from file."""
-        try:
-            with open(self.data_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
+        """Load all daily health entries from storage."""
+        return self.store.load()
     
     def _save_data(self, data: List[Dict[str, Any]]):
-        """Save health data to file."""
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Replace all daily health entries in storage."""
+        self.store.save(data)
     
-    def _get_today_entry(self, data: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    def _get_today_entry(self) -> Optional[Dict[str, Any]]:
         """Get today's health entry."""
-        today = date.today().isoformat()
-        for entry in data:
-            if entry.get('date') == today:
-                return entry
-        return None
+        return self.store.get(date.today().isoformat())
     
     def log_metric(self, metric_type: str, value: Any, notes: str = "") -> Dict[str, Any]:
         """Log a health metric for today."""
-        data = self._load_data()
         today = date.today().isoformat()
         
         # Get or create today's entry
-        today_entry = self._get_today_entry(data)
+        today_entry = self._get_today_entry()
         if not today_entry:
             today_entry = {
                 'date': today,
@@ -62,7 +54,6 @@ class HealthLogger:
                 'metrics': {},
                 'notes': []
             }
-            data.append(today_entry)
         
         # Add the metric
         today_entry['metrics'][metric_type] = {
@@ -78,7 +69,7 @@ class HealthLogger:
                 'note': notes
             })
         
-        self._save_data(data)
+        self.store.put(today_entry)
         
         return {
             'success': True,
@@ -90,8 +81,7 @@ class HealthLogger:
     
     def get_today_stats(self) -> Dict[str, Any]:
         """Get today's health statistics."""
-        data = self._load_data()
-        today_entry = self._get_today_entry(data)
+        today_entry = self._get_today_entry()
         
         if not today_entry:
             return {
@@ -151,42 +141,26 @@ class HealthLogger:
             'notes': today_entry.get('notes', [])
         }
     
-    def get_weekly_stats(self) -> Dict[str, Any]:
-        """Get weekly health statistics."""
-        data = self._load_data()
-        today = date.today()
-        
-        # Get last 7 days
-        weekly_data = []
-        for i in range(7):
-            check_date = (today - timedelta(days=i)).isoformat()
-            for entry in data:
-                if entry.get('date') == check_date:
-                    weekly_data.append(entry)
-                    break
+    def get_range_stats(self, start_date: str, end_date: str, period: str = "") -> Dict[str, Any]:
+        """Get health statistics for an inclusive date range (YYYY-MM-DD), from the daily rollups."""
+        period = period or f"{start_date} to {end_date}"
+        stats = summarize(self.store.rollups(start_date, end_date))
+        days_logged = stats.pop(ENTRY_METRIC, {}).get('days', 0)
         
-        if not weekly_data:
+        if not days_logged:
             return {
                 'success': True,
-                'message': "No health data for the past week",
-                'period': '7 days',
+                'message': f"No health data for {period}",
+                'period': period,
                 'summary': "Start logging your health metrics!"
             }
         
-        # Calculate averages
-        metrics_sum = {}
-        metrics_count = {}
-        
-        for entry in weekly_data:
-            for metric_type, metric_data in entry.get('metrics', {}).items():
-                if metric_type in ['steps', 'sleep', 'water']:
-                    value = float(metric_data['value'])
-                    metrics_sum[metric_type] = metrics_sum.get(metric_type, 0) + value
-                    metrics_count[metric_type] = metrics_count.get(metric_type, 0) + 1
-        
-        averages = {}
-        for metric_type in metrics_sum:
-            averages[metric_type] = round(metrics_sum[metric_type] / metrics_count[metric_type], 1)
+        # Average of the daily values of the core metrics
+        averages = {
+            metric_type: round(metric_stats['sum'] / metric_stats['count'], 1)
+            for metric_type, metric_stats in stats.items()
+            if metric_type in AVERAGED_METRICS
+        }
         
         # Generate summary
         summary = []
@@ -204,13 +178,24 @@ class HealthLogger:
         
         return {
             'success': True,
-            'message': "Weekly health summary",
-            'period': '7 days',
+            'message': f"Health summary for {period}",
+            'period': period,
             'averages': averages,
+            'metrics': stats,
             'summary': summary,
-            'days_logged': len(weekly_data)
+            'days_logged': days_logged
         }
     
+    def get_weekly_stats(self) -> Dict[str, Any]:
+        """Get weekly health statistics."""
+        today = date.today()
+        return self.get_range_stats((today - timedelta(days=6)).isoformat(), today.isoformat(), '7 days')
+    
+    def get_monthly_stats(self) -> Dict[str, Any]:
+        """Get health statistics for the last 30 days."""
+        today = date.today()
+        return self.get_range_stats((today - timedelta(days=29)).isoformat(), today.isoformat(), '30 days')
+    
     def list_metrics(self) -> Dict[str, Any]:
         """List all available metric types."""
         return {
@@ -240,6 +225,8 @@ def main():
         print("  log <metric_type> <value> [notes] - Log a health metric")
         print("  today - Get today's health stats")
         print("  weekly - Get weekly health stats")
+        print("  monthly - Get health stats for the last 30 days")
+        print("  range <start_date> <end_date> - Get health stats for a date range (YYYY-MM-DD)")
         print("  list - List available metrics")
         return
     
@@ -255,7 +242,7 @@ def main():
         notes = sys.argv[4] if len(sys.argv) > 4 else ""
         
         # Convert numeric values
-        if metric_type in ['steps', 'sleep', 'water', 'weight', 'calories', 'meditation', 'stress', 'energy']:
+        if metric_type in NUMERIC_METRICS:
             try:
                 value = float(value)
             except ValueError:
@@ -273,6 +260,18 @@ def main():
         result = logger.get_weekly_stats()
         print(json.dumps(result, indent=2))
     
+    elif action == "monthly":
+        result = logger.get_monthly_stats()
+        print(json.dumps(result, indent=2))
+    
+    elif action == "range":
+        if len(sys.argv) < 4:
+            print("Usage: python health_logger.py range <start_date> <end_date>")
+            return
+        
+        result = logger.get_range_stats(sys.argv[2], sys.argv[3])
+        print(json.dumps(result, indent=2))
+    
     elif action == "list":
         result = logger.list_metrics()
         print(json.dumps(result, indent=2))
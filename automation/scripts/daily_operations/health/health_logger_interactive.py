@@ -4,78 +4,40 @@ Interactive Health Logger for Telegram Bot
 Provides a simple interface for logging health metrics
 """
 
-import json
-import os
 import sys
-from datetime import datetime, date
+from datetime import date
 from pathlib import Path
-from typing import Dict, List, Any, Optional
 
 # Add the automation directory to the path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from health_logger import HealthLogger, NUMERIC_METRICS
+
 class InteractiveHealthLogger:
     def __init__(self):
-        self.data_dir = Path(__file__).parent.parent / "outputs"
-        self.data_file = self.data_dir / "health_data.json"
-        self._ensure_data_file()
-    
-    def _ensure_data_file(self):
-        """Ensure data file exists with proper structure."""
-        if not self.data_file.exists():
-            self.data_file.parent.mkdir(exist_ok=True)
-            with open(self.data_file, 'w') as f:
-                json.dump({}, f)
-    
-    def _load_data(self) -> Dict[str, Any]:
-        """Load health data from file."""
-        try:
-            with open(self.data_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {}
-    
-    def _save_data(self, data: Dict[str, Any]):
-        """Save health data to file."""
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Same record store as the health logger, so both see every entry
+        self.health_logger = HealthLogger()
+        self.store = self.health_logger.store
     
     def log_health_metric(self, metric_type: str, value: str, notes: str = "") -> str:
         """Log a health metric for today."""
-        today = date.today().isoformat()
-        data = self._load_data()
-        
-        if today not in data:
-            data[today] = {
-                "date": today,
-                "metrics": {},
-                "notes": []
-            }
-        
-        # Store the metric
-        data[today]["metrics"][metric_type] = {
-            "value": value,
-            "timestamp": datetime.now().isoformat(),
-            "notes": notes
-        }
-        
-        # Add to notes if provided
-        if notes:
-            data[today]["notes"].append(f"{metric_type}: {notes}")
+        if metric_type in NUMERIC_METRICS:
+            try:
+                value = float(value)
+            except ValueError:
+                return f"❌ {metric_type} requires a numeric value"
         
-        self._save_data(data)
+        self.health_logger.log_metric(metric_type, value, notes)
         
         return f"✅ Logged {metric_type}: {value}" + (f" (Notes: {notes})" if notes else "")
     
     def get_today_stats(self) -> str:
         """Get today's health statistics."""
-        today = date.today().isoformat()
-        data = self._load_data()
+        today_data = self.store.get(date.today().isoformat())
         
-        if today not in data:
+        if not today_data:
             return "📊 **Today's Health Stats**\n\nNo health data logged today.\n\n**Available Metrics:**\n- steps: Number of steps\n- sleep: Hours of sleep\n- water: Glasses of water\n- weight: Weight in kg/lbs\n- mood: Mood (1-10)\n- workout: Workout type\n- stress: Stress level (1-10)\n- energy: Energy level (1-10)"
         
-        today_data = data[today]
         metrics = today_data.get("metrics", {})
         
         if not metrics:
@@ -14,48 +14,34 @@ from typing import Dict, List, Any, Optional
 # Add the automation directory to the path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from record_store import open_store
+from rollups import ENTRY_METRIC, summarize
+
 class LearningTracker:
     def __init__(self):
         self.data_dir = Path(__file__).parent.parent / "outputs"
         self.data_file = self.data_dir / "learning_data.json"
-        self._ensure_data_file()
-    
-    def _ensure_data_file(self):
-        """Ensure data file exists with proper structure."""
-        if not self.data_file.exists():
-            self.data_file.parent.mkdir(exist_ok=True)
-            with open(self.data_file, 'w') as f:
-                json.dump([], f)
+        self.store = open_store("learning", self.data_dir)
     
     def _load_data(self) -> List[Dict[str, Any]]:
-        """Load learning data from file."""
-        try:
-            with open(self.data_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
+        """Load all daily learning entries from storage."""
+        return self.store.load()
     
     def _save_data(self, data: List[Dict[str, Any]]):
-        """Save learning data to file."""
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Replace all daily learning entries in storage."""
+        self.store.save(data)
     
-    def _get_today_entry(self, data: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    def _get_today_entry(self) -> Optional[Dict[str, Any]]:
         """Get today's learning entry."""
-        today = date.today().isoformat()
-        for entry in data:
-            if entry.get('date') == today:
-                return entry
-        return None
+        return self.store.get(date.today().isoformat())
     
     def log_activity(self, activity_type: str, duration: float, description: str = "", 
                     course: str = "", skill: str = "", notes: str = "") -> Dict[str, Any]:
         """Log a learning activity for today."""
-        data = self._load_data()
         today = date.today().isoformat()
         
         # Get or create today's entry
-        today_entry = self._get_today_entry(data)
+        today_entry = self._get_today_entry()
         if not today_entry:
             today_entry = {
                 'date': today,
@@ -64,7 +50,6 @@ class LearningTracker:
                 'total_time': 0,
                 'notes': []
             }
-            data.append(today_entry)
         
         # Create activity entry
         activity = {
@@ -87,7 +72,7 @@ class LearningTracker:
                 'note': notes
             })
         
-        self._save_data(data)
+        self.store.put(today_entry)
         
         return {
             'success': True,
@@ -99,8 +84,7 @@ class LearningTracker:
     
     def get_today_stats(self) -> Dict[str, Any]:
         """Get today's learning statistics."""
-        data = self._load_data()
-        today_entry = self._get_today_entry(data)
+        today_entry = self._get_today_entry()
         
         if not today_entry:
             return {
@@ -152,75 +136,71 @@ class LearningTracker:
             'notes': today_entry.get('notes', [])
         }
     
-    def get_weekly_stats(self) -> Dict[str, Any]:
-        """Get weekly learning statistics."""
-        data = self._load_data()
-        today = date.today()
-        
-        # Get last 7 days
-        weekly_data = []
-        for i in range(7):
-            check_date = (today - timedelta(days=i)).isoformat()
-            for entry in data:
-                if entry.get('date') == check_date:
-                    weekly_data.append(entry)
-                    break
+    def get_range_stats(self, start_date: str, end_date: str, period: str = "") -> Dict[str, Any]:
+        """Get learning statistics for an inclusive date range (YYYY-MM-DD), from the daily rollups."""
+        period = period or f"{start_date} to {end_date}"
+        stats = summarize(self.store.rollups(start_date, end_date))
+        days_logged = stats.get(ENTRY_METRIC, {}).get('days', 0)
         
-        if not weekly_data:
+        if not days_logged:
             return {
                 'success': True,
-                'message': "No learning data for the past week",
-                'period': '7 days',
+                'message': f"No learning data for {period}",
+                'period': period,
                 'summary': "Start logging your learning activities!"
             }
         
         # Calculate totals
-        total_time = sum(entry.get('total_time', 0) for entry in weekly_data)
-        total_activities = sum(len(entry.get('activities', [])) for entry in weekly_data)
+        total_time = stats.get('total', {}).get('sum', 0)
+        total_activities = stats.get('total', {}).get('count', 0)
         
         # Group by activity type
-        activity_types = {}
-        for entry in weekly_data:
-            for activity in entry.get('activities', []):
-                activity_type = activity['type']
-                if activity_type not in activity_types:
-                    activity_types[activity_type] = {'count': 0, 'total_time': 0}
-                activity_types[activity_type]['count'] += 1
-                activity_types[activity_type]['total_time'] += activity['duration']
+        activity_types = {
+            metric[len('type:'):]: {'count': metric_stats['count'], 'total_time': metric_stats['sum']}
+            for metric, metric_stats in stats.items() if metric.startswith('type:')
+        }
         
         # Generate summary
         summary = []
         if total_time > 0:
-            avg_daily = total_time / len(weekly_data)
-            summary.append(f"📊 Weekly total: {total_time/60:.1f} hours")
+            avg_daily = total_time / days_logged
+            summary.append(f"📊 Total: {total_time/60:.1f} hours")
             summary.append(f"📈 Daily average: {avg_daily:.0f} minutes")
         
         summary.append(f"📚 Total activities: {total_activities}")
         
-        for activity_type, stats in activity_types.items():
-            count = stats['count']
-            time = stats['total_time']
+        for activity_type, type_stats in activity_types.items():
+            count = type_stats['count']
+            time = type_stats['total_time']
             summary.append(f"📝 {activity_type.title()}: {count} sessions, {time/60:.1f}h")
         
         return {
             'success': True,
-            'message': "Weekly learning summary",
-            'period': '7 days',
+            'message': f"Learning summary for {period}",
+            'period': period,
             'total_time': total_time,
             'total_activities': total_activities,
             'activity_types': activity_types,
             'summary': summary,
-            'days_logged': len(weekly_data)
+            'days_logged': days_logged
         }
     
+    def get_weekly_stats(self) -> Dict[str, Any]:
+        """Get weekly learning statistics."""
+        today = date.today()
+        return self.get_range_stats((today - timedelta(days=6)).isoformat(), today.isoformat(), '7 days')
+    
+    def get_monthly_stats(self) -> Dict[str, Any]:
+        """Get learning statistics for the last 30 days."""
+        today = date.today()
+        return self.get_range_stats((today - timedelta(days=29)).isoformat(), today.isoformat(), '30 days')
+    
     def get_course_progress(self, course_name: str = "") -> Dict[str, Any]:
         """Get progress for a specific course or all courses."""
-        data = self._load_data()
-        
         if course_name:
             # Get progress for specific course
             course_activities = []
-            for entry in data:
+            for entry in self._load_data():
                 for activity in entry.get('activities', []):
                     if activity.get('course', '').lower() == course_name.lower():
                         course_activities.append({
@@ -247,17 +227,16 @@ class LearningTracker:
                 'activities': course_activities
             }
         else:
-            # Get progress for all courses
-            courses = {}
-            for entry in data:
-                for activity in entry.get('activities', []):
-                    course = activity.get('course', 'General Learning')
-                    if course not in courses:
-                        courses[course] = {'total_time': 0, 'sessions': 0, 'last_activity': None}
-                    
-                    courses[course]['total_time'] += activity['duration']
-                    courses[course]['sessions'] += 1
-                    courses[course]['last_activity'] = entry['date']
+            # Get progress for all courses from the daily rollups
+            courses = {
+                metric[len('course:'):]: {
+                    'total_time': course_stats['sum'],
+                    'sessions': course_stats['count'],
+                    'last_activity': course_stats['last_day']
+                }
+                for metric, course_stats in summarize(self.store.rollups()).items()
+                if metric.startswith('course:')
+            }
             
             return {
                 'success': True,
@@ -294,6 +273,8 @@ def main():
         print("  log <type> <duration> [description] [course] [skill] [notes] - Log learning activity")
         print("  today - Get today's learning stats")
         print("  weekly - Get weekly learning stats")
+        print("  monthly - Get learning stats for the last 30 days")
+        print("  range <start_date> <end_date> - Get learning stats for a date range (YYYY-MM-DD)")
         print("  course [course_name] - Get course progress")
         print("  list - List available activity types")
         return
@@ -328,6 +309,18 @@ def main():
         result = tracker.get_weekly_stats()
         print(json.dumps(result, indent=2))
     
+    elif action == "monthly":
+        result = tracker.get_monthly_stats()
+        print(json.dumps(result, indent=2))
+    
+    elif action == "range":
+        if len(sys.argv) < 4:
+            print("Usage: python learning_tracker.py range <start_date> <end_date>")
+            return
+        
+        result = tracker.get_range_stats(sys.argv[2], sys.argv[3])
+        print(json.dumps(result, indent=2))
+    
     elif action == "course":
         course_name = sys.argv[2] if len(sys.argv) > 2 else ""
         result = tracker.get_course_progress(course_name)
@@ -4,54 +4,23 @@ Interactive Learning Tracker for Telegram Bot
 Provides a simple interface for tracking learning activities
 """
 
-import json
-import os
 import sys
-from datetime import datetime, date
+from datetime import date
 from pathlib import Path
-from typing import Dict, List, Any, Optional
 
 # Add the automation directory to the path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from learning_tracker import LearningTracker
+
 class InteractiveLearningTracker:
     def __init__(self):
-        self.data_dir = Path(__file__).parent.parent / "outputs"
-        self.data_file = self.data_dir / "learning_data.json"
-        self._ensure_data_file()
-    
-    def _ensure_data_file(self):
-        """Ensure data file exists with proper structure."""
-        if not self.data_file.exists():
-            self.data_file.parent.mkdir(exist_ok=True)
-            with open(self.data_file, 'w') as f:
-                json.dump({}, f)
-    
-    def _load_data(self) -> Dict[str, Any]:
-        """Load learning data from file."""
-        try:
-            with open(self.data_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {}
-    
-    def _save_data(self, data: Dict[str, Any]):
-        """Save learning data to file."""
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Same record store as the learning tracker, so both see every entry
+        self.tracker = LearningTracker()
+        self.store = self.tracker.store
     
     def log_learning_activity(self, activity_type: str, duration: str, description: str = "", course: str = "", skill: str = "", notes: str = "") -> str:
         """Log a learning activity for today."""
-        today = date.today().isoformat()
-        data = self._load_data()
-        
-        if today not in data:
-            data[today] = {
-                "date": today,
-                "activities": [],
-                "total_time": 0
-            }
-        
         # Parse duration (assume minutes if no unit specified)
         try:
             if duration.isdigit():
@@ -65,21 +34,7 @@ class InteractiveLearningTracker:
         except ValueError:
             duration_minutes = 0
         
-        # Create activity entry
-        activity = {
-            "type": activity_type,
-            "duration": duration_minutes,
-            "description": description,
-            "course": course,
-            "skill": skill,
-            "notes": notes,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        data[today]["activities"].append(activity)
-        data[today]["total_time"] += duration_minutes
-        
-        self._save_data(data)
+        self.tracker.log_activity(activity_type, duration_minutes, description, course, skill, notes)
         
         # Format response
         response = f"✅ Logged {activity_type}: {duration_minutes} minutes"
@@ -94,13 +49,11 @@ class InteractiveLearningTracker:
     
     def get_today_stats(self) -> str:
         """Get today's learning statistics."""
-        today = date.today().isoformat()
-        data = self._load_data()
+        today_data = self.store.get(date.today().isoformat())
         
-        if today not in data:
+        if not today_data:
             return "📚 **Today's Learning Stats**\n\nNo learning activities logged today.\n\n**Available Activity Types:**\n- reading: Reading books/articles\n- course: Online courses\n- practice: Hands-on practice\n- research: Research and exploration\n- tutorial: Following tutorials\n- project: Working on projects"
         
-        today_data = data[today]
         activities = today_data.get("activities", [])
         total_time = today_data.get("total_time", 0)
         
@@ -8,42 +8,32 @@ import json
 import os
 import sys
 import re
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 # Add the automation directory to the path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from record_store import open_store
+
 class QuickNote:
     def __init__(self):
         self.data_dir = Path(__file__).parent.parent / "outputs"
         self.notes_file = self.data_dir / "quick_notes.json"
-        self._ensure_data_file()
-    
-    def _ensure_data_file(self):
-        """Ensure data file exists with proper structure."""
-        if not self.notes_file.exists():
-            self.notes_file.parent.mkdir(exist_ok=True)
-            with open(self.notes_file, 'w') as f:
-                json.dump([], f)
+        self.store = open_store("notes", self.data_dir)
     
     def _load_data(self) -> List[Dict[str, Any]]:
-        """Load notes data from file."""
-        try:
-            with open(self.notes_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
+        """Load all notes from storage."""
+        return self.store.load()
     
     def _save_data(self, data: List[Dict[str, Any]]):
-        """Save notes data to file."""
-        with open(self.notes_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Replace all notes in storage."""
+        self.store.save(data)
     
-    def _generate_note_id(self, data: List[Dict[str, Any]]) -> str:
+    def _generate_note_id(self) -> str:
         """Generate a unique note ID."""
-        existing_ids = [note.get('id', '') for note in data]
+        existing_ids = set(self.store.keys())
         counter = 1
         while f"note_{counter:04d}" in existing_ids:
             counter += 1
@@ -112,9 +102,7 @@ class QuickNote:
     def capture_note(self, content: str, category: str = "", tags: List[str] = None, 
                     priority: str = "medium") -> Dict[str, Any]:
         """Capture a quick note."""
-        data = self._load_data()
-        
-        note_id = self._generate_note_id(data)
+        note_id = self._generate_note_id()
         
         # Auto-categorize if not provided
         if not category:
@@ -136,8 +124,7 @@ class QuickNote:
             'status': 'active'
         }
         
-        data.append(note)
-        self._save_data(data)
+        self.store.put(note)
         
         return {
             'success': True,
@@ -147,15 +134,13 @@ class QuickNote:
     
     def get_note(self, note_id: str) -> Dict[str, Any]:
         """Get a specific note."""
-        data = self._load_data()
-        
-        for note in data:
-            if note['id'] == note_id:
-                return {
-                    'success': True,
-                    'message': f"Note found: {note['content'][:50]}{'...' if len(note['content']) > 50 else ''}",
-                    'note': note
-                }
+        note = self.store.get(note_id)
+        if note:
+            return {
+                'success': True,
+                'message': f"Note found: {note['content'][:50]}{'...' if len(note['content']) > 50 else ''}",
+                'note': note
+            }
         
         return {
             'success': False,
@@ -165,27 +150,25 @@ class QuickNote:
     def update_note(self, note_id: str, content: str = "", category: str = "", 
                    tags: List[str] = None, priority: str = "") -> Dict[str, Any]:
         """Update a note."""
-        data = self._load_data()
-        
-        for note in data:
-            if note['id'] == note_id:
-                if content:
-                    note['content'] = content
-                if category:
-                    note['category'] = category
-                if tags:
-                    note['tags'] = tags
-                if priority:
-                    note['priority'] = priority.lower()
-                
-                note['updated_timestamp'] = datetime.now().isoformat()
-                self._save_data(data)
-                
-                return {
-                    'success': True,
-                    'message': f"Note updated: {note['content'][:50]}{'...' if len(note['content']) > 50 else ''}",
-                    'note': note
-                }
+        note = self.store.get(note_id)
+        if note:
+            if content:
+                note['content'] = content
+            if category:
+                note['category'] = category
+            if tags:
+                note['tags'] = tags
+            if priority:
+                note['priority'] = priority.lower()
+            
+            note['updated_timestamp'] = datetime.now().isoformat()
+            self.store.put(note)
+            
+            return {
+                'success': True,
+                'message': f"Note updated: {note['content'][:50]}{'...' if len(note['content']) > 50 else ''}",
+                'note': note
+            }
         
         return {
             'success': False,
@@ -194,18 +177,13 @@ class QuickNote:
     
     def delete_note(self, note_id: str) -> Dict[str, Any]:
         """Delete a note."""
-        data = self._load_data()
-        
-        for i, note in enumerate(data):
-            if note['id'] == note_id:
-                deleted_note = data.pop(i)
-                self._save_data(data)
-                
-                return {
-                    'success': True,
-                    'message': f"Note deleted: {deleted_note['content'][:50]}{'...' if len(deleted_note['content']) > 50 else ''}",
-                    'note': deleted_note
-                }
+        deleted_note = self.store.delete(note_id)
+        if deleted_note:
+            return {
+                'success': True,
+                'message': f"Note deleted: {deleted_note['content'][:50]}{'...' if len(deleted_note['content']) > 50 else ''}",
+                'note': deleted_note
+            }
         
         return {
             'success': False,
@@ -215,18 +193,12 @@ class QuickNote:
     def list_notes(self, category: str = "all", priority: str = "all", 
                   tags: List[str] = None, limit: int = 20) -> Dict[str, Any]:
         """List notes with optional filters."""
-        data = self._load_data()
+        # Status and category are indexed in storage
+        data = self.store.query(status='active', category=None if category == "all" else category)
         
         # Apply filters
         filtered_notes = []
         for note in data:
-            if note['status'] != 'active':
-                continue
-            
-            # Category filter
-            if category != "all" and note['category'] != category:
-                continue
-            
             # Priority filter
             if priority != "all" and note['priority'] != priority:
                 continue
@@ -274,32 +246,15 @@ class QuickNote:
             }
         }
     
-    def search_notes(self, query: str, category: str = "all") -> Dict[str, Any]:
-        """Search notes by content."""
-        data = self._load_data()
-        
-        query_lower = query.lower()
-        matching_notes = []
-        
-        for note in data:
-            if note['status'] != 'active':
-                continue
-            
-            # Category filter
-            if category != "all" and note['category'] != category:
-                continue
-            
-            # Search in content, tags, and category
-            if (query_lower in note['content'].lower() or
-                query_lower in ' '.join(note['tags']).lower() or
-                query_lower in note['category'].lower()):
-                matching_notes.append(note)
-        
-        # Sort by relevance (exact matches first, then partial matches)
-        matching_notes.sort(key=lambda x: (
-            query_lower in x['content'].lower(),
-            x['created_timestamp']
-        ), reverse=True)
+    def search_notes(self, query: str, category: str = "all", limit: int = 0) -> Dict[str, Any]:
+        """Search notes by content, tags and category, best matches first."""
+        # Full-text index: BM25 ranking, every word matches as a prefix
+        matching_notes = self.store.search(
+            query,
+            status='active',
+            category=None if category == "all" else category,
+            limit=limit or None
+        )
         
         return {
             'success': True,
@@ -311,11 +266,9 @@ class QuickNote:
     
     def get_today_notes(self) -> Dict[str, Any]:
         """Get today's notes."""
-        data = self._load_data()
         today = date.today().isoformat()
         
-        today_notes = [note for note in data 
-                      if note.get('created_date') == today and note['status'] == 'active']
+        today_notes = self.store.query(status='active', date_from=today, date_to=today)
         
         # Sort by creation time
         today_notes.sort(key=lambda x: x['created_timestamp'], reverse=True)
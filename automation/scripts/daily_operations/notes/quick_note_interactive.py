@@ -4,78 +4,34 @@ Interactive Quick Note for Telegram Bot
 Provides a simple interface for capturing quick notes
 """
 
-import json
-import os
 import sys
-from datetime import datetime, date
+from datetime import date
 from pathlib import Path
-from typing import Dict, List, Any, Optional
 
 # Add the automation directory to the path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from quick_note import QuickNote
+
 class InteractiveQuickNote:
     def __init__(self):
-        self.data_dir = Path(__file__).parent.parent / "outputs"
-        self.data_file = self.data_dir / "quick_notes.json"
-        self._ensure_data_file()
-    
-    def _ensure_data_file(self):
-        """Ensure data file exists with proper structure."""
-        if not self.data_file.exists():
-            self.data_file.parent.mkdir(exist_ok=True)
-            with open(self.data_file, 'w') as f:
-                json.dump({}, f)
-    
-    def _load_data(self) -> Dict[str, Any]:
-        """Load quick notes data from file."""
-        try:
-            with open(self.data_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {}
-    
-    def _save_data(self, data: Dict[str, Any]):
-        """Save quick notes data to file."""
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Same record store as quick notes, so both see every note
+        self.quick_note = QuickNote()
+        self.store = self.quick_note.store
     
     def capture_note(self, content: str, category: str = "general", tags: str = "", priority: str = "medium") -> str:
         """Capture a quick note."""
-        today = date.today().isoformat()
-        data = self._load_data()
-        
-        if today not in data:
-            data[today] = {
-                "date": today,
-                "notes": [],
-                "count": 0
-            }
-        
         # Parse tags
         tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()] if tags else []
         
-        # Create note entry
-        note = {
-            "id": data[today]["count"] + 1,
-            "content": content,
-            "category": category,
-            "tags": tag_list,
-            "priority": priority,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        data[today]["notes"].append(note)
-        data[today]["count"] += 1
-        
-        self._save_data(data)
+        note = self.quick_note.capture_note(content, category, tag_list, priority)['note']
         
         # Format response
         response = f"📝 **Note Captured**\n\n"
         response += f"💭 **Content**: {content}\n"
         response += f"🏷️ **Category**: {category.title()}\n"
-        if tag_list:
-            response += f"🔖 **Tags**: {', '.join(tag_list)}\n"
+        if note['tags']:
+            response += f"🔖 **Tags**: {', '.join(note['tags'])}\n"
         response += f"⚡ **Priority**: {priority.title()}\n"
         response += f"🆔 **ID**: {note['id']}"
         
@@ -84,20 +40,16 @@ class InteractiveQuickNote:
     def get_today_notes(self) -> str:
         """Get today's quick notes."""
         today = date.today().isoformat()
-        data = self._load_data()
-        
-        if today not in data:
-            return "📝 **Today's Quick Notes**\n\nNo notes captured today.\n\n**Available Categories:**\n- general: General notes\n- idea: Ideas and thoughts\n- reminder: Reminders\n- task: Task-related notes\n- learning: Learning notes\n- personal: Personal notes"
         
-        today_data = data[today]
-        notes = today_data.get("notes", [])
+        # Creation date is indexed in storage
+        notes = self.store.query(status='active', date_from=today, date_to=today)
         
         if not notes:
-            return "📝 **Today's Quick Notes**\n\nNo notes captured today."
+            return "📝 **Today's Quick Notes**\n\nNo notes captured today.\n\n**Available Categories:**\n- general: General notes\n- idea: Ideas and thoughts\n- reminder: Reminders\n- task: Task-related notes\n- learning: Learning notes\n- personal: Personal notes"
         
         # Sort by priority and timestamp
         priority_order = {"urgent": 4, "high": 3, "medium": 2, "low": 1}
-        notes.sort(key=lambda x: (priority_order.get(x.get("priority", "medium"), 2), x.get("timestamp", "")), reverse=True)
+        notes.sort(key=lambda x: (priority_order.get(x.get("priority", "medium"), 2), x.get("created_timestamp", "")), reverse=True)
         
         response = f"📝 **Today's Quick Notes** ({len(notes)} notes)\n\n"
         
@@ -118,22 +70,18 @@ class InteractiveQuickNote:
     
     def get_note_stats(self) -> str:
         """Get quick note statistics."""
-        data = self._load_data()
+        notes = self.store.load()
         
-        total_notes = 0
+        total_notes = len(notes)
         category_counts = {}
         priority_counts = {"urgent": 0, "high": 0, "medium": 0, "low": 0}
         
-        for date_str, day_data in data.items():
-            notes = day_data.get("notes", [])
-            total_notes += len(notes)
+        for note in notes:
+            category = note.get("category", "general")
+            category_counts[category] = category_counts.get(category, 0) + 1
             
-            for note in notes:
-                category = note.get("category", "general")
-                category_counts[category] = category_counts.get(category, 0) + 1
-                
-                priority = note.get("priority", "medium")
-                priority_counts[priority] += 1
+            priority = note.get("priority", "medium")
+            priority_counts[priority] += 1
         
         if total_notes == 0:
             return "📊 **Quick Note Statistics**\n\nNo notes captured yet."
@@ -0,0 +1,619 @@
+#!/usr/bin/env python3
+"""
+Record Store - Shared record storage for the daily operations trackers
+Part of the Personal System automation suite.
+
+Each tracker keeps one collection of JSON records (notes, tasks, health days,
+learning days, morning routines). The SQLite backend keeps one row per record
+in outputs/daily_operations.db, so capturing a note or logging a metric writes
+a single row instead of rewriting the whole file. Set DAILY_OPS_STORAGE=json to
+keep the original one-JSON-file-per-collection layout.
+"""
+
+import json
+import math
+import os
+import re
+import sqlite3
+import sys
+import threading
+import unicodedata
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from rollups import ROLLUP_EXTRACTORS
+
+DEFAULT_DATA_DIR = Path(__file__).parent / "outputs"
+DB_FILENAME = "daily_operations.db"
+
+# collection -> legacy JSON file, record key field, field stored in the date column
+COLLECTIONS = {
+    "notes": {"file": "quick_notes.json", "key": "id", "date": "created_date"},
+    "tasks": {"file": "tasks.json", "key": "id", "date": "created_date"},
+    "health": {"file": "health_data.json", "key": "date", "date": "date"},
+    "learning": {"file": "learning_data.json", "key": "date", "date": "date"},
+    "routines": {"file": "morning_routines.json", "key": "timestamp", "date": "date"},
+}
+
+# Collections with a full-text index: field -> BM25 weight
+SEARCH_FIELDS = {
+    "notes": {"content": 5.0, "tags": 2.0, "category": 1.0},
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    collection TEXT NOT NULL,
+    key TEXT NOT NULL,
+    date TEXT,
+    status TEXT,
+    category TEXT,
+    data TEXT NOT NULL,
+    UNIQUE (collection, key)
+);
+CREATE INDEX IF NOT EXISTS idx_records_date ON records (collection, date);
+CREATE INDEX IF NOT EXISTS idx_records_status ON records (collection, status);
+CREATE INDEX IF NOT EXISTS idx_records_category ON records (collection, category);
+CREATE TABLE IF NOT EXISTS migrations (
+    collection TEXT PRIMARY KEY,
+    source TEXT,
+    records INTEGER NOT NULL,
+    migrated_at TEXT NOT NULL
+);
+"""
+
+# Per-day aggregates for the collections in ROLLUP_EXTRACTORS, rewritten with each day's record
+ROLLUP_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rollups (
+    collection TEXT NOT NULL,
+    day TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    sum REAL NOT NULL,
+    count INTEGER NOT NULL,
+    min REAL NOT NULL,
+    max REAL NOT NULL,
+    last REAL NOT NULL,
+    PRIMARY KEY (collection, day, metric)
+) WITHOUT ROWID;
+"""
+
+
+def _fts_schema(collection: str) -> str:
+    """FTS5 table for a collection, kept in sync with its records by triggers."""
+    fields = list(SEARCH_FIELDS[collection])
+    # Fold ё into е on both sides so either spelling matches; unicode61 already folds case
+    values = ", ".join(
+        f"replace(replace(coalesce(json_extract({{row}}.data, '$.{field}'), ''), 'ё', 'е'), 'Ё', 'Е')"
+        for field in fields
+    )
+    insert = (
+        f"INSERT INTO {collection}_fts (rowid, {', '.join(fields)}) "
+        f"VALUES (new.seq, {values.format(row='new')});"
+    )
+    delete = f"DELETE FROM {collection}_fts WHERE rowid = old.seq;"
+    return f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {collection}_fts USING fts5(
+    {', '.join(fields)}, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+);
+CREATE TRIGGER IF NOT EXISTS {collection}_fts_insert AFTER INSERT ON records
+WHEN new.collection = '{collection}' BEGIN {insert} END;
+CREATE TRIGGER IF NOT EXISTS {collection}_fts_update AFTER UPDATE ON records
+WHEN new.collection = '{collection}' BEGIN {delete} {insert} END;
+CREATE TRIGGER IF NOT EXISTS {collection}_fts_delete AFTER DELETE ON records
+WHEN old.collection = '{collection}' BEGIN {delete} END;
+"""
+
+
+def search_terms(text: str) -> List[str]:
+    """Word tokens folded the way the FTS index folds them: case, ё to е, Latin diacritics."""
+    text = unicodedata.normalize('NFD', text.lower().replace('ё', 'е'))
+    # Drop accents on Latin letters only, so й stays distinct from и
+    kept, base = [], ''
+    for char in text:
+        if unicodedata.combining(char):
+            if base < '\u0250':
+                continue
+        else:
+            base = char
+        kept.append(char)
+    return re.findall(r'\w+', unicodedata.normalize('NFC', ''.join(kept)))
+
+
+def _field_text(value: Any) -> str:
+    return ' '.join(map(str, value)) if isinstance(value, list) else str(value or '')
+
+
+def _bm25_rank(terms: List[str], documents: List[tuple], weights: Dict[str, float],
+               k1: float = 1.2, b: float = 0.75) -> List[Dict[str, Any]]:
+    """Records containing every term as a token prefix, best BM25 score first.
+    
+    ``documents`` holds (record, {field: tokens}) pairs.
+    """
+    matches = []
+    for record, fields in documents:
+        counts = {
+            field: [sum(1 for token in tokens if token.startswith(term)) for term in terms]
+            for field, tokens in fields.items()
+        }
+        if all(any(counts[field][i] for field in counts) for i in range(len(terms))):
+            matches.append((record, fields, counts))
+    if not matches:
+        return []
+    
+    total = len(documents)
+    idf = [
+        math.log(1 + (total - df + 0.5) / (df + 0.5))
+        for df in (sum(1 for _, _, counts in matches if any(counts[f][i] for f in counts))
+                   for i in range(len(terms)))
+    ]
+    average_length = {
+        field: (sum(len(doc[1][field]) for doc in documents) / total) or 1.0 for field in weights
+    }
+    
+    scored = []
+    for record, fields, counts in matches:
+        score = 0.0
+        for field, weight in weights.items():
+            norm = k1 * (1 - b + b * len(fields[field]) / average_length[field])
+            score += weight * sum(
+                idf[i] * tf * (k1 + 1) / (tf + norm) for i, tf in enumerate(counts[field]) if tf
+            )
+        scored.append((score, record))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [record for _, record in scored]
+
+
+def _read_records(path: Path, collection: Optional[str] = None) -> List[Dict[str, Any]]:
+    """The record list in a JSON file; missing or unreadable files hold none."""
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, FileNotFoundError):
+        return []
+    if isinstance(data, dict) and collection:
+        return _interactive_records(collection, data)
+    return data if isinstance(data, list) else []
+
+
+def _interactive_records(collection: str, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Records from the dict layouts the *_interactive.py scripts used to write."""
+    if collection == "tasks":
+        # {"tasks": [...], "next_id": n} with integer ids
+        tasks = [task for task in data.get('tasks', []) if isinstance(task, dict)]
+        return [
+            {'description': '', 'priority': 'medium', 'status': 'pending', 'due_date': '', 'category': '',
+             'tags': [], 'notes': [], **task,
+             'id': f"task_{task['id']:04d}" if isinstance(task.get('id'), int) else task.get('id'),
+             'created_date': str(task.get('created') or '')[:10] or None,
+             'created_timestamp': task.get('created'),
+             'completed_date': str(task.get('completed') or '')[:10] or None,
+             'completed_timestamp': task.get('completed')}
+            for task in tasks
+        ]
+    
+    # {date: day entry}; day entries may lack the fields the trackers append to
+    days = [
+        {'notes': [], **day, 'date': day.get('date', day_key)}
+        for day_key, day in sorted(data.items()) if isinstance(day, dict)
+    ]
+    if collection == "notes":
+        # Notes were numbered per day, so renumber them across days
+        notes = [(day['date'], note) for day in days for note in day.get('notes', []) if isinstance(note, dict)]
+        return [
+            {'tags': [], 'priority': 'medium', **note,
+             'id': f"note_{index:04d}", 'created_date': day, 'created_timestamp': note.get('timestamp'),
+             'status': note.get('status', 'active')}
+            for index, (day, note) in enumerate(notes, 1)
+        ]
+    if collection == "learning":
+        return [{'activities': [], 'total_time': 0, **day} for day in days]
+    if collection == "health":
+        return [{'metrics': {}, **day} for day in days]
+    return days
+
+
+class JsonStore:
+    """A collection kept as one JSON array, rewritten on every change."""
+    
+    def __init__(self, collection: str, data_dir: Path):
+        self.collection = collection
+        self.key_field = COLLECTIONS[collection]["key"]
+        self.date_field = COLLECTIONS[collection]["date"]
+        self.path = Path(data_dir) / COLLECTIONS[collection]["file"]
+        if not self.path.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.save([])
+    
+    def load(self) -> List[Dict[str, Any]]:
+        return _read_records(self.path, self.collection)
+    
+    def save(self, records: List[Dict[str, Any]]):
+        with open(self.path, 'w') as f:
+            json.dump(records, f, indent=2)
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        for record in self.load():
+            if record.get(self.key_field) == key:
+                return record
+        return None
+    
+    def keys(self) -> List[str]:
+        return [record.get(self.key_field) for record in self.load()]
+    
+    def put(self, record: Dict[str, Any]):
+        """Insert the record, or replace the one with the same key in place."""
+        records = self.load()
+        key = record.get(self.key_field)
+        for index, existing in enumerate(records):
+            if existing.get(self.key_field) == key:
+                records[index] = record
+                break
+        else:
+            records.append(record)
+        self.save(records)
+    
+    def delete(self, key: str) -> Optional[Dict[str, Any]]:
+        records = self.load()
+        for index, record in enumerate(records):
+            if record.get(self.key_field) == key:
+                deleted = records.pop(index)
+                self.save(records)
+                return deleted
+        return None
+    
+    def query(self, status: Optional[str] = None, category: Optional[str] = None,
+              date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Records matching every given filter, in insertion order. Dates are inclusive ISO dates."""
+        results = []
+        for record in self.load():
+            record_date = record.get(self.date_field) or ''
+            if status is not None and record.get('status') != status:
+                continue
+            if category is not None and record.get('category') != category:
+                continue
+            if date_from is not None and record_date < date_from:
+                continue
+            if date_to is not None and record_date > date_to:
+                continue
+            results.append(record)
+        return results
+    
+    def search(self, query: str, status: Optional[str] = None, category: Optional[str] = None,
+               limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Full-text search ranked by BM25; every query word matches as a prefix."""
+        terms = search_terms(query)
+        if not terms:
+            return []
+        weights = SEARCH_FIELDS[self.collection]
+        documents = [
+            (record, {field: search_terms(_field_text(record.get(field))) for field in weights})
+            for record in self.query(status=status, category=category)
+        ]
+        return _bm25_rank(terms, documents, weights)[:limit]
+    
+    def rollups(self, date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[tuple]:
+        """(day, metric, sum, count, min, max, last) rows, computed from the records."""
+        extract = ROLLUP_EXTRACTORS[self.collection]
+        return [
+            (record.get(self.date_field),) + row
+            for record in self.query(date_from=date_from, date_to=date_to)
+            for row in extract(record)
+        ]
+    
+    def signature(self) -> tuple:
+        """Changes whenever the collection is written."""
+        try:
+            stat = os.stat(self.path)
+            return (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return (None, None)
+
+
+class SqliteStore:
+    """A collection kept as one row per record in a shared WAL-mode SQLite database."""
+    
+    # One connection per database file, shared by every collection and thread
+    _connections: Dict[Path, sqlite3.Connection] = {}
+    _locks: Dict[Path, threading.Lock] = {}
+    _registry_lock = threading.Lock()
+    
+    def __init__(self, collection: str, data_dir: Path):
+        self.collection = collection
+        self.key_field = COLLECTIONS[collection]["key"]
+        self.date_field = COLLECTIONS[collection]["date"]
+        self.data_dir = Path(data_dir)
+        self.db_path = self.data_dir / DB_FILENAME
+        self._conn, self._lock = self._connect(self.db_path)
+        # First use of a collection picks up whatever its JSON file already holds
+        migrate_collection(self, self.data_dir / COLLECTIONS[collection]["file"])
+    
+    @classmethod
+    def _connect(cls, db_path: Path):
+        with cls._registry_lock:
+            conn = cls._connections.get(db_path)
+            if conn is None:
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=10)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                # INSERT OR REPLACE must fire the delete triggers that keep the FTS tables in sync
+                conn.execute("PRAGMA recursive_triggers=ON")
+                conn.executescript(SCHEMA)
+                cls._create_search_indexes(conn)
+                cls._create_rollups(conn)
+                cls._connections[db_path] = conn
+                cls._locks[db_path] = threading.Lock()
+            return conn, cls._locks[db_path]
+    
+    @staticmethod
+    def _create_search_indexes(conn: sqlite3.Connection):
+        for collection in SEARCH_FIELDS:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = ?", (f"{collection}_fts",)
+            ).fetchone()
+            conn.executescript(_fts_schema(collection))
+            if not exists:
+                # Index records written before the search index existed via the update trigger
+                conn.execute("UPDATE records SET data = data WHERE collection = ?", (collection,))
+                conn.commit()
+    
+    @classmethod
+    def _create_rollups(cls, conn: sqlite3.Connection):
+        exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'rollups'").fetchone()
+        conn.executescript(ROLLUP_SCHEMA)
+        if not exists:
+            # Roll up the days written before the rollup table existed
+            with conn:
+                for collection in ROLLUP_EXTRACTORS:
+                    records = [
+                        json.loads(row[0]) for row in conn.execute(
+                            "SELECT data FROM records WHERE collection = ?", (collection,)
+                        )
+                    ]
+                    cls._write_rollups(conn, collection, COLLECTIONS[collection]["date"], records)
+    
+    @staticmethod
+    def _write_rollups(conn: sqlite3.Connection, collection: str, date_field: str,
+                       records: List[Dict[str, Any]]):
+        """Replace the rollup rows of each record's day. Call inside the record's transaction."""
+        extract = ROLLUP_EXTRACTORS.get(collection)
+        if extract is None:
+            return
+        for record in records:
+            day = record.get(date_field)
+            if not day:
+                continue
+            conn.execute("DELETE FROM rollups WHERE collection = ? AND day = ?", (collection, day))
+            conn.executemany(
+                "INSERT INTO rollups (collection, day, metric, sum, count, min, max, last)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(collection, day) + row for row in extract(record)]
+            )
+    
+    def _row(self, record: Dict[str, Any], key: Optional[str] = None) -> tuple:
+        return (
+            self.collection,
+            str(key if key is not None else record.get(self.key_field)),
+            record.get(self.date_field),
+            record.get('status'),
+            record.get('category'),
+            json.dumps(record, ensure_ascii=False),
+        )
+    
+    def _select(self, where: str = "", params: tuple = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM records WHERE collection = ?{where} ORDER BY seq",
+                (self.collection,) + params
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+    
+    def load(self) -> List[Dict[str, Any]]:
+        return self._select()
+    
+    def save(self, records: List[Dict[str, Any]]):
+        """Replace the whole collection; prefer put/delete for single changes."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM records WHERE collection = ?", (self.collection,))
+            self._conn.execute("DELETE FROM rollups WHERE collection = ?", (self.collection,))
+            self._insert_many(records)
+    
+    def _insert_many(self, records: List[Dict[str, Any]]):
+        # Records without a key (hand-edited files) still get a stable one
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO records (collection, key, date, status, category, data)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                self._row(record, None if record.get(self.key_field) is not None else f"_{index:06d}")
+                for index, record in enumerate(records)
+            ]
+        )
+        self._write_rollups(self._conn, self.collection, self.date_field, records)
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        records = self._select(" AND key = ?", (str(key),))
+        return records[0] if records else None
+    
+    def keys(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key FROM records WHERE collection = ? ORDER BY seq", (self.collection,)
+            ).fetchall()
+        return [row[0] for row in rows]
+    
+    def put(self, record: Dict[str, Any]):
+        """Insert the record, or update the one with the same key without moving it."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO records (collection, key, date, status, category, data)"
+                " VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (collection, key) DO UPDATE SET"
+                " date = excluded.date, status = excluded.status,"
+                " category = excluded.category, data = excluded.data",
+                self._row(record)
+            )
+            self._write_rollups(self._conn, self.collection, self.date_field, [record])
+    
+    def delete(self, key: str) -> Optional[Dict[str, Any]]:
+        record = self.get(key)
+        if record is not None:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "DELETE FROM records WHERE collection = ? AND key = ?", (self.collection, str(key))
+                )
+                if record.get(self.date_field):
+                    self._conn.execute(
+                        "DELETE FROM rollups WHERE collection = ? AND day = ?",
+                        (self.collection, record[self.date_field])
+                    )
+        return record
+    
+    def query(self, status: Optional[str] = None, category: Optional[str] = None,
+              date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Records matching every given filter, in insertion order. Dates are inclusive ISO dates."""
+        where, params = "", []
+        for clause, value in ((" AND status = ?", status), (" AND category = ?", category),
+                              (" AND date >= ?", date_from), (" AND date <= ?", date_to)):
+            if value is not None:
+                where += clause
+                params.append(value)
+        return self._select(where, tuple(params))
+    
+    def search(self, query: str, status: Optional[str] = None, category: Optional[str] = None,
+               limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Full-text search ranked by BM25; every query word matches as a prefix."""
+        terms = search_terms(query)
+        if not terms:
+            return []
+        
+        weights = SEARCH_FIELDS[self.collection]
+        fts = f"{self.collection}_fts"
+        sql = (
+            f"SELECT records.data FROM {fts} JOIN records ON records.seq = {fts}.rowid"
+            f" WHERE {fts} MATCH ? AND records.collection = ?"
+        )
+        params: List[Any] = [' '.join(f'"{term}"*' for term in terms), self.collection]
+        for clause, value in ((" AND records.status = ?", status), (" AND records.category = ?", category)):
+            if value is not None:
+                sql += clause
+                params.append(value)
+        sql += f" ORDER BY bm25({fts}, {', '.join(str(weight) for weight in weights.values())})"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+    
+    def rollups(self, date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[tuple]:
+        """(day, metric, sum, count, min, max, last) rows for the days in range."""
+        sql = "SELECT day, metric, sum, count, min, max, last FROM rollups WHERE collection = ?"
+        params: List[Any] = [self.collection]
+        for clause, value in ((" AND day >= ?", date_from), (" AND day <= ?", date_to)):
+            if value is not None:
+                sql += clause
+                params.append(value)
+        with self._lock:
+            return self._conn.execute(sql + " ORDER BY day", params).fetchall()
+    
+    def signature(self) -> tuple:
+        """Changes whenever the database is written (the WAL file takes the commits)."""
+        signature = []
+        for path in (self.db_path, Path(f"{self.db_path}-wal")):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append((None, None))
+        return tuple(signature)
+
+
+def open_store(collection: str, data_dir: Optional[Path] = None, backend: Optional[str] = None):
+    """Open a collection with the configured backend (DAILY_OPS_STORAGE, default sqlite)."""
+    if collection not in COLLECTIONS:
+        raise ValueError(f"Unknown collection: {collection}")
+    
+    data_dir = Path(data_dir) if data_dir else DEFAULT_DATA_DIR
+    backend = (backend or os.environ.get("DAILY_OPS_STORAGE", "sqlite")).lower()
+    if backend == "json":
+        return JsonStore(collection, data_dir)
+    return SqliteStore(collection, data_dir)
+
+
+def migrate_collection(store: SqliteStore, source: Path, force: bool = False) -> Optional[int]:
+    """Import a legacy JSON file into the store once. Returns the record count, or None if skipped."""
+    with store._lock:
+        done = store._conn.execute(
+            "SELECT 1 FROM migrations WHERE collection = ?", (store.collection,)
+        ).fetchone()
+    if done and not force:
+        return None
+    
+    records = _read_records(source, store.collection)
+    with store._lock, store._conn:
+        if force:
+            store._conn.execute("DELETE FROM records WHERE collection = ?", (store.collection,))
+        store._insert_many(records)
+        store._conn.execute(
+            "INSERT OR REPLACE INTO migrations (collection, source, records, migrated_at) VALUES (?, ?, ?, ?)",
+            (store.collection, str(source), len(records), datetime.now().isoformat())
+        )
+    return len(records)
+
+
+def migrate_all(data_dir: Optional[Path] = None, source_dir: Optional[Path] = None,
+                force: bool = False) -> Dict[str, Optional[int]]:
+    """One-shot import of every collection's JSON file into the SQLite database."""
+    data_dir = Path(data_dir) if data_dir else DEFAULT_DATA_DIR
+    source_dir = Path(source_dir) if source_dir else data_dir
+    results = {}
+    for collection, spec in COLLECTIONS.items():
+        store = SqliteStore(collection, data_dir)
+        results[collection] = migrate_collection(store, source_dir / spec["file"], force=force)
+    return results
+
+
+def export_all(data_dir: Optional[Path] = None, dest_dir: Optional[Path] = None) -> Dict[str, int]:
+    """Write every SQLite collection back out as its legacy JSON file."""
+    data_dir = Path(data_dir) if data_dir else DEFAULT_DATA_DIR
+    dest_dir = Path(dest_dir) if dest_dir else data_dir
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    results = {}
+    for collection, spec in COLLECTIONS.items():
+        records = SqliteStore(collection, data_dir).load()
+        with open(dest_dir / spec["file"], 'w') as f:
+            json.dump(records, f, indent=2)
+        results[collection] = len(records)
+    return results
+
+
+def main():
+    """Main entry point."""
+    if len(sys.argv) < 2:
+        print("Usage: python record_store.py <action> [args...]")
+        print("Actions:")
+        print("  migrate [source_dir] [--force] - Import the JSON files into SQLite (once per collection)")
+        print("  export [dest_dir] - Write the SQLite collections back out as JSON files")
+        return
+    
+    action = sys.argv[1]
+    args = [arg for arg in sys.argv[2:] if not arg.startswith('--')]
+    
+    if action == "migrate":
+        results = migrate_all(source_dir=Path(args[0]) if args else None, force="--force" in sys.argv)
+        print(json.dumps({
+            collection: count if count is not None else "already migrated"
+            for collection, count in results.items()
+        }, indent=2))
+    
+    elif action == "export":
+        results = export_all(dest_dir=Path(args[0]) if args else None)
+        print(json.dumps(results, indent=2))
+    
+    else:
+        print(f"Unknown action: {action}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Rollups - Per-day aggregates for the health and learning trackers
+Part of the Personal System automation suite.
+
+The record store keeps one rollup row per (day, metric) with sum, count, min,
+max and last value, rewritten whenever that day's record is written. Range
+statistics are then computed from these rows instead of re-reading every
+entry; NumPy is used for the aggregation when it is installed.
+"""
+
+from datetime import date, timedelta
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Present once for every rolled-up day, so days with only non-numeric data still count
+ENTRY_METRIC = "entry"
+
+# (metric, sum, count, min, max, last)
+RollupRow = Tuple[str, float, int, float, float, float]
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _aggregate(metric: str, values: List[float]) -> RollupRow:
+    return (metric, sum(values), len(values), min(values), max(values), values[-1])
+
+
+def health_rows(record: Dict[str, Any]) -> List[RollupRow]:
+    """One row per numeric metric logged that day."""
+    rows = [(ENTRY_METRIC, 1.0, 1, 1.0, 1.0, 1.0)]
+    for metric, data in (record.get('metrics') or {}).items():
+        value = _number(data.get('value') if isinstance(data, dict) else data)
+        if value is not None:
+            rows.append(_aggregate(metric, [value]))
+    return rows
+
+
+def learning_rows(record: Dict[str, Any]) -> List[RollupRow]:
+    """Minutes per day in total, per activity type ('type:...') and per course ('course:...')."""
+    groups: Dict[str, List[float]] = {}
+    for activity in record.get('activities') or []:
+        duration = _number(activity.get('duration'))
+        if duration is None:
+            continue
+        for metric in ("total", f"type:{activity.get('type')}",
+                       f"course:{activity.get('course', 'General Learning')}"):
+            groups.setdefault(metric, []).append(duration)
+    return [(ENTRY_METRIC, 1.0, 1, 1.0, 1.0, 1.0)] + [
+        _aggregate(metric, values) for metric, values in groups.items()
+    ]
+
+
+# collection -> function turning one day's record into its rollup rows
+ROLLUP_EXTRACTORS = {
+    "health": health_rows,
+    "learning": learning_rows,
+}
+
+
+def summarize(rows: List[tuple], start: Optional[str] = None,
+              end: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Aggregate (day, metric, sum, count, min, max, last) rows over an inclusive date range.
+    
+    Returns metric -> sum, count, min, max, last, days (days with data) and last_day.
+    """
+    rows = [row for row in rows if (start is None or row[0] >= start) and (end is None or row[0] <= end)]
+    if not rows:
+        return {}
+    if NUMPY_AVAILABLE:
+        return _summarize_numpy(rows)
+    
+    stats: Dict[str, Dict[str, Any]] = {}
+    for day, metric, total, count, low, high, last in sorted(rows):
+        entry = stats.get(metric)
+        if entry is None:
+            stats[metric] = {'sum': total, 'count': count, 'min': low, 'max': high,
+                             'last': last, 'days': 1, 'last_day': day}
+        else:
+            entry['sum'] += total
+            entry['count'] += count
+            entry['min'] = min(entry['min'], low)
+            entry['max'] = max(entry['max'], high)
+            entry['last'] = last
+            entry['days'] += 1
+            entry['last_day'] = day
+    return stats
+
+
+def _summarize_numpy(rows: List[tuple]) -> Dict[str, Dict[str, Any]]:
+    """Same result as the pure-Python path, over a dense metric x day array."""
+    days = sorted({row[0] for row in rows})
+    metrics = sorted({row[1] for row in rows})
+    first = date.fromisoformat(days[0])
+    width = (date.fromisoformat(days[-1]) - first).days + 1
+    day_index = {day: (date.fromisoformat(day) - first).days for day in days}
+    metric_index = {metric: i for i, metric in enumerate(metrics)}
+    
+    shape = (len(metrics), width)
+    sums = np.zeros(shape)
+    counts = np.zeros(shape, dtype=np.int64)
+    lows = np.full(shape, np.inf)
+    highs = np.full(shape, -np.inf)
+    lasts = np.full(shape, np.nan)
+    for day, metric, total, count, low, high, last in rows:
+        position = (metric_index[metric], day_index[day])
+        sums[position] = total
+        counts[position] = count
+        lows[position] = low
+        highs[position] = high
+        lasts[position] = last
+    
+    present = counts > 0
+    # Index of the last day with data for each metric
+    last_columns = width - 1 - np.argmax(present[:, ::-1], axis=1)
+    totals, sample_counts = sums.sum(axis=1), counts.sum(axis=1)
+    minimums, maximums, day_counts = lows.min(axis=1), highs.max(axis=1), present.sum(axis=1)
+    
+    stats = {}
+    for i, metric in enumerate(metrics):
+        column = int(last_columns[i])
+        stats[metric] = {
+            'sum': float(totals[i]),
+            'count': int(sample_counts[i]),
+            'min': float(minimums[i]),
+            'max': float(maximums[i]),
+            'last': float(lasts[i, column]),
+            'days': int(day_counts[i]),
+            'last_day': (first + timedelta(days=column)).isoformat(),
+        }
+    return stats
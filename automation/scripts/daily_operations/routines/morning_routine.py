@@ -15,6 +15,8 @@ from typing import Dict, List, Any, Optional
 # Add the automation directory to the path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from record_store import open_store
+
 class MorningRoutine:
     def __init__(self):
         self.data_dir = Path(__file__).parent.parent / "outputs"
@@ -22,17 +24,12 @@ class MorningRoutine:
         self.health_file = self.data_dir / "health_data.json"
         self.tasks_file = self.data_dir / "tasks.json"
         self.shadow_work_file = self.data_dir / "shadow_work_data.json"
-        self._ensure_data_files()
-    
-    def _ensure_data_files(self):
-        """Ensure data files exist with proper structure."""
-        if not self.routine_file.exists():
-            self.routine_file.parent.mkdir(exist_ok=True)
-            with open(self.routine_file, 'w') as f:
-                json.dump([], f)
+        self.routine_store = open_store("routines", self.data_dir)
+        self.health_store = open_store("health", self.data_dir)
+        self.task_store = open_store("tasks", self.data_dir)
     
     def _load_data(self, file_path: Path) -> List[Dict[str, Any]]:
-        """Load data from file."""
+        """Load data from a JSON file outside the shared storage."""
         try:
             with open(file_path, 'r') as f:
                 return json.load(f)
@@ -46,24 +43,15 @@ class MorningRoutine:
     
     def _get_today_health_data(self) -> Dict[str, Any]:
         """Get today's health data."""
-        health_data = self._load_data(self.health_file)
-        today = date.today().isoformat()
-        
-        for entry in health_data:
-            if entry.get('date') == today:
-                return entry.get('metrics', {})
-        return {}
+        entry = self.health_store.get(date.today().isoformat())
+        return entry.get('metrics', {}) if entry else {}
     
     def _get_today_tasks(self) -> List[Dict[str, Any]]:
         """Get today's tasks."""
-        tasks_data = self._load_data(self.tasks_file)
         today = date.today().isoformat()
         
-        today_tasks = []
-        for task in tasks_data:
-            if (task['status'] == 'pending' and 
-                task.get('due_date') == today):
-                today_tasks.append(task)
+        today_tasks = [task for task in self.task_store.query(status='pending')
+                       if task.get('due_date') == today]
         
         # Sort by priority
         priority_order = {'high': 3, 'medium': 2, 'low': 1}
@@ -324,18 +312,14 @@ class MorningRoutine:
         }
     
     def _save_routine(self, routine: Dict[str, Any]):
-        """Save routine to file."""
-        routines = self._load_data(self.routine_file)
-        routines.append(routine)
-        self._save_data(routines, self.routine_file)
+        """Save routine to storage."""
+        self.routine_store.put(routine)
     
     def get_recent_routines(self, days: int = 7) -> Dict[str, Any]:
         """Get recent morning routines."""
-        routines = self._load_data(self.routine_file)
-        
         # Get routines from last N days
         cutoff_date = (date.today() - timedelta(days=days)).isoformat()
-        recent_routines = [r for r in routines if r.get('date', '') >= cutoff_date]
+        recent_routines = self.routine_store.query(date_from=cutoff_date)
         
         return {
             'success': True,
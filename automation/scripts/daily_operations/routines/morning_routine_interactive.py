@@ -15,21 +15,13 @@ from typing import Dict, List, Any, Optional
 # Add the automation directory to the path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from record_store import open_store
+
 class InteractiveMorningRoutine:
     def __init__(self):
         self.data_dir = Path(__file__).parent.parent / "outputs"
-        self.routine_file = self.data_dir / "morning_routines.json"
-        self.health_file = self.data_dir / "health_data.json"
-        self.tasks_file = self.data_dir / "tasks.json"
         self.shadow_work_file = self.data_dir / "shadow_work_data.json"
-        self._ensure_data_files()
-    
-    def _ensure_data_files(self):
-        """Ensure data files exist with proper structure."""
-        if not self.routine_file.exists():
-            self.routine_file.parent.mkdir(exist_ok=True)
-            with open(self.routine_file, 'w') as f:
-                json.dump([], f)
+        self.health_store = open_store("health", self.data_dir)
     
     def _load_data(self, file_path: Path) -> List[Dict[str, Any]]:
         """Load data from file."""
@@ -41,14 +33,8 @@ class InteractiveMorningRoutine:
     
     def _get_today_health_data(self) -> Dict[str, Any]:
         """Get today's health data."""
-        health_data = self._load_data(self.health_file)
-        today = date.today().isoformat()
-        
-        # Look for today's health data
-        for entry in health_data:
-            if isinstance(entry, dict) and entry.get('date') == today:
-                return entry.get('metrics', {})
-        return {}
+        entry = self.health_store.get(date.today().isoformat())
+        return entry.get('metrics', {}) if entry else {}
     
     def _get_recent_shadow_work(self) -> Optional[str]:
         """Get recent shadow work prompt."""
@@ -14,35 +14,25 @@ from typing import Dict, List, Any, Optional
 # Add the automation directory to the path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from record_store import open_store
+
 class TaskManager:
     def __init__(self):
         self.data_dir = Path(__file__).parent.parent / "outputs"
         self.data_file = self.data_dir / "tasks.json"
-        self._ensure_data_file()
-    
-    def _ensure_data_file(self):
-        """Ensure data file exists with proper structure."""
-        if not self.data_file.exists():
-            self.data_file.parent.mkdir(exist_ok=True)
-            with open(self.data_file, 'w') as f:
-                json.dump([], f)
+        self.store = open_store("tasks", self.data_dir)
     
     def _load_data(self) -> List[Dict[str, Any]]:
-        """Load tasks data from file."""
-        try:
-            with open(self.data_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
+        """Load all tasks from storage."""
+        return self.store.load()
     
     def _save_data(self, data: List[Dict[str, Any]]):
-        """Save tasks data to file."""
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Replace all tasks in storage."""
+        self.store.save(data)
     
-    def _generate_task_id(self, data: List[Dict[str, Any]]) -> str:
+    def _generate_task_id(self) -> str:
         """Generate a unique task ID."""
-        existing_ids = [task.get('id', '') for task in data]
+        existing_ids = set(self.store.keys())
         counter = 1
         while f"task_{counter:04d}" in existing_ids:
             counter += 1
@@ -51,9 +41,7 @@ class TaskManager:
     def add_task(self, title: str, description: str = "", priority: str = "medium", 
                 due_date: str = "", category: str = "", tags: List[str] = None) -> Dict[str, Any]:
         """Add a new task."""
-        data = self._load_data()
-        
-        task_id = self._generate_task_id(data)
+        task_id = self._generate_task_id()
         
         task = {
             'id': task_id,
@@ -71,8 +59,7 @@ class TaskManager:
             'notes': []
         }
         
-        data.append(task)
-        self._save_data(data)
+        self.store.put(task)
         
         return {
             'success': True,
@@ -82,33 +69,31 @@ class TaskManager:
     
     def complete_task(self, task_id: str, notes: str = "") -> Dict[str, Any]:
         """Mark a task as completed."""
-        data = self._load_data()
-        
-        for task in data:
-            if task['id'] == task_id:
-                if task['status'] == 'completed':
-                    return {
-                        'success': False,
-                        'message': f"Task {task_id} is already completed"
-                    }
-                
-                task['status'] = 'completed'
-                task['completed_date'] = date.today().isoformat()
-                task['completed_timestamp'] = datetime.now().isoformat()
-                
-                if notes:
-                    task['notes'].append({
-                        'timestamp': datetime.now().isoformat(),
-                        'note': notes
-                    })
-                
-                self._save_data(data)
-                
+        task = self.store.get(task_id)
+        if task:
+            if task['status'] == 'completed':
                 return {
-                    'success': True,
-                    'message': f"Task completed: {task['title']}",
-                    'task': task
+                    'success': False,
+                    'message': f"Task {task_id} is already completed"
                 }
+            
+            task['status'] = 'completed'
+            task['completed_date'] = date.today().isoformat()
+            task['completed_timestamp'] = datetime.now().isoformat()
+            
+            if notes:
+                task['notes'].append({
+                    'timestamp': datetime.now().isoformat(),
+                    'note': notes
+                })
+            
+            self.store.put(task)
+            
+            return {
+                'success': True,
+                'message': f"Task completed: {task['title']}",
+                'task': task
+            }
         
         return {
             'success': False,
@@ -117,24 +102,22 @@ class TaskManager:
     
     def update_task(self, task_id: str, **kwargs) -> Dict[str, Any]:
         """Update a task."""
-        data = self._load_data()
-        
-        for task in data:
-            if task['id'] == task_id:
-                # Update allowed fields
-                allowed_fields = ['title', 'description', 'priority', 'due_date', 'category', 'tags']
-                for field, value in kwargs.items():
-                    if field in allowed_fields:
-                        task[field] = value
-                
-                task['updated_timestamp'] = datetime.now().isoformat()
-                self._save_data(data)
-                
-                return {
-                    'success': True,
-                    'message': f"Task updated: {task['title']}",
-                    'task': task
-                }
+        task = self.store.get(task_id)
+        if task:
+            # Update allowed fields
+            allowed_fields = ['title', 'description', 'priority', 'due_date', 'category', 'tags']
+            for field, value in kwargs.items():
+                if field in allowed_fields:
+                    task[field] = value
+            
+            task['updated_timestamp'] = datetime.now().isoformat()
+            self.store.put(task)
+            
+            return {
+                'success': True,
+                'message': f"Task updated: {task['title']}",
+                'task': task
+            }
         
         return {
             'success': False,
@@ -143,18 +126,13 @@ class TaskManager:
     
     def delete_task(self, task_id: str) -> Dict[str, Any]:
         """Delete a task."""
-        data = self._load_data()
-        
-        for i, task in enumerate(data):
-            if task['id'] == task_id:
-                deleted_task = data.pop(i)
-                self._save_data(data)
-                
-                return {
-                    'success': True,
-                    'message': f"Task deleted: {deleted_task['title']}",
-                    'task': deleted_task
-                }
+        deleted_task = self.store.delete(task_id)
+        if deleted_task:
+            return {
+                'success': True,
+                'message': f"Task deleted: {deleted_task['title']}",
+                'task': deleted_task
+            }
         
         return {
             'success': False,
@@ -163,15 +141,13 @@ class TaskManager:
     
     def get_task(self, task_id: str) -> Dict[str, Any]:
         """Get a specific task."""
-        data = self._load_data()
-        
-        for task in data:
-            if task['id'] == task_id:
-                return {
-                    'success': True,
-                    'message': f"Task found: {task['title']}",
-                    'task': task
-                }
+        task = self.store.get(task_id)
+        if task:
+            return {
+                'success': True,
+                'message': f"Task found: {task['title']}",
+                'task': task
+            }
         
         return {
             'success': False,
@@ -181,23 +157,19 @@ class TaskManager:
     def list_tasks(self, status: str = "all", priority: str = "all", 
                   category: str = "all", due_soon: bool = False) -> Dict[str, Any]:
         """List tasks with optional filters."""
-        data = self._load_data()
+        # Status and category are indexed in storage
+        data = self.store.query(
+            status=None if status == "all" else status,
+            category=None if category == "all" else category
+        )
         
         # Apply filters
         filtered_tasks = []
         for task in data:
-            # Status filter
-            if status != "all" and task['status'] != status:
-                continue
-            
             # Priority filter
             if priority != "all" and task['priority'] != priority:
                 continue
             
-            # Category filter
-            if category != "all" and task['category'] != category:
-                continue
-            
             # Due soon filter
             if due_soon and task['due_date']:
                 try:
@@ -249,14 +221,13 @@ class TaskManager:
     
     def get_today_tasks(self) -> Dict[str, Any]:
         """Get tasks due today or overdue."""
-        data = self._load_data()
         today = date.today().isoformat()
         
         today_tasks = []
         overdue_tasks = []
         
-        for task in data:
-            if task['status'] == 'pending' and task['due_date']:
+        for task in self.store.query(status='pending'):
+            if task['due_date']:
                 if task['due_date'] == today:
                     today_tasks.append(task)
                 elif task['due_date'] < today:
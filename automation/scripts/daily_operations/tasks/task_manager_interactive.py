@@ -4,62 +4,23 @@ Interactive Task Manager for Telegram Bot
 Provides a simple interface for managing tasks
 """
 
-import json
-import os
 import sys
-from datetime import datetime, date
 from pathlib import Path
-from typing import Dict, List, Any, Optional
 
 # Add the automation directory to the path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from task_manager import TaskManager
+
 class InteractiveTaskManager:
     def __init__(self):
-        self.data_dir = Path(__file__).parent.parent / "outputs"
-        self.data_file = self.data_dir / "tasks.json"
-        self._ensure_data_file()
-    
-    def _ensure_data_file(self):
-        """Ensure data file exists with proper structure."""
-        if not self.data_file.exists():
-            self.data_file.parent.mkdir(exist_ok=True)
-            with open(self.data_file, 'w') as f:
-                json.dump({"tasks": [], "next_id": 1}, f)
-    
-    def _load_data(self) -> Dict[str, Any]:
-        """Load task data from file."""
-        try:
-            with open(self.data_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {"tasks": [], "next_id": 1}
-    
-    def _save_data(self, data: Dict[str, Any]):
-        """Save task data to file."""
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Same record store as the task manager, so both see every task
+        self.task_manager = TaskManager()
+        self.store = self.task_manager.store
     
     def add_task(self, title: str, description: str = "", priority: str = "medium", due_date: str = "", category: str = "") -> str:
         """Add a new task."""
-        data = self._load_data()
-        
-        task = {
-            "id": data["next_id"],
-            "title": title,
-            "description": description,
-            "priority": priority,
-            "due_date": due_date,
-            "category": category,
-            "status": "pending",
-            "created": datetime.now().isoformat(),
-            "completed": None
-        }
-        
-        data["tasks"].append(task)
-        data["next_id"] += 1
-        
-        self._save_data(data)
+        task = self.task_manager.add_task(title, description, priority, due_date, category)['task']
         
         response = f"✅ **Task Added**\n\n"
         response += f"📋 **Title**: {title}\n"
@@ -76,22 +37,18 @@ class InteractiveTaskManager:
     
     def list_tasks(self, status: str = "all") -> str:
         """List tasks with optional status filter."""
-        data = self._load_data()
-        tasks = data.get("tasks", [])
-        
-        if not tasks:
+        if not self.store.keys():
             return "📋 **Task List**\n\nNo tasks found.\n\n**Priority Levels:**\n- low: Low priority\n- medium: Medium priority (default)\n- high: High priority\n- urgent: Urgent priority"
         
-        # Filter tasks by status
-        if status != "all":
-            tasks = [task for task in tasks if task.get("status") == status]
+        # Status is indexed in storage
+        tasks = self.store.query(status=None if status == "all" else status)
         
         if not tasks:
             return f"📋 **Task List** ({status.title()})\n\nNo {status} tasks found."
         
         # Sort by priority and creation date
         priority_order = {"urgent": 4, "high": 3, "medium": 2, "low": 1}
-        tasks.sort(key=lambda x: (priority_order.get(x.get("priority", "medium"), 2), x.get("created", "")), reverse=True)
+        tasks.sort(key=lambda x: (priority_order.get(x.get("priority", "medium"), 2), x.get("created_timestamp", "")), reverse=True)
         
         response = f"📋 **Task List** ({len(tasks)} tasks)\n\n"
         
@@ -111,8 +68,7 @@ class InteractiveTaskManager:
     
     def get_task_stats(self) -> str:
         """Get task statistics."""
-        data = self._load_data()
-        tasks = data.get("tasks", [])
+        tasks = self.store.load()
         
         if not tasks:
             return "📊 **Task Statistics**\n\nNo tasks found."
@@ -10,6 +10,41 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import argparse
 
+# Practice types with streaks -> the data section holding their entries
+STREAK_SECTIONS = {
+    "daily": "daily_checkins",
+    "weekly": "weekly_explorations",
+    "monthly": "monthly_ceremonies",
+}
+
+def period_index(practice_type, key):
+    """Number a date key so consecutive days, Monday-based weeks or months are consecutive integers"""
+    if practice_type == "monthly":
+        return int(key[:4]) * 12 + int(key[5:7]) - 1
+    ordinal = datetime.fromisoformat(key[:10]).toordinal()
+    return ordinal if practice_type == "daily" else (ordinal - 1) // 7
+
+def compute_streak(practice_type, keys):
+    """Streak state from scratch: run ending at the latest period, longest run, latest key"""
+    periods = {}
+    for key in keys:
+        try:
+            period = period_index(practice_type, key)
+        except ValueError:
+            continue
+        # Latest key per period, matching _update_streak
+        periods[period] = max(periods.get(period, key), key)
+    
+    state = {"current": 0, "longest": 0, "last": None, "last_period": None}
+    for period in sorted(periods):
+        if state["last_period"] is not None and period == state["last_period"] + 1:
+            state["current"] += 1
+        else:
+            state["current"] = 1
+        state["longest"] = max(state["longest"], state["current"])
+        state["last"], state["last_period"] = periods[period], period
+    return state
+
 class ShadowWorkTracker:
     def __init__(self, data_dir="automation/outputs"):
         self.data_dir = Path(data_dir)
@@ -32,6 +67,13 @@ class ShadowWorkTracker:
                 "insights": [],
                 "integration_wins": []
             }
+        
+        # Files written before streak tracking get their state built once
+        if "streaks" not in self.data:
+            self.data["streaks"] = {
+                practice_type: compute_streak(practice_type, self.data.get(section, {}))
+                for practice_type, section in STREAK_SECTIONS.items()
+            }
     
     def save_data(self):
         """Save shadow work data"""
@@ -43,12 +85,15 @@ class ShadowWorkTracker:
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
         
+        # Reject a malformed key before touching the data or streaks
+        period_index("daily", date)
         self.data["daily_checkins"][date] = {
             "shadow_aspect": shadow_aspect,
             "pattern_observed": pattern_observed,
             "integration_insight": integration_insight,
             "timestamp": datetime.now().isoformat()
         }
+        self._update_streak("daily", date)
         self.save_data()
         print(f"✅ Daily shadow check-in recorded for {date}")
     
@@ -57,6 +102,8 @@ class ShadowWorkTracker:
         if week_start is None:
             week_start = (datetime.now() - timedelta(days=datetime.now().weekday())).strftime("%Y-%m-%d")
         
+        # Reject a malformed key before touching the data or streaks
+        period_index("weekly", week_start)
         self.data["weekly_explorations"][week_start] = {
             "archetype": archetype,
             "light_aspects": light_aspects or [],
@@ -64,6 +111,7 @@ class ShadowWorkTracker:
             "integration_practice": integration_practice,
             "timestamp": datetime.now().isoformat()
         }
+        self._update_streak("weekly", week_start)
         self.save_data()
         print(f"✅ Weekly shadow exploration recorded for week of {week_start}")
     
@@ -72,12 +120,15 @@ class ShadowWorkTracker:
         if month is None:
             month = datetime.now().strftime("%Y-%m")
         
+        # Reject a malformed key before touching the data or streaks
+        period_index("monthly", month)
         self.data["monthly_ceremonies"][month] = {
             "shadow_aspect": shadow_aspect,
             "breakthrough": breakthrough,
             "integration_ritual": integration_ritual,
             "timestamp": datetime.now().isoformat()
         }
+        self._update_streak("monthly", month)
         self.save_data()
         print(f"✅ Monthly shadow ceremony recorded for {month}")
     
@@ -134,38 +185,57 @@ class ShadowWorkTracker:
         self.save_data()
         print(f"🎯 Current focus set: {shadow_aspect}")
     
-    def get_streak(self, practice_type="daily"):
-        """Get current streak for a practice type"""
-        if practice_type == "daily":
-            dates = sorted(self.data["daily_checkins"].keys(), reverse=True)
-        elif practice_type == "weekly":
-            dates = sorted(self.data["weekly_explorations"].keys(), reverse=True)
-        elif practice_type == "monthly":
-            dates = sorted(self.data["monthly_ceremonies"].keys(), reverse=True)
+    def _update_streak(self, practice_type, key):
+        """Extend, restart or keep the streak for a newly recorded period"""
+        state = self.data["streaks"].get(practice_type)
+        period = period_index(practice_type, key)
+        
+        if state is None or state["last_period"] is None:
+            state = {"current": 1, "longest": 1, "last": key, "last_period": period}
+        elif period == state["last_period"]:
+            state["last"] = max(state["last"], key)
+        elif period == state["last_period"] + 1:
+            state["current"] += 1
+            state["last"], state["last_period"] = key, period
+        elif period > state["last_period"]:
+            state["current"] = 1
+            state["last"], state["last_period"] = key, period
         else:
-            return 0
+            # A backfilled older entry can join two runs, so rebuild this type
+            state = compute_streak(practice_type, self.data[STREAK_SECTIONS[practice_type]])
         
-        if not dates:
+        state["longest"] = max(state["longest"], state["current"])
+        self.data["streaks"][practice_type] = state
+    
+    def get_streak(self, practice_type="daily"):
+        """Get current streak for a practice type"""
+        state = self.data["streaks"].get(practice_type)
+        if not state or state["last_period"] is None:
             return 0
         
-        streak = 0
-        current_date = datetime.now()
-        
-        for date_str in dates:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-            if practice_type == "daily":
-                expected_date = current_date - timedelta(days=streak)
-            elif practice_type == "weekly":
-                expected_date = current_date - timedelta(weeks=streak)
-            elif practice_type == "monthly":
-                expected_date = current_date - timedelta(days=30*streak)
-            
-            if abs((date - expected_date).days) <= 1:  # Allow 1 day flexibility
-                streak += 1
-            else:
-                break
+        # The streak stays alive until a whole period is missed
+        now_period = period_index(practice_type, datetime.now().strftime("%Y-%m-%d"))
+        return state["current"] if now_period - state["last_period"] <= 1 else 0
+    
+    def get_longest_streak(self, practice_type="daily"):
+        """Get the longest streak ever recorded for a practice type"""
+        state = self.data["streaks"].get(practice_type)
+        return state["longest"] if state else 0
+    
+    def verify_streaks(self, repair=False):
+        """Recompute every streak from scratch and report types whose stored state differs"""
+        mismatches = {}
+        for practice_type, section in STREAK_SECTIONS.items():
+            expected = compute_streak(practice_type, self.data.get(section, {}))
+            stored = self.data["streaks"].get(practice_type)
+            if stored != expected:
+                mismatches[practice_type] = {"stored": stored, "expected": expected}
+                if repair:
+                    self.data["streaks"][practice_type] = expected
         
-        return streak
+        if mismatches and repair:
+            self.save_data()
+        return mismatches
     
     def generate_report(self, days=30):
         """Generate a shadow work report"""
@@ -182,9 +252,9 @@ class ShadowWorkTracker:
         monthly_streak = self.get_streak("monthly")
         
         report.append("📊 CURRENT STREAKS:")
-        report.append(f"   Daily check-ins: {daily_streak} days")
-        report.append(f"   Weekly explorations: {weekly_streak} weeks")
-        report.append(f"   Monthly ceremonies: {monthly_streak} months")
+        report.append(f"   Daily check-ins: {daily_streak} days (longest {self.get_longest_streak('daily')})")
+        report.append(f"   Weekly explorations: {weekly_streak} weeks (longest {self.get_longest_streak('weekly')})")
+        report.append(f"   Monthly ceremonies: {monthly_streak} months (longest {self.get_longest_streak('monthly')})")
         report.append("")
         
         # Current focus
@@ -216,8 +286,9 @@ class ShadowWorkTracker:
         
         # Practice frequency
         report.append("📈 PRACTICE FREQUENCY (Last 30 days):")
-        daily_count = len([d for d in self.data["daily_checkins"].keys() 
-                          if (datetime.now() - datetime.strptime(d, "%Y-%m-%d")).days <= days])
+        # ISO date keys compare correctly as strings
+        cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        daily_count = sum(1 for d in self.data["daily_checkins"] if d >= cutoff)
         report.append(f"   Daily check-ins: {daily_count}/{days} days ({daily_count/days*100:.1f}%)")
         report.append("")
         
@@ -228,12 +299,12 @@ class ShadowWorkTracker:
         reminders = []
         
         # Check daily practice
-        last_daily = max(self.data["daily_checkins"].keys()) if self.data["daily_checkins"] else None
+        last_daily = self.data["streaks"]["daily"]["last"]
         if not last_daily or (datetime.now() - datetime.strptime(last_daily, "%Y-%m-%d")).days > 1:
             reminders.append("🔍 Daily shadow check-in due")
         
         # Check weekly practice
-        last_weekly = max(self.data["weekly_explorations"].keys()) if self.data["weekly_explorations"] else None
+        last_weekly = self.data["streaks"]["weekly"]["last"]
         if not last_weekly or (datetime.now() - datetime.strptime(last_weekly, "%Y-%m-%d")).days > 7:
             reminders.append("📝 Weekly shadow archetype exploration due")
         
@@ -246,12 +317,13 @@ class ShadowWorkTracker:
 
 def main():
     parser = argparse.ArgumentParser(description="Shadow Work Tracker")
-    parser.add_argument("--action", choices=["checkin", "explore", "ceremony", "dive", "insight", "win", "focus", "report", "reminders"], 
+    parser.add_argument("--action", choices=["checkin", "explore", "ceremony", "dive", "insight", "win", "focus", "report", "reminders", "verify"], 
                        help="Action to perform")
     parser.add_argument("--shadow-aspect", help="Shadow aspect to work with")
     parser.add_argument("--insight", help="Insight to record")
     parser.add_argument("--win", help="Integration win to record")
     parser.add_argument("--goal", help="Integration goal")
+    parser.add_argument("--repair", action="store_true", help="With --action verify, fix inconsistent streaks")
     
     args = parser.parse_args()
     
@@ -281,6 +353,14 @@ def main():
                 print(f"   {reminder}")
         else:
             print("✅ All practices up to date!")
+    elif args.action == "verify":
+        mismatches = tracker.verify_streaks(repair=args.repair)
+        if mismatches:
+            print("⚠️ STREAK MISMATCHES:" + (" (repaired)" if args.repair else ""))
+            for practice_type, states in mismatches.items():
+                print(f"   {practice_type}: stored {states['stored']}, expected {states['expected']}")
+        else:
+            print("✅ Streaks consistent with recorded practices")
     else:
         print("Please specify an action. Use --help for options.")
 
@@ -8,9 +8,16 @@ and optionally syncs it to Google Drive.
 
 import os
 import sys
+import json
+import zlib
+import struct
+import sqlite3
+import hashlib
 import zipfile
 import argparse
 import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import getpass
@@ -40,6 +47,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Files are stored in the chunk store in pieces of this size
+CHUNK_SIZE = 4 * 1024 * 1024
+MANIFEST_SUFFIX = '.manifest.json'
+INDEX_NAME = 'backup_index.db'
+
+# Zip local file header: signature, then name and extra field lengths at offset 26
+ZIP_LOCAL_HEADER_SIZE = 30
+ZIP_LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+
 class PersonalSystemBackup:
     def __init__(self, personal_system_path=None):
         """Initialize the backup system."""
@@ -66,6 +82,10 @@ class PersonalSystemBackup:
         self.weekly_backup_dir = self.backup_dir / 'weekly'
         self.weekly_backup_dir.mkdir(exist_ok=True)
         
+        # Content-addressed store shared by incremental backups
+        self.chunk_dir = self.weekly_backup_dir / 'chunks'
+        self._exclude_patterns = None
+        
         # Keyring service and username for password storage
         self.keyring_service = "personal_system_backup"
         self.keyring_username = "backup_password"
@@ -112,6 +132,12 @@ class PersonalSystemBackup:
     
     def get_exclude_patterns(self):
         """Define patterns to exclude from backup."""
+        if self._exclude_patterns is None:
+            self._exclude_patterns = self._default_exclude_patterns()
+        return self._exclude_patterns
+    
+    def _default_exclude_patterns(self):
+        """Patterns excluded from every backup."""
         return [
             'backups',           # Don't backup backups
             '.git',              # Git repository
@@ -141,6 +167,16 @@ class PersonalSystemBackup:
         
         return False
     
+    def iter_backup_files(self):
+        """Yield every file to back up, pruning excluded directories before descending."""
+        exclude_patterns = self.get_exclude_patterns()
+        for root, dirs, files in os.walk(self.personal_system_path):
+            dirs[:] = [d for d in dirs if not self.should_exclude(Path(root) / d, exclude_patterns)]
+            for file in files:
+                file_path = Path(root) / file
+                if not self.should_exclude(file_path, exclude_patterns):
+                    yield file_path
+    
     def create_backup_with_zip(self, password, backup_name=None):
         """Create a password-protected zip backup using Python's zipfile."""
         if backup_name is None:
@@ -161,36 +197,26 @@ class PersonalSystemBackup:
             total_files = 0
             total_size = 0
             
-            for root, dirs, files in os.walk(self.personal_system_path):
-                # Filter out excluded directories
-                dirs[:] = [d for d in dirs if not self.should_exclude(Path(root) / d, self.get_exclude_patterns())]
-                
-                for file in files:
-                    file_path = Path(root) / file
+            for file_path in self.iter_backup_files():
+                # Calculate relative path for the zip file
+                try:
+                    relative_path = file_path.relative_to(self.personal_system_path)
                     
-                    # Skip excluded files
-                    if self.should_exclude(file_path, self.get_exclude_patterns()):
-                        continue
-                    
-                    # Calculate relative path for the zip file
+                    # Try to use password protection if available
                     try:
-                        relative_path = file_path.relative_to(self.personal_system_path)
-                        
-                        # Try to use password protection if available
-                        try:
-                            zipf.write(file_path, relative_path, pwd=password.encode('utf-8'))
-                        except TypeError:
-                            # Fallback for older Python versions
-                            zipf.write(file_path, relative_path)
-                        
-                        total_files += 1
-                        total_size += file_path.stat().st_size
+                        zipf.write(file_path, relative_path, pwd=password.encode('utf-8'))
+                    except TypeError:
+                        # Fallback for older Python versions
+                        zipf.write(file_path, relative_path)
+                    
+                    total_files += 1
+                    total_size += file_path.stat().st_size
+                    
+                    if total_files % 100 == 0:
+                        logger.info(f"Processed {total_files} files...")
                         
-                        if total_files % 100 == 0:
-                            logger.info(f"Processed {total_files} files...")
-                            
-                    except Exception as e:
-                        logger.error(f"Error adding {file_path}: {e}")
+                except Exception as e:
+                    logger.error(f"Error adding {file_path}: {e}")
         
         # Convert total size to human readable format
         size_mb = total_size / (1024 * 1024)
@@ -199,8 +225,169 @@ class PersonalSystemBackup:
         logger.info(f"Total size: {size_mb:.2f} MB")
         logger.info(f"Backup location: {backup_path}")
         
+        self.index_backup(backup_path)
         return backup_path
     
+    def _chunk_path(self, chunk_id):
+        """Location of a chunk in the store, fanned out by its first two hex digits."""
+        return self.chunk_dir / chunk_id[:2] / chunk_id
+    
+    def _existing_chunks(self):
+        """IDs of all chunks already in the store."""
+        if not self.chunk_dir.exists():
+            return set()
+        return {
+            entry.name for subdir in self.chunk_dir.iterdir() if subdir.is_dir()
+            for entry in os.scandir(subdir) if not entry.name.endswith('.tmp')
+        }
+    
+    def _store_file(self, file_path, existing_chunks):
+        """Hash a file in chunks and compress the chunks the store does not have yet; returns (hash, chunk IDs, new bytes)."""
+        file_hash = hashlib.blake2b(digest_size=32)
+        chunk_ids = []
+        stored = 0
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                file_hash.update(chunk)
+                chunk_id = hashlib.blake2b(chunk, digest_size=32).hexdigest()
+                chunk_ids.append(chunk_id)
+                if chunk_id in existing_chunks:
+                    continue
+                
+                # Write under a temporary name so a concurrent writer of the same chunk is harmless
+                chunk_path = self._chunk_path(chunk_id)
+                chunk_path.parent.mkdir(parents=True, exist_ok=True)
+                data = zlib.compress(chunk, 6)
+                fd, tmp_path = tempfile.mkstemp(dir=chunk_path.parent, suffix='.tmp')
+                with os.fdopen(fd, 'wb') as out:
+                    out.write(data)
+                os.replace(tmp_path, chunk_path)
+                existing_chunks.add(chunk_id)
+                stored += len(data)
+        return file_hash.hexdigest(), chunk_ids, stored
+    
+    def list_manifests(self):
+        """Incremental backup manifests, newest first."""
+        manifests = list(self.weekly_backup_dir.glob(f'personal_system_backup_*{MANIFEST_SUFFIX}'))
+        return sorted(manifests, key=lambda path: path.stat().st_mtime, reverse=True)
+    
+    def load_manifest(self, manifest_path):
+        """Read a backup manifest."""
+        with open(manifest_path, 'r') as f:
+            return json.load(f)
+    
+    def create_incremental_backup(self, backup_name=None, workers=None):
+        """Back up into the chunk store, re-reading only files whose size or mtime changed since the last manifest."""
+        if backup_name is None:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            backup_name = f"personal_system_backup_{timestamp}{MANIFEST_SUFFIX}"
+        elif not backup_name.endswith(MANIFEST_SUFFIX):
+            backup_name += MANIFEST_SUFFIX
+        
+        manifest_path = self.weekly_backup_dir / backup_name
+        previous_manifests = [path for path in self.list_manifests() if path != manifest_path]
+        previous = self.load_manifest(previous_manifests[0])['files'] if previous_manifests else {}
+        existing_chunks = self._existing_chunks()
+        
+        logger.info(f"Creating incremental backup: {manifest_path}")
+        logger.warning("Incremental backups are zlib-compressed but NOT encrypted; use --use-7zip for a password-protected archive")
+        logger.info(f"Source directory: {self.personal_system_path}")
+        if previous_manifests:
+            logger.info(f"Comparing against: {previous_manifests[0].name}")
+        
+        files = {}
+        changed = []
+        for file_path in self.iter_backup_files():
+            try:
+                stat = file_path.stat()
+            except OSError as e:
+                logger.error(f"Error reading {file_path}: {e}")
+                continue
+            relative_path = file_path.relative_to(self.personal_system_path).as_posix()
+            entry = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+            
+            # Unchanged files keep the previous hash and chunks without being read
+            old = previous.get(relative_path)
+            if (old and old['size'] == entry['size'] and old['mtime_ns'] == entry['mtime_ns']
+                    and all(chunk_id in existing_chunks for chunk_id in old['chunks'])):
+                entry['hash'], entry['chunks'] = old['hash'], old['chunks']
+            else:
+                changed.append((relative_path, file_path))
+            files[relative_path] = entry
+        
+        # Hashing and zlib release the GIL, so threads compress chunks in parallel
+        stored_bytes = 0
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+            futures = {
+                pool.submit(self._store_file, file_path, existing_chunks): relative_path
+                for relative_path, file_path in changed
+            }
+            for future, relative_path in futures.items():
+                try:
+                    file_hash, chunk_ids, stored = future.result()
+                except OSError as e:
+                    logger.error(f"Error adding {relative_path}: {e}")
+                    del files[relative_path]
+                    continue
+                files[relative_path]['hash'] = file_hash
+                files[relative_path]['chunks'] = chunk_ids
+                stored_bytes += stored
+        
+        manifest = {
+            'created': datetime.now().isoformat(),
+            'source': str(self.personal_system_path),
+            'chunk_size': CHUNK_SIZE,
+            'files': files,
+        }
+        tmp_path = manifest_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, manifest_path)
+        
+        total_size = sum(entry['size'] for entry in files.values())
+        logger.info("Incremental backup completed successfully!")
+        logger.info(f"Total files: {len(files)} ({total_size / (1024 * 1024):.2f} MB)")
+        logger.info(f"Changed files: {len(changed)}, new data stored: {stored_bytes / (1024 * 1024):.2f} MB")
+        logger.info(f"Backup location: {manifest_path}")
+        
+        self.index_backup(manifest_path)
+        return manifest_path
+    
+    def restore_incremental_backup(self, manifest_path, destination):
+        """Rebuild every file of an incremental backup under destination."""
+        destination = Path(destination)
+        manifest = self.load_manifest(manifest_path)
+        for relative_path, entry in manifest['files'].items():
+            target = destination / relative_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(target, 'wb') as out:
+                for chunk_id in entry['chunks']:
+                    with open(self._chunk_path(chunk_id), 'rb') as f:
+                        out.write(zlib.decompress(f.read()))
+            os.utime(target, ns=(entry['mtime_ns'], entry['mtime_ns']))
+        
+        logger.info(f"Restored {len(manifest['files'])} files to {destination}")
+        return len(manifest['files'])
+    
+    def prune_chunks(self):
+        """Delete chunks no longer referenced by any manifest."""
+        referenced = set()
+        for manifest_path in self.list_manifests():
+            for entry in self.load_manifest(manifest_path)['files'].values():
+                referenced.update(entry['chunks'])
+        
+        removed = 0
+        for chunk_id in self._existing_chunks() - referenced:
+            try:
+                self._chunk_path(chunk_id).unlink()
+                removed += 1
+            except OSError as e:
+                logger.error(f"Error removing chunk {chunk_id}: {e}")
+        
+        if removed:
+            logger.info(f"Removed {removed} unreferenced chunks")
+        return removed
+    
     def create_backup_with_7zip(self, password, backup_name=None):
         """Create a password-protected backup using 7zip (if available)."""
         if backup_name is None:
@@ -235,6 +422,7 @@ class PersonalSystemBackup:
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
             logger.info("7zip backup completed successfully!")
             logger.info(f"Backup location: {backup_path}")
+            self.index_backup(backup_path, password)
             return backup_path
         except subprocess.CalledProcessError as e:
             logger.error(f"7zip backup failed: {e}")
@@ -294,12 +482,235 @@ class PersonalSystemBackup:
         backup_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
         
         # Remove old backups
+        removed = []
         for old_backup in backup_files[keep_count:]:
             try:
                 old_backup.unlink()
+                removed.append(old_backup.name)
                 logger.info(f"Removed old backup: {old_backup.name}")
             except Exception as e:
                 logger.error(f"Error removing old backup {old_backup}: {e}")
+        
+        self.drop_from_index(removed)
+        if self.chunk_dir.exists():
+            self.prune_chunks()
+    
+    def _open_index(self):
+        """Connection to the manifest index of all retained backups."""
+        conn = sqlite3.connect(self.weekly_backup_dir / INDEX_NAME)
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS backups ("
+            " id INTEGER PRIMARY KEY,"
+            " name TEXT UNIQUE NOT NULL,"
+            " kind TEXT NOT NULL,"
+            " created TEXT NOT NULL,"
+            " archive_mtime_ns INTEGER NOT NULL)"
+        )
+        # One row per file per backup; offset and compression describe zip members,
+        # chunks incremental ones
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS members ("
+            " path TEXT NOT NULL,"
+            " backup_id INTEGER NOT NULL REFERENCES backups(id) ON DELETE CASCADE,"
+            " member TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " hash TEXT,"
+            " offset INTEGER,"
+            " compressed_size INTEGER,"
+            " compress_type INTEGER,"
+            " chunks TEXT,"
+            " PRIMARY KEY (path, backup_id)) WITHOUT ROWID"
+        )
+        return conn
+    
+    def _backup_kind(self, backup_path):
+        """'zip', '7z' or 'incremental' from a backup file name, None for anything else."""
+        name = Path(backup_path).name
+        if not name.startswith('personal_system_backup_'):
+            return None
+        if name.endswith(MANIFEST_SUFFIX):
+            return 'incremental'
+        return {'.zip': 'zip', '.7z': '7z'}.get(Path(name).suffix)
+    
+    def _list_members(self, backup_path, kind, password=None):
+        """(path, member, size, hash, offset, compressed size, compress type, chunks) for every file in a backup."""
+        if kind == 'zip':
+            with zipfile.ZipFile(backup_path) as zipf:
+                return [
+                    (info.filename, info.filename, info.file_size, f"crc32:{info.CRC:08x}",
+                     info.header_offset, info.compress_size, info.compress_type, None)
+                    for info in zipf.infolist() if not info.is_dir()
+                ]
+        
+        if kind == 'incremental':
+            files = self.load_manifest(backup_path)['files']
+            return [
+                (path, path, entry['size'], f"blake2b:{entry['hash']}", None, None, None, json.dumps(entry['chunks']))
+                for path, entry in files.items()
+            ]
+        
+        # 7z archives hold the source directory itself, so drop the first path component
+        cmd = ['7z', 'l', '-slt', '-ba', str(backup_path)]
+        if password:
+            cmd.insert(2, f'-p{password}')
+        output = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+        members = []
+        for block in output.split('\n\n'):
+            fields = dict(line.split(' = ', 1) for line in block.splitlines() if ' = ' in line)
+            if 'Path' not in fields or fields.get('Attributes', '').startswith('D') or fields.get('Folder') == '+':
+                continue
+            member = fields['Path'].replace(os.sep, '/')
+            path = member.split('/', 1)[1] if '/' in member else member
+            crc = fields.get('CRC')
+            members.append((path, member, int(fields.get('Size') or 0), f"crc32:{crc.lower()}" if crc else None,
+                            None, None, None, None))
+        return members
+    
+    def index_backup(self, backup_path, password=None):
+        """Add a backup's members to the manifest index, replacing any earlier entry for it."""
+        backup_path = Path(backup_path)
+        kind = self._backup_kind(backup_path)
+        if kind is None:
+            return False
+        
+        try:
+            members = self._list_members(backup_path, kind, password)
+            if kind == 'incremental':
+                created = self.load_manifest(backup_path)['created']
+            else:
+                created = datetime.fromtimestamp(backup_path.stat().st_mtime).isoformat()
+            
+            conn = self._open_index()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM backups WHERE name = ?", (backup_path.name,))
+                    backup_id = conn.execute(
+                        "INSERT INTO backups (name, kind, created, archive_mtime_ns) VALUES (?, ?, ?, ?)",
+                        (backup_path.name, kind, created, backup_path.stat().st_mtime_ns)
+                    ).lastrowid
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO members (path, backup_id, member, size, hash, offset,"
+                        " compressed_size, compress_type, chunks) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        [(row[0], backup_id) + tuple(row[1:]) for row in members]
+                    )
+            finally:
+                conn.close()
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile, sqlite3.Error, subprocess.CalledProcessError) as e:
+            logger.warning(f"Could not index {backup_path.name}: {e}")
+            return False
+        
+        logger.info(f"Indexed {len(members)} files from {backup_path.name}")
+        return True
+    
+    def drop_from_index(self, backup_names):
+        """Forget removed backups in the manifest index."""
+        if not backup_names:
+            return
+        conn = self._open_index()
+        try:
+            with conn:
+                conn.executemany("DELETE FROM backups WHERE name = ?", [(name,) for name in backup_names])
+        finally:
+            conn.close()
+    
+    def sync_index(self, password=None):
+        """Index backups missing from or changed since the index, and drop backups that no longer exist."""
+        on_disk = {
+            path.name: path for path in self.weekly_backup_dir.glob('personal_system_backup_*')
+            if self._backup_kind(path)
+        }
+        conn = self._open_index()
+        try:
+            indexed = dict(conn.execute("SELECT name, archive_mtime_ns FROM backups").fetchall())
+        finally:
+            conn.close()
+        
+        self.drop_from_index([name for name in indexed if name not in on_disk])
+        for name, path in on_disk.items():
+            if indexed.get(name) == path.stat().st_mtime_ns:
+                continue
+            if self._backup_kind(path) == '7z' and not password:
+                logger.warning(f"Skipping {name}: indexing a 7z backup needs the backup password")
+                continue
+            self.index_backup(path, password)
+    
+    def list_versions(self, relative_path):
+        """Every retained backup containing a file, newest first."""
+        conn = self._open_index()
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute(
+                "SELECT b.name AS backup, b.kind, b.created, m.* FROM members m"
+                " JOIN backups b ON b.id = m.backup_id"
+                " WHERE m.path = ? ORDER BY b.created DESC",
+                (Path(relative_path).as_posix(),)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [dict(row) for row in rows]
+    
+    def _read_zip_member(self, archive_path, version):
+        """Read one zip member by seeking straight to its local header."""
+        with open(archive_path, 'rb') as f:
+            f.seek(version['offset'])
+            header = f.read(ZIP_LOCAL_HEADER_SIZE)
+            if header[:4] != ZIP_LOCAL_HEADER_SIGNATURE:
+                raise ValueError(f"No zip member at offset {version['offset']} in {archive_path.name}")
+            flags = struct.unpack('<H', header[6:8])[0]
+            name_length, extra_length = struct.unpack('<HH', header[26:30])
+            
+            # Encrypted or unusually compressed members go through zipfile
+            if flags & 0x1 or version['compress_type'] not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                with zipfile.ZipFile(archive_path) as zipf:
+                    return zipf.read(version['member'])
+            
+            f.seek(name_length + extra_length, os.SEEK_CUR)
+            data = f.read(version['compressed_size'])
+        
+        if version['compress_type'] == zipfile.ZIP_DEFLATED:
+            data = zlib.decompress(data, -15)
+        if version['hash'] and f"crc32:{zlib.crc32(data):08x}" != version['hash']:
+            raise ValueError(f"CRC mismatch for {version['member']} in {archive_path.name}")
+        return data
+    
+    def _read_incremental_member(self, version):
+        """Reassemble one file from the chunk store."""
+        data = b''.join(
+            zlib.decompress(self._chunk_path(chunk_id).read_bytes())
+            for chunk_id in json.loads(version['chunks'])
+        )
+        if f"blake2b:{hashlib.blake2b(data, digest_size=32).hexdigest()}" != version['hash']:
+            raise ValueError(f"Hash mismatch for {version['member']} in {version['backup']}")
+        return data
+    
+    def restore_file(self, relative_path, backup=None, destination='restored_backup', password=None):
+        """Extract one file from the newest backup holding it (or the named backup) into destination."""
+        versions = self.list_versions(relative_path)
+        if backup:
+            versions = [version for version in versions if version['backup'] == backup]
+        if not versions:
+            raise FileNotFoundError(f"{relative_path} is not in any indexed backup" + (f" named {backup}" if backup else ""))
+        
+        version = versions[0]
+        archive_path = self.weekly_backup_dir / version['backup']
+        if version['kind'] == 'zip':
+            data = self._read_zip_member(archive_path, version)
+        elif version['kind'] == 'incremental':
+            data = self._read_incremental_member(version)
+        else:
+            if not password:
+                password = getpass.getpass("Enter backup password: ")
+            data = subprocess.run(
+                ['7z', 'e', '-so', f'-p{password}', str(archive_path), version['member']],
+                capture_output=True, check=True
+            ).stdout
+        
+        target = Path(destination) / version['path']
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+        logger.info(f"Restored {version['path']} from {version['backup']} to {target}")
+        return target
 
 def main():
     parser = argparse.ArgumentParser(description='Create a backup of the personal system')
@@ -311,6 +722,13 @@ def main():
     parser.add_argument('--set-password', action='store_true', help='Set or update the stored backup password')
     parser.add_argument('--clear-password', action='store_true', help='Remove the stored backup password')
     parser.add_argument('--use-7zip', action='store_true', help='Use 7zip for better compression and password protection')
+    parser.add_argument('--incremental', action='store_true', help='Store only changed files in the deduplicating chunk store (not encrypted; use --use-7zip for encryption)')
+    parser.add_argument('--workers', type=int, help='Compression threads for incremental backups (default: CPU count)')
+    parser.add_argument('--restore-incremental', metavar='MANIFEST', help='Restore an incremental backup manifest')
+    parser.add_argument('--dest', default='restored_backup', help='Destination directory for restores')
+    parser.add_argument('--versions', metavar='FILE', help='List the backups containing a file (path relative to the personal system)')
+    parser.add_argument('--restore', metavar='FILE', help='Restore a single file from the newest backup containing it')
+    parser.add_argument('--from', dest='from_backup', metavar='BACKUP', help='With --restore, the backup file name to restore from')
     
     args = parser.parse_args()
     
@@ -347,6 +765,42 @@ def main():
                 print("Failed to remove password.")
             return
         
+        if args.versions or args.restore:
+            password = backup_system.get_stored_password()
+            backup_system.sync_index(password)
+            
+            relative_path = args.versions or args.restore
+            versions = backup_system.list_versions(relative_path)
+            if not versions:
+                print(f"{relative_path} is not in any indexed backup")
+                sys.exit(1)
+            
+            if args.versions:
+                print(f"Versions of {relative_path}:")
+                for version in versions:
+                    print(f"  {version['backup']}  {version['created'][:19]}  {version['size']:,} bytes  {version['hash']}")
+                return
+            
+            target = backup_system.restore_file(relative_path, args.from_backup, args.dest, password)
+            print(f"Restored to: {target}")
+            return
+        
+        if args.restore_incremental:
+            backup_system.restore_incremental_backup(args.restore_incremental, args.dest)
+            print(f"Restored to: {args.dest}")
+            return
+        
+        # Incremental backups are not zipped, so they need no password
+        if args.incremental:
+            backup_path = backup_system.create_incremental_backup(args.name, args.workers)
+            if not args.no_gdrive:
+                logger.info("Google Drive sync uploads single archives; skipping it for the incremental chunk store")
+            if args.cleanup:
+                backup_system.cleanup_old_backups(args.keep)
+            print("\nBackup completed successfully!")
+            print(f"Manifest: {backup_path}")
+            return
+        
         # Get password (try stored first, then prompt)
         password = backup_system.get_stored_password()
         
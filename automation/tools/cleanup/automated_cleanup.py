@@ -5,21 +5,78 @@ Intelligent file cleanup with marking, archiving, and safety features
 """
 
 import os
+import re
+import stat
+import time
 import yaml
 import shutil
+import hashlib
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Pattern, Tuple
 import fnmatch
 import json
 
+# Directories never descended into (hidden directories are skipped as well)
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__', 'venv', 'myenv', '.cleanup_archive', '.cleanup_backup', '.cleanup_temp'}
+
+# Scan categories in order of precedence
+SCAN_CATEGORIES = ('preserved', 'auto_remove', 'mark_for_review')
+
+# Directory listings modified this close to a scan are not cached, since a
+# change within the same mtime tick would go unnoticed on the next run
+CACHE_SETTLE_NS = 2_000_000_000
+
+# Bytes read from each end of a file for the first duplicate-detection hash
+PARTIAL_HASH_BYTES = 64 * 1024
+
+# Below this many files to hash, a process pool costs more than it saves
+MIN_POOL_JOBS = 16
+
+@lru_cache(maxsize=None)
+def compile_patterns(patterns: Tuple[str, ...]) -> Optional[Pattern]:
+    """Compile glob patterns into one regex matching like fnmatch against any of them."""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns))
+
+def hash_file(job: Tuple[str, str]) -> Tuple[str, Optional[str]]:
+    """BLAKE2 digest of a whole file ('full') or of its first and last 64 KB ('partial'); runs in worker processes."""
+    path, mode = job
+    digest = hashlib.blake2b(digest_size=32)
+    try:
+        with open(path, 'rb') as f:
+            if mode == 'partial':
+                size = os.fstat(f.fileno()).st_size
+                digest.update(f.read(PARTIAL_HASH_BYTES))
+                if size > PARTIAL_HASH_BYTES:
+                    f.seek(max(PARTIAL_HASH_BYTES, size - PARTIAL_HASH_BYTES))
+                    digest.update(f.read(PARTIAL_HASH_BYTES))
+            else:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+    except OSError:
+        return path, None
+    return path, digest.hexdigest()
+
 class AutomatedCleanup:
-    def __init__(self, config_path: str = "automation/tools/cleanup/cleanup_config.yaml"):
+    def __init__(self, config_path: str = "automation/tools/cleanup/cleanup_config.yaml",
+                 use_cache: Optional[bool] = None):
         """Initialize the automated cleanup system."""
         self.config_path = config_path
         self.config = self._load_config()
         self.logger = self._setup_logging()
+        
+        scan_config = self.config.get('scan', {})
+        self.scan_workers = scan_config.get('workers', 8)
+        self.use_cache = scan_config.get('mtime_cache', True) if use_cache is None else use_cache
+        self.cache_file = Path(scan_config.get('cache_file', '.cleanup_cache/scan_index.json'))
+        self.skip_dirs = SKIP_DIRS | set(scan_config.get('skip_dirs', []))
+        self.duplicates_config = self.config.get('duplicates', {})
+        self._classifier = self._build_classifier()
         self.cleanup_stats = {
             'removed': [],
             'marked': [],
@@ -66,39 +123,43 @@ class AutomatedCleanup:
         
         return logger
     
+    def _category_patterns(self, category: str) -> Tuple[str, ...]:
+        """All glob patterns configured for a scan category."""
+        if category == 'preserved':
+            return tuple(self.config.get('preserve') or [])
+        groups = self.config.get(category) or {}
+        return tuple(pattern for patterns in groups.values() for pattern in patterns or [])
+    
+    def _build_classifier(self) -> Optional[Pattern]:
+        """One regex with a named group per category; alternation order gives precedence."""
+        groups = []
+        for category in SCAN_CATEGORIES:
+            compiled = compile_patterns(self._category_patterns(category))
+            if compiled is not None:
+                groups.append(f"(?P<{category}>{compiled.pattern})")
+        return re.compile("|".join(groups)) if groups else None
+    
+    def _classify(self, file_path: str) -> str:
+        """Scan category of a relative path, or 'unknown'."""
+        match = self._classifier.match(file_path) if self._classifier else None
+        return match.lastgroup if match else 'unknown'
+    
     def _matches_pattern(self, file_path: str, patterns: List[str]) -> bool:
         """Check if file matches any of the given patterns."""
-        for pattern in patterns:
-            if fnmatch.fnmatch(file_path, pattern):
-                return True
-        return False
+        compiled = compile_patterns(tuple(patterns))
+        return bool(compiled and compiled.match(file_path))
     
     def _is_preserved(self, file_path: str) -> bool:
         """Check if file should be preserved."""
-        preserve_patterns = self.config.get('preserve', [])
-        return self._matches_pattern(file_path, preserve_patterns)
+        return self._classify(file_path) == 'preserved'
     
     def _should_auto_remove(self, file_path: str) -> bool:
         """Check if file should be automatically removed."""
-        if self._is_preserved(file_path):
-            return False
-            
-        auto_remove = self.config.get('auto_remove', {})
-        for category, patterns in auto_remove.items():
-            if self._matches_pattern(file_path, patterns):
-                return True
-        return False
+        return self._classify(file_path) == 'auto_remove'
     
     def _should_mark_for_review(self, file_path: str) -> bool:
         """Check if file should be marked for review."""
-        if self._is_preserved(file_path):
-            return False
-            
-        mark_patterns = self.config.get('mark_for_review', {})
-        for category, patterns in mark_patterns.items():
-            if self._matches_pattern(file_path, patterns):
-                return True
-        return False
+        return self._classify(file_path) == 'mark_for_review'
     
     def _create_backup(self, file_path: str) -> bool:
         """Create backup of file before removal."""
@@ -165,7 +226,7 @@ class AutomatedCleanup:
             self.cleanup_stats['errors'].append(f"{file_path}: {e}")
             return False
     
-    def _mark_file(self, file_path: str) -> bool:
+    def _mark_file(self, file_path: str, reason: str = "Matches cleanup pattern") -> bool:
         """Mark file for review."""
         try:
             # Create a marker file
@@ -173,7 +234,7 @@ class AutomatedCleanup:
             with open(marker_path, 'w') as f:
                 f.write(f"Marked for cleanup review on {datetime.now().isoformat()}\n")
                 f.write(f"Original file: {file_path}\n")
-                f.write(f"Reason: Matches cleanup pattern\n")
+                f.write(f"Reason: {reason}\n")
             
             self.logger.info(f"🏷️  Marked for review: {file_path}")
             self.cleanup_stats['marked'].append(file_path)
@@ -182,6 +243,82 @@ class AutomatedCleanup:
             self.logger.error(f"❌ Marking failed for {file_path}: {e}")
             return False
     
+    def _load_scan_cache(self, root: str) -> Dict[str, Dict]:
+        """Cached directory listings from the previous scan of root."""
+        try:
+            with open(self.cache_file, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cache.get('root') != root or cache.get('skip_dirs') != sorted(self.skip_dirs):
+            return {}
+        return cache.get('directories', {})
+    
+    def _save_scan_cache(self, root: str, directories: Dict[str, Dict], scan_started_ns: int):
+        """Store directory listings that were settled before the scan started."""
+        settled = {
+            rel_dir: listing for rel_dir, listing in directories.items()
+            if listing['mtime_ns'] < scan_started_ns - CACHE_SETTLE_NS
+        }
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump({'root': root, 'skip_dirs': sorted(self.skip_dirs), 'directories': settled}, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            self.logger.warning(f"⚠️  Could not save scan cache: {e}")
+    
+    def _list_directory(self, path: str, cached: Optional[Dict]) -> Dict:
+        """File and subdirectory names of one directory, reused from the cache while its mtime is unchanged."""
+        mtime_ns = os.stat(path).st_mtime_ns
+        if cached and cached['mtime_ns'] == mtime_ns:
+            return cached
+        
+        files, dirs = [], []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    files.append(entry.name)
+                elif not entry.is_symlink() and not entry.name.startswith('.') and entry.name not in self.skip_dirs:
+                    dirs.append(entry.name)
+        return {'mtime_ns': mtime_ns, 'files': files, 'dirs': dirs}
+    
+    def _walk_files(self, directory: str) -> List[str]:
+        """Relative paths of all files under directory, listing subdirectories in parallel threads."""
+        root = os.path.abspath(directory)
+        scan_started_ns = time.time_ns()
+        cache = self._load_scan_cache(root) if self.use_cache else {}
+        listings = {}
+        files = []
+        
+        with ThreadPoolExecutor(max_workers=self.scan_workers) as pool:
+            pending = {pool.submit(self._list_directory, directory, cache.get('')): ''}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    rel_dir = pending.pop(future)
+                    try:
+                        listing = future.result()
+                    except OSError as e:
+                        self.logger.warning(f"⚠️  Cannot scan {rel_dir or directory}: {e}")
+                        continue
+                    
+                    listings[rel_dir] = listing
+                    files.extend(os.path.join(rel_dir, name) if rel_dir else name for name in listing['files'])
+                    for name in listing['dirs']:
+                        child = os.path.join(rel_dir, name) if rel_dir else name
+                        future = pool.submit(self._list_directory, os.path.join(directory, child), cache.get(child))
+                        pending[future] = child
+        
+        if self.use_cache:
+            self._save_scan_cache(root, listings, scan_started_ns)
+        return files
+    
     def scan_directory(self, directory: str = ".") -> Dict[str, List[str]]:
         """Scan directory and categorize files."""
         results = {
@@ -191,35 +328,183 @@ class AutomatedCleanup:
             'unknown': []
         }
         
-        # Directories to skip entirely
-        skip_dirs = {'.git', 'node_modules', '__pycache__', 'venv', 'myenv', '.cleanup_archive', '.cleanup_backup', '.cleanup_temp'}
+        for relative_path in sorted(self._walk_files(directory)):
+            results[self._classify(relative_path)].append(relative_path)
         
-        for root, dirs, files in os.walk(directory):
-            # Skip hidden directories and common ignore patterns
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in skip_dirs]
-            
-            # Skip if we're in a virtual environment or other excluded directory
-            if any(skip_dir in root for skip_dir in skip_dirs):
+        return results
+    
+    def _load_hash_cache(self) -> Dict[str, Dict[str, str]]:
+        """Digests from previous runs keyed by 'device:inode:mtime:size'."""
+        try:
+            with open(self.duplicates_config.get('cache_file', '.cleanup_cache/hash_index.json'), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_hash_cache(self, cache: Dict[str, Dict[str, str]]):
+        """Store digests for the next run."""
+        cache_file = Path(self.duplicates_config.get('cache_file', '.cleanup_cache/hash_index.json'))
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            self.logger.warning(f"⚠️  Could not save hash cache: {e}")
+    
+    def _digests(self, files: List[Tuple[str, str]], mode: str, cache: Dict[str, Dict[str, str]]) -> Dict[str, str]:
+        """Digest of each (path, cache key), hashing cache misses in a process pool."""
+        digests, jobs, keys = {}, [], []
+        for path, key in files:
+            cached = cache.get(key, {}).get(mode)
+            if cached:
+                digests[path] = cached
+            else:
+                jobs.append((path, mode))
+                keys.append(key)
+        
+        workers = self.duplicates_config.get('workers') or os.cpu_count() or 1
+        if len(jobs) >= MIN_POOL_JOBS and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(hash_file, jobs, chunksize=8))
+        else:
+            results = [hash_file(job) for job in jobs]
+        
+        for (path, digest), key in zip(results, keys):
+            if digest is None:
+                self.logger.warning(f"⚠️  Cannot read {path}")
                 continue
+            digests[path] = digest
+            cache.setdefault(key, {})[mode] = digest
+        return digests
+    
+    def _refine_groups(self, groups: List[List[Tuple]], mode: str,
+                       cache: Dict[str, Dict[str, str]]) -> List[List[Tuple]]:
+        """Split groups of (relative path, path, cache key, size) by digest, dropping files left without a twin."""
+        digests = self._digests([(entry[1], entry[2]) for group in groups for entry in group], mode, cache)
+        refined = []
+        for group in groups:
+            by_digest: Dict[str, List[Tuple]] = {}
+            for entry in group:
+                if entry[1] in digests:
+                    by_digest.setdefault(digests[entry[1]], []).append(entry)
+            refined.extend(entries for entries in by_digest.values() if len(entries) > 1)
+        return refined
+    
+    def find_duplicates(self, directory: str = ".") -> Dict:
+        """Group identical files by size, then a hash of their first and last 64 KB, then a full BLAKE2 hash."""
+        min_size = self.duplicates_config.get('min_size', 1)
+        by_size: Dict[int, List[Tuple[str, str, str, int]]] = {}
+        # First path seen for each inode; later hard links are only recorded in links
+        inode_paths: Dict[Tuple[int, int], str] = {}
+        links: Dict[str, List[str]] = {}
+        for relative_path in self._walk_files(directory):
+            if relative_path.endswith('.CLEANUP_MARKER'):
+                continue
+            path = os.path.join(directory, relative_path)
+            try:
+                st = os.lstat(path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode) or st.st_size < min_size:
+                continue
+            # Hard links share content, so hash each inode once
+            inode = (st.st_dev, st.st_ino)
+            if inode in inode_paths:
+                links.setdefault(inode_paths[inode], []).append(relative_path)
+                continue
+            inode_paths[inode] = relative_path
+            key = f"{st.st_dev}:{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"
+            by_size.setdefault(st.st_size, []).append((relative_path, path, key, st.st_size))
+        
+        # Only files that still share a size with another file are hashed or kept in the cache
+        old_cache = self._load_hash_cache()
+        same_size = [entries for entries in by_size.values() if len(entries) > 1]
+        cache = {entry[2]: old_cache[entry[2]] for entries in same_size for entry in entries if entry[2] in old_cache}
+        
+        groups = self._refine_groups(same_size, 'partial', cache)
+        # Up to 128 KB the partial hash already covers the whole file
+        confirmed = [group for group in groups if group[0][3] <= 2 * PARTIAL_HASH_BYTES]
+        confirmed += self._refine_groups(
+            [group for group in groups if group[0][3] > 2 * PARTIAL_HASH_BYTES], 'full', cache
+        )
+        self._save_hash_cache(cache)
+        
+        results = []
+        for group in sorted(confirmed, key=lambda group: (-group[0][3], min(entry[0] for entry in group))):
+            size = group[0][3]
+            copies = [[entry[0]] + links.get(entry[0], []) for entry in group]
+            # Keep a preserved copy if there is one, otherwise the shallowest path
+            copies.sort(key=lambda paths: (not any(map(self._is_preserved, paths)), paths[0].count(os.sep), paths[0]))
             
-            for file in files:
-                file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(file_path, directory)
-                
-                # Skip files in virtual environments
-                if any(skip_dir in relative_path for skip_dir in skip_dirs):
-                    continue
-                
-                if self._is_preserved(relative_path):
-                    results['preserved'].append(relative_path)
-                elif self._should_auto_remove(relative_path):
-                    results['auto_remove'].append(relative_path)
-                elif self._should_mark_for_review(relative_path):
-                    results['mark_for_review'].append(relative_path)
+            duplicates, reclaimable = [], 0
+            for paths in copies[1:]:
+                removable = [p for p in paths if not self._is_preserved(p)]
+                duplicates.extend(removable)
+                # Space is only freed once every link to the inode is gone
+                if len(removable) == len(paths):
+                    reclaimable += size
+            results.append({
+                'size': size,
+                'keep': copies[0][0],
+                'duplicates': duplicates,
+                'reclaimable_bytes': reclaimable,
+            })
+        
+        return {
+            'groups': results,
+            'duplicate_files': sum(len(group['duplicates']) for group in results),
+            'reclaimable_bytes': sum(group['reclaimable_bytes'] for group in results),
+        }
+    
+    def cleanup_duplicates(self, directory: str = ".", dry_run: bool = False, action: Optional[str] = None) -> Dict:
+        """Mark or archive every duplicate except the copy kept in each group."""
+        self.logger.info("🔍 Scanning for duplicate files...")
+        action = action or self.duplicates_config.get('action', 'mark')
+        report = self.find_duplicates(directory)
+        
+        for group in report['groups']:
+            for relative_path in group['duplicates']:
+                file_path = os.path.join(directory, relative_path)
+                if dry_run:
+                    self.logger.info(f"🔍 Would {action} duplicate: {file_path} (same as {group['keep']})")
+                elif action == 'archive':
+                    self._archive_file(file_path)
                 else:
-                    results['unknown'].append(relative_path)
+                    self._mark_file(file_path, reason=f"Duplicate of {group['keep']}")
         
-        return results
+        self.logger.info(
+            f"♻️  {report['duplicate_files']} duplicate files in {len(report['groups'])} groups, "
+            f"{report['reclaimable_bytes'] / (1024 * 1024):.1f} MB reclaimable"
+        )
+        self._save_duplicate_report(report, dry_run, action)
+        return report
+    
+    def _save_duplicate_report(self, report: Dict, dry_run: bool, action: str):
+        """Save duplicate groups to the duplicates report file."""
+        try:
+            report_file = self.duplicates_config.get('report_file', 'logs/duplicates_report.md')
+            Path(report_file).parent.mkdir(parents=True, exist_ok=True)
+            
+            with open(report_file, 'w') as f:
+                f.write(f"# ♻️ Duplicate Files - {datetime.now().isoformat()}\n\n")
+                f.write(f"**Mode**: {'Dry Run' if dry_run else 'Live Cleanup'} ({action})\n\n")
+                f.write(f"- **Duplicate groups**: {len(report['groups'])}\n")
+                f.write(f"- **Duplicate files**: {report['duplicate_files']}\n")
+                f.write(f"- **Reclaimable**: {report['reclaimable_bytes']:,} bytes\n\n")
+                
+                for group in report['groups']:
+                    if not group['duplicates']:
+                        continue
+                    f.write(f"## `{group['keep']}` ({group['size']:,} bytes)\n\n")
+                    for file in group['duplicates']:
+                        f.write(f"- `{file}`\n")
+                    f.write("\n")
+            
+            self.logger.info(f"📄 Duplicate report saved to: {report_file}")
+        except Exception as e:
+            self.logger.error(f"❌ Failed to save duplicate report: {e}")
     
     def cleanup_files(self, dry_run: bool = False) -> Dict:
         """Perform cleanup operations."""
@@ -349,12 +634,17 @@ def main():
     parser.add_argument('--dry-run', action='store_true', help='Show what would be cleaned without making changes')
     parser.add_argument('--interactive', action='store_true', help='Interactive mode with user confirmation')
     parser.add_argument('--config', default='automation/tools/cleanup/cleanup_config.yaml', help='Path to config file')
+    parser.add_argument('--no-cache', action='store_true', help='Rescan every directory instead of reusing unchanged listings')
+    parser.add_argument('--duplicates', action='store_true', help='Find duplicate files and mark or archive the extra copies')
+    parser.add_argument('--duplicate-action', choices=['mark', 'archive'], help='What to do with duplicates (default from config)')
     
     args = parser.parse_args()
     
-    cleanup = AutomatedCleanup(args.config)
+    cleanup = AutomatedCleanup(args.config, use_cache=False if args.no_cache else None)
     
-    if args.interactive:
+    if args.duplicates:
+        cleanup.cleanup_duplicates(dry_run=args.dry_run, action=args.duplicate_action)
+    elif args.interactive:
         cleanup.interactive_cleanup()
     else:
         summary = cleanup.cleanup_files(dry_run=args.dry_run)
@@ -6,9 +6,13 @@ Automated reminder system for task management and system maintenance.
 
 import os
 import json
+import heapq
+import signal
 import argparse
 import logging
+import threading
 import subprocess
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -18,6 +22,12 @@ import yaml
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Reminder types that the daemon moves to their next occurrence instead of retiring
+RECURRING_PERIODS = {
+    "daily": timedelta(days=1),
+    "weekly": timedelta(weeks=1),
+}
+
 class ReminderSystem:
     """Manage reminders for tasks and system maintenance."""
     
@@ -97,6 +107,8 @@ class ReminderSystem:
     def add_reminder(self, title: str, message: str, due_date: str, 
                     priority: str = "medium", reminder_type: str = "task") -> str:
         """Add a new reminder."""
+        # Start from the file so reminders fired by a running daemon are kept
+        self.reminders = self._load_reminders()
         reminder_id = f"reminder_{len(self.reminders) + 1:03d}"
         
         reminder = {
@@ -213,7 +225,7 @@ class ReminderSystem:
 
 ---
 """
-        
+
         # Append to file
         with open(notification_file, 'a') as f:
             f.write(notification)
@@ -262,7 +274,11 @@ class ReminderSystem:
                 )
                 reminder['notified'] = True
         
-        # Check pending high-priority tasks
+        self._notify_pending_tasks()
+        self._save_reminders()
+    
+    def _notify_pending_tasks(self) -> None:
+        """Notify when pending high-priority tasks reach the configured threshold."""
         task_info = self.check_pending_tasks()
         if not task_info.get('error'):
             high_priority_count = task_info.get('high_priority_pending', 0)
@@ -274,9 +290,128 @@ class ReminderSystem:
                     message=f"You have {high_priority_count} high-priority tasks pending. Consider reviewing them soon.",
                     priority="high"
                 )
+    
+    def _file_signature(self, path) -> Optional[tuple]:
+        """(mtime, size) of a file, or None if it does not exist."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _task_check_interval(self) -> Optional[float]:
+        """Seconds between pending-task checks in daemon mode, or None if disabled."""
+        overdue_config = self.config.get('reminders', {}).get('overdue_tasks', {})
+        if not overdue_config.get('enabled', True):
+            return None
+        return float(overdue_config.get('check_interval_hours', 24)) * 3600
+    
+    def _build_due_heap(self) -> List[tuple]:
+        """Min-heap of (due timestamp, index) for reminders that have not fired yet."""
+        heap = []
+        for index, reminder in enumerate(self.reminders):
+            if reminder.get("completed") or reminder.get("notified"):
+                continue
+            try:
+                due = datetime.fromisoformat(reminder["due_date"]).timestamp()
+            except (KeyError, TypeError, ValueError):
+                logger.warning(f"Invalid due date format: {reminder.get('due_date')}")
+                continue
+            heap.append((due, index))
+        heapq.heapify(heap)
+        return heap
+    
+    def _fire_reminder(self, reminder: Dict) -> Optional[float]:
+        """Notify a due reminder. Recurring ones move to their next occurrence, whose timestamp is returned."""
+        self.send_notification(
+            title=reminder['title'],
+            message=reminder['message'],
+            priority=reminder.get('priority', 'medium')
+        )
+        
+        period = RECURRING_PERIODS.get(reminder.get("type"))
+        if period is None:
+            reminder['notified'] = True
+            return None
         
+        due_date = datetime.fromisoformat(reminder["due_date"])
+        now = datetime.now()
+        while due_date <= now:
+            due_date += period
+        reminder["due_date"] = due_date.isoformat()
+        return due_date.timestamp()
+    
+    def _merge_fired_reminders(self, fired: Dict[str, Dict]) -> None:
+        """Reload the reminders file and save it with the fired reminders' updates, keeping concurrent additions."""
+        reminders = self._load_reminders()
+        for reminder in reminders:
+            update = fired.get(reminder.get('id'))
+            if update:
+                reminder['notified'] = update['notified']
+                reminder['due_date'] = update['due_date']
+        self.reminders = reminders
         self._save_reminders()
     
+    def run_daemon(self, poll_interval: float = 1.0) -> None:
+        """Fire reminders at their due time until interrupted, reloading the reminder and config files when they change."""
+        stop = threading.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda signum, frame: stop.set())
+        
+        reminders_signature = self._file_signature(self.reminders_file)
+        config_signature = self._file_signature(self.config_path)
+        heap = self._build_due_heap()
+        task_interval = self._task_check_interval()
+        next_task_check = time.time() if task_interval else None
+        logger.info(f"Reminder daemon started with {len(heap)} pending reminders")
+        
+        while not stop.is_set():
+            # Pick up reminders added by the CLI or edited by hand
+            signature = self._file_signature(self.reminders_file)
+            if signature != reminders_signature:
+                reminders_signature = signature
+                self.reminders = self._load_reminders()
+                heap = self._build_due_heap()
+                logger.info(f"Reminders reloaded: {len(heap)} pending")
+            
+            signature = self._file_signature(self.config_path)
+            if signature != config_signature:
+                config_signature = signature
+                self.config = self._load_config()
+                task_interval = self._task_check_interval()
+                next_task_check = time.time() if task_interval else None
+                logger.info("Configuration reloaded")
+            
+            now = time.time()
+            fired = {}
+            while heap and heap[0][0] <= now:
+                _, index = heapq.heappop(heap)
+                reminder = self.reminders[index]
+                next_due = self._fire_reminder(reminder)
+                if next_due is not None:
+                    heapq.heappush(heap, (next_due, index))
+                fired[reminder.get('id')] = reminder
+            
+            if fired:
+                # Merge into the file as it is now so a concurrent --add is not overwritten
+                self._merge_fired_reminders(fired)
+                reminders_signature = self._file_signature(self.reminders_file)
+                heap = self._build_due_heap()
+            
+            if next_task_check is not None and next_task_check <= now:
+                self._notify_pending_tasks()
+                next_task_check = now + task_interval
+            
+            # Sleep until the next due time, waking at least every poll_interval to check for edits
+            wake_at = now + poll_interval
+            if heap:
+                wake_at = min(wake_at, heap[0][0])
+            if next_task_check is not None:
+                wake_at = min(wake_at, next_task_check)
+            stop.wait(max(0.0, wake_at - time.time()))
+        
+        logger.info("Reminder daemon stopped")
+    
     def generate_reminder_report(self) -> str:
         """Generate a reminder status report."""
         overdue = self.check_overdue_reminders()
@@ -331,6 +466,8 @@ def main():
     parser.add_argument("--check", action="store_true", help="Check for overdue reminders and pending tasks")
     parser.add_argument("--remind", action="store_true", help="Send reminder notifications")
     parser.add_argument("--report", action="store_true", help="Generate reminder report")
+    parser.add_argument("--daemon", action="store_true", help="Run continuously, firing reminders at their due time")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between checks for reminder file changes in daemon mode")
     parser.add_argument("--add", help="Add a custom reminder")
     parser.add_argument("--message", help="Reminder message")
     parser.add_argument("--due", help="Due date (YYYY-MM-DD HH:MM)")
@@ -360,6 +497,9 @@ def main():
         reminder_system.check_and_notify()
         print("Reminder notifications sent")
     
+    elif args.daemon:
+        reminder_system.run_daemon(poll_interval=args.poll_interval)
+    
     elif args.report:
         report = reminder_system.generate_reminder_report()
         print(report)
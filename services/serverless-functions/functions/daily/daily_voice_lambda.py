@@ -8,10 +8,9 @@ import json
 import os
 import base64
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, BinaryIO
 import boto3
 from botocore.exceptions import ClientError
-import requests
 import logging
 
 # Import our custom modules
@@ -20,7 +19,8 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'voice'))
 
 from voice_content_generator import VoiceContentGenerator
-from elevenlabs_tts import ElevenLabsTTS
+from elevenlabs_tts import ElevenLabsTTS, spool_size
+from telegram_voice_upload import send_voice_stream
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -61,29 +61,35 @@ class DailyVoiceBot:
                 text_content = " ".join(words[:400]) + "."
                 logger.warning("⚠️ Content truncated for free tier limits")
 
-            # Step 3: Generate speech
+            # Step 3: Stream speech into spooled parts
             logger.info("🎵 Generating speech with ElevenLabs...")
-            audio_data = self.tts.generate_speech(text_content)
+            audio_parts = self.tts.render_speech_parts(text_content)
 
-            if not audio_data:
+            if not audio_parts:
                 return {
                     'success': False,
                     'error': 'Failed to generate speech'
                 }
 
-            # Step 4: Send via Telegram
-            logger.info("📤 Sending voice message via Telegram...")
-            result = self.send_voice_message(audio_data, text_content)
+            try:
+                audio_size = sum(spool_size(part) for part in audio_parts)
+
+                # Step 4: Send via Telegram
+                logger.info("📤 Sending voice message via Telegram...")
+                result = self.send_voice_message(audio_parts, text_content)
+            finally:
+                for part in audio_parts:
+                    part.close()
 
             if result['success']:
                 # Step 5: Log success and save to database
-                self._log_voice_message(text_content, len(audio_data))
+                self._log_voice_message(text_content, audio_size)
                 logger.info("✅ Daily voice message sent successfully!")
                 return {
                     'success': True,
                     'message': 'Voice message sent successfully',
                     'word_count': len(text_content.split()),
-                    'audio_size': len(audio_data),
+                    'audio_size': audio_size,
                     'estimated_cost': self.tts.estimate_cost(text_content)
                 }
             else:
@@ -100,50 +106,21 @@ class DailyVoiceBot:
                 'error': str(e)
             }
 
-    def send_voice_message(self, audio_data: bytes, caption: str = None) -> Dict[str, Any]:
-        """Send voice message via Telegram"""
+    def send_voice_message(self, audio_parts: List[BinaryIO], caption: str = None) -> Dict[str, Any]:
+        """Stream spooled audio parts to Telegram as one voice message"""
         if not self.telegram_token or not self.telegram_chat_id:
             return {'success': False, 'error': 'Telegram credentials not configured'}
 
-        try:
-            # Prepare the voice message
-            files = {
-                'voice': ('daily_message.mp3', audio_data, 'audio/mpeg')
-            }
-
-            data = {
-                'chat_id': self.telegram_chat_id,
-                'duration': min(180, len(audio_data) // 16000),  # Rough duration estimate
-                'caption': caption[:1024] if caption else None  # Telegram caption limit
-            }
-
-            # Remove None values
-            data = {k: v for k, v in data.items() if v is not None}
-
-            response = requests.post(
-                f"{self.telegram_api_url}/sendVoice",
-                data=data,
-                files=files,
-                timeout=30
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                if result.get('ok'):
-                    logger.info(f"✅ Voice message sent, message ID: {result['result']['message_id']}")
-                    return {'success': True}
-                else:
-                    return {'success': False, 'error': result.get('description', 'Unknown error')}
-            else:
-                return {
-                    'success': False,
-                    'error': f'HTTP {response.status_code}: {response.text}'
-                }
-
-        except requests.exceptions.Timeout:
-            return {'success': False, 'error': 'Request timed out'}
-        except Exception as e:
-            return {'success': False, 'error': str(e)}
+        audio_size = sum(spool_size(part) for part in audio_parts)
+        return send_voice_stream(
+            self.telegram_token,
+            self.telegram_chat_id,
+            audio_parts,
+            caption=caption,
+            filename='daily_message.mp3',
+            duration=min(180, audio_size // 16000),  # Rough duration estimate
+            timeout=60
+        )
 
     def _log_voice_message(self, content: str, audio_size: int):
         """Log voice message details to database"""
@@ -16,6 +16,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'voice'))
 
 from voice_content_generator import VoiceContentGenerator
 from elevenlabs_tts import ElevenLabsTTS
+from telegram_voice_upload import send_voice_stream
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -108,11 +109,11 @@ class CICDVoiceOrchestrator:
 
         try:
             # Generate speech
-            audio_data = self.tts.generate_speech(message)
+            audio_parts = self.tts.render_speech_parts(message)
 
-            if audio_data:
+            if audio_parts:
                 # Send via Telegram
-                self._send_voice_message(audio_data, message[:100])  # Caption limited to 100 chars
+                self._send_voice_message(audio_parts, message[:100])  # Caption limited to 100 chars
 
                 # Also send as text for backup
                 self._send_text_message(message)
@@ -128,11 +129,11 @@ class CICDVoiceOrchestrator:
 
         try:
             # Generate speech with shorter text for faster processing
-            audio_data = self.tts.generate_speech(message)
+            audio_parts = self.tts.render_speech_parts(message)
 
-            if audio_data:
+            if audio_parts:
                 # Send via Telegram with minimal caption
-                self._send_voice_message(audio_data, message[:50])
+                self._send_voice_message(audio_parts, message[:50])
                 # Skip text backup for simplicity
             else:
                 # Fallback to text-only
@@ -142,28 +143,25 @@ class CICDVoiceOrchestrator:
             logger.error(f"Failed to send simple voice notification: {e}")
             self._send_text_message(message)
 
-    def _send_voice_message(self, audio_data: bytes, caption: str = None):
-        """Send voice message via Telegram"""
-        if not self.telegram_token or not self.telegram_chat_id:
-            return
-
+    def _send_voice_message(self, audio_parts: List[Any], caption: str = None):
+        """Stream spooled audio parts to Telegram, closing them afterwards"""
         try:
-            url = f"https://api.telegram.org/bot{self.telegram_token}/sendVoice"
-            files = {'voice': ('notification.mp3', audio_data, 'audio/mpeg')}
-            data = {'chat_id': self.telegram_chat_id}
+            if not self.telegram_token or not self.telegram_chat_id:
+                return
 
-            if caption:
-                data['caption'] = caption
+            result = send_voice_stream(self.telegram_token, self.telegram_chat_id, audio_parts,
+                                       caption=caption, filename='notification.mp3', timeout=30)
 
-            response = requests.post(url, data=data, files=files, timeout=30)
-
-            if response.status_code == 200:
+            if result['success']:
                 logger.info("✅ Voice notification sent")
             else:
-                logger.error(f"Failed to send voice: {response.status_code}")
+                logger.error(f"Failed to send voice: {result.get('error')}")
 
         except Exception as e:
             logger.error(f"Error sending voice message: {e}")
+        finally:
+            for part in audio_parts:
+                part.close()
 
     def _send_text_message(self, message: str):
         """Send text message via Telegram as backup"""
@@ -5,15 +5,24 @@ High-quality voice generation for daily messages
 """
 
 import os
+import re
 import requests
 import json
 import base64
-from typing import Optional, Dict, Any
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Keep at most this much audio per part in memory before spilling to disk
+SPOOL_MAX_MEMORY = 1024 * 1024
+# In-memory budget shared by all parts of one render; the rest spills to disk
+SPOOL_TOTAL_MEMORY = 4 * 1024 * 1024
+STREAM_CHUNK_SIZE = 16 * 1024
+
 class ElevenLabsTTS:
     def __init__(self):
         self.api_key = os.getenv('ELEVENLABS_API_KEY')
@@ -78,7 +87,8 @@ class ElevenLabsTTS:
             logger.error(f"Error generating speech: {e}")
             return None
 
-    def generate_speech_stream(self, text: str, model_id: str = "eleven_monolingual_v1"):
+    def generate_speech_stream(self, text: str, model_id: str = "eleven_monolingual_v1",
+                               previous_text: Optional[str] = None, next_text: Optional[str] = None):
         """
         Generate speech with streaming for better Lambda performance
         Returns response object for streaming
@@ -93,6 +103,12 @@ class ElevenLabsTTS:
             "voice_settings": self.voice_settings
         }
 
+        # Neighbouring text keeps intonation continuous across split parts
+        if previous_text:
+            payload["previous_text"] = previous_text
+        if next_text:
+            payload["next_text"] = next_text
+
         url = f"{self.base_url}/text-to-speech/{self.voice_id}/stream"
 
         try:
@@ -114,6 +130,85 @@ class ElevenLabsTTS:
             logger.error(f"Error in streaming speech generation: {e}")
             return None
 
+    def split_text(self, text: str, max_chars: int = 1000) -> List[str]:
+        """
+        Split long text into parts at sentence boundaries
+        Each part stays under max_chars where possible
+        """
+        sentences = [s.strip() for s in re.split(r'(?<=[.!?…])\s+|\n{2,}', text) if s.strip()]
+        parts = []
+        current = ""
+
+        for sentence in sentences:
+            if current and len(current) + len(sentence) + 1 > max_chars:
+                parts.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+
+        if current:
+            parts.append(current)
+        return parts
+
+    def stream_speech_to_spool(self, text: str, model_id: str = "eleven_monolingual_v1",
+                               previous_text: Optional[str] = None,
+                               next_text: Optional[str] = None,
+                               max_memory: int = SPOOL_MAX_MEMORY) -> Optional[tempfile.SpooledTemporaryFile]:
+        """
+        Stream speech for one part into a bounded buffer
+        Audio beyond max_memory spills to a temporary file
+        """
+        response = self.generate_speech_stream(text, model_id, previous_text, next_text)
+        if response is None:
+            return None
+
+        spool = tempfile.SpooledTemporaryFile(max_size=max_memory)
+        try:
+            with response:
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    if chunk:
+                        spool.write(chunk)
+        except Exception as e:
+            logger.error(f"Error reading speech stream: {e}")
+            spool.close()
+            return None
+
+        spool.seek(0)
+        return spool
+
+    def render_speech_parts(self, text: str, model_id: str = "eleven_monolingual_v1",
+                            max_chars: int = 1000, max_workers: int = 2) -> Optional[List[tempfile.SpooledTemporaryFile]]:
+        """
+        Render long text as ordered streamed audio parts
+        Parts are generated concurrently; together they form one MP3 stream.
+        All parts are buffered before returning, with at most SPOOL_TOTAL_MEMORY
+        held in memory across them
+        """
+        parts = self.split_text(text, max_chars)
+        if not parts:
+            return None
+
+        logger.info(f"🎵 Streaming speech for {len(text)} characters in {len(parts)} parts")
+        max_memory = min(SPOOL_MAX_MEMORY, SPOOL_TOTAL_MEMORY // len(parts))
+
+        def render(index: int):
+            previous_text = parts[index - 1] if index > 0 else None
+            next_text = parts[index + 1] if index + 1 < len(parts) else None
+            return self.stream_speech_to_spool(parts[index], model_id, previous_text, next_text, max_memory)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            spools = list(executor.map(render, range(len(parts))))
+
+        if any(spool is None for spool in spools):
+            for spool in spools:
+                if spool is not None:
+                    spool.close()
+            return None
+
+        total = sum(spool_size(spool) for spool in spools)
+        logger.info(f"✅ Streamed audio: {total} bytes")
+        return spools
+
     def get_voices(self) -> Optional[Dict[str, Any]]:
         """Get available voices from ElevenLabs"""
         if not self.api_key:
@@ -155,6 +250,14 @@ class ElevenLabsTTS:
             return False
         return True
 
+def spool_size(spool) -> int:
+    """Size of a rewound spool without reading it"""
+    position = spool.tell()
+    spool.seek(0, os.SEEK_END)
+    size = spool.tell()
+    spool.seek(position)
+    return size
+
 def lambda_handler(event, context):
     """AWS Lambda handler for ElevenLabs TTS"""
     tts = ElevenLabsTTS()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Streaming Telegram voice upload
+Sends spooled audio parts to sendVoice without loading them into memory
+"""
+
+import os
+import uuid
+from typing import Any, Dict, List, Optional, BinaryIO
+import logging
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_BLOCK_SIZE = 64 * 1024
+
+
+class MultipartStream:
+    """
+    File-like multipart/form-data body
+    Reads form fields and audio parts sequentially, so the upload streams
+    with a known Content-Length and constant memory
+    """
+
+    def __init__(self, fields: Dict[str, Any], file_field: str, filename: str,
+                 content_type: str, parts: List[BinaryIO]):
+        self.boundary = uuid.uuid4().hex
+        self._segments = []
+
+        preamble = b""
+        for name, value in fields.items():
+            preamble += (
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                f"{value}\r\n"
+            ).encode('utf-8')
+        preamble += (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode('utf-8')
+        epilogue = f"\r\n--{self.boundary}--\r\n".encode('utf-8')
+
+        self._length = len(preamble) + len(epilogue)
+        self._segments.append(_BytesSegment(preamble))
+        for part in parts:
+            part.seek(0, os.SEEK_END)
+            self._length += part.tell()
+            part.seek(0)
+            self._segments.append(part)
+        self._segments.append(_BytesSegment(epilogue))
+        self._index = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = UPLOAD_BLOCK_SIZE
+        while self._index < len(self._segments):
+            data = self._segments[self._index].read(size)
+            if data:
+                return data
+            self._index += 1
+        return b""
+
+
+class _BytesSegment:
+    def __init__(self, data: bytes):
+        self._data = data
+        self._position = 0
+
+    def read(self, size: int) -> bytes:
+        chunk = self._data[self._position:self._position + size]
+        self._position += len(chunk)
+        return chunk
+
+
+def send_voice_stream(telegram_token: str, chat_id: str, parts: List[BinaryIO],
+                      caption: Optional[str] = None, filename: str = "voice.mp3",
+                      duration: Optional[int] = None, timeout: int = 60) -> Dict[str, Any]:
+    """Send ordered audio parts as one Telegram voice message"""
+    fields = {'chat_id': chat_id}
+    if caption:
+        fields['caption'] = caption[:1024]  # Telegram caption limit
+    if duration:
+        fields['duration'] = duration
+
+    body = MultipartStream(fields, 'voice', filename, 'audio/mpeg', parts)
+
+    try:
+        response = requests.post(
+            f"https://api.telegram.org/bot{telegram_token}/sendVoice",
+            data=body,
+            headers={'Content-Type': body.content_type, 'Content-Length': str(len(body))},
+            timeout=timeout
+        )
+
+        if response.status_code == 200:
+            result = response.json()
+            if result.get('ok'):
+                logger.info(f"✅ Voice message sent, message ID: {result['result']['message_id']}")
+                return {'success': True, 'size_bytes': len(body)}
+            return {'success': False, 'error': result.get('description', 'Unknown error')}
+
+        return {'success': False, 'error': f'HTTP {response.status_code}: {response.text}'}
+
+    except requests.exceptions.Timeout:
+        return {'success': False, 'error': 'Request timed out'}
+    except Exception as e:
+        return {'success': False, 'error': str(e)}
@@ -5,25 +5,17 @@ Handles bot initialization, command routing, and core functionality.
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import Dict, Any
 from telegram import Update
-from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
+from telegram.ext import Application, CallbackQueryHandler, CommandHandler, MessageHandler, filters, ContextTypes
 
-from bot.handlers import (
-    basic_handlers,
-    daily_handlers,
-    shadow_work_handlers,
-    journal_handlers,
-    system_handlers,
-    ai_handlers,
-    menu_handlers,
-    voice_handlers,
-    automation_handlers,
-    clickup_handlers
-)
+from bot.handler_registry import LazyHandlerRegistry
 from bot.middleware.auth_middleware import AuthMiddleware
 from integrations.personal_system import PersonalSystemIntegration
+from utils.handler_metrics import HandlerMetrics, callback_metric_name
+from utils.import_profiler import log_startup_profile
 from utils.logger import get_logger, log_command
 
 
@@ -35,24 +27,30 @@ class PersonalSystemBot:
         self.logger = get_logger(__name__)
         self.application = None
         self.personal_system = PersonalSystemIntegration(config)
+        self.handlers = LazyHandlerRegistry(config)
+        self.handler_metrics = HandlerMetrics()
         
         # Bot settings
         self.bot_token = config['telegram']['bot_token']
-        self.allowed_users = config['telegram'].get('allowed_users', [])
-        self.admin_users = config['telegram'].get('admin_users', [])
+        self.allowed_users = frozenset(config['telegram'].get('allowed_users') or ())
+        self.admin_users = frozenset(config['telegram'].get('admin_users') or ())
+        
+        # Initialize handlers before registering them
+        self._initialize_handlers()
         
         # Initialize bot
         self._setup_bot()
-        
-        # Initialize handlers
-        self._initialize_handlers()
     
     def _setup_bot(self):
         """Setup the Telegram bot application."""
         self.application = Application.builder().token(self.bot_token).build()
         
         # Create middleware instance
-        self.auth_middleware = AuthMiddleware(self.allowed_users, self.admin_users)
+        self.auth_middleware = AuthMiddleware(
+            self.allowed_users,
+            self.admin_users,
+            rate_limits=self.config['telegram'].get('rate_limits')
+        )
         
         # Register command handlers
         self._register_handlers()
@@ -61,83 +59,95 @@ class PersonalSystemBot:
         self.application.add_error_handler(self._error_handler)
     
     def _initialize_handlers(self):
-        """Initialize handler instances with config."""
-        # Initialize voice handler
-        voice_handlers.initialize_voice_handler(self.config)
+        """Declare per-module initializers; they run when a module is first used."""
+        # Automation is cheap and shared with the menu and voice handlers
+        self.handlers.on_import("automation_handlers", "initialize_automation_handler")
+        self.handlers.module("automation_handlers")
         
-        # Initialize automation handler
-        automation_handlers.initialize_automation_handler(self.config)
+        # Heavy clients (OpenAI, transcription services) are built on first use
+        self.handlers.on_import("voice_handlers", "initialize_voice_handler")
+        self.handlers.on_import("serverless_voice_handlers", "initialize_voice_handler")
+        self.handlers.on_import("dual_voice_handlers", "initialize_voice_handler")
+        self.handlers.on_import("ai_handlers", "initialize_ai_handler")
+    
+    def _add_command(self, command: str, ref: str, rate_class: str = "cheap"):
+        """Register a command whose handler module is imported on first use."""
+        self.application.add_handler(CommandHandler(
+            command, self._with_auth(self.handlers.handler(ref), rate_class, f"/{command}")
+        ))
     
     def _register_handlers(self):
         """Register all command handlers."""
         
         # Basic commands
-        self.application.add_handler(CommandHandler("start", self._with_auth(basic_handlers.start_command)))
-        self.application.add_handler(CommandHandler("help", self._with_auth(basic_handlers.help_command)))
-        self.application.add_handler(CommandHandler("status", self._with_auth(basic_handlers.status_command)))
-        self.application.add_handler(CommandHandler("menu", self._with_auth(basic_handlers.menu_command)))
+        self._add_command("start", "basic_handlers:start_command")
+        self._add_command("help", "basic_handlers:help_command")
+        self._add_command("status", "basic_handlers:status_command")
+        self._add_command("menu", "basic_handlers:menu_command")
         
         # Daily operations
-        self.application.add_handler(CommandHandler("summary", self._with_auth(daily_handlers.summary_command)))
-        self.application.add_handler(CommandHandler("log_health", self._with_auth(daily_handlers.log_health_command)))
-        self.application.add_handler(CommandHandler("log_learning", self._with_auth(daily_handlers.log_learning_command)))
-        self.application.add_handler(CommandHandler("quick_note", self._with_auth(daily_handlers.quick_note_command)))
-        self.application.add_handler(CommandHandler("morning_routine", self._with_auth(daily_handlers.morning_routine_command)))
+        self._add_command("summary", "daily_handlers:summary_command")
+        self._add_command("log_health", "daily_handlers:log_health_command")
+        self._add_command("log_learning", "daily_handlers:log_learning_command")
+        self._add_command("quick_note", "daily_handlers:quick_note_command")
+        self._add_command("morning_routine", "daily_handlers:morning_routine_command")
         
         # Shadow work
-        self.application.add_handler(CommandHandler("shadow_checkin", self._with_auth(shadow_work_handlers.shadow_checkin_command)))
-        self.application.add_handler(CommandHandler("shadow_log", self._with_auth(shadow_work_handlers.shadow_log_command)))
-        self.application.add_handler(CommandHandler("shadow_prompt", self._with_auth(shadow_work_handlers.shadow_prompt_command)))
-        self.application.add_handler(CommandHandler("shadow_report", self._with_auth(shadow_work_handlers.shadow_report_command)))
-        self.application.add_handler(CommandHandler("shadow_reminders", self._with_auth(shadow_work_handlers.shadow_reminders_command)))
-        self.application.add_handler(CommandHandler("shadow_focus", self._with_auth(shadow_work_handlers.shadow_focus_command)))
+        self._add_command("shadow_checkin", "shadow_work_handlers:shadow_checkin_command")
+        self._add_command("shadow_log", "shadow_work_handlers:shadow_log_command")
+        self._add_command("shadow_prompt", "shadow_work_handlers:shadow_prompt_command")
+        self._add_command("shadow_report", "shadow_work_handlers:shadow_report_command")
+        self._add_command("shadow_reminders", "shadow_work_handlers:shadow_reminders_command")
+        self._add_command("shadow_focus", "shadow_work_handlers:shadow_focus_command")
         
         # Journal and notes
-        self.application.add_handler(CommandHandler("journal", self._with_auth(journal_handlers.journal_command)))
-        self.application.add_handler(CommandHandler("idea", self._with_auth(journal_handlers.idea_command)))
-        self.application.add_handler(CommandHandler("task", self._with_auth(journal_handlers.task_command)))
+        self._add_command("journal", "journal_handlers:journal_command")
+        self._add_command("idea", "journal_handlers:idea_command")
+        self._add_command("task", "journal_handlers:task_command")
         
         # System management
-        self.application.add_handler(CommandHandler("backup", self._with_auth(system_handlers.backup_command)))
-        self.application.add_handler(CommandHandler("sync", self._with_auth(system_handlers.sync_command)))
-        self.application.add_handler(CommandHandler("stats", self._with_auth(system_handlers.stats_command)))
-        self.application.add_handler(CommandHandler("tasks", self._with_auth(system_handlers.tasks_command)))
+        self._add_command("backup", "system_handlers:backup_command")
+        self._add_command("sync", "system_handlers:sync_command")
+        self._add_command("stats", "system_handlers:stats_command")
+        self._add_command("tasks", "system_handlers:tasks_command")
         
         # ClickUp integration
-        self.application.add_handler(CommandHandler("clickup", self._with_auth(clickup_handlers.clickup_command)))
-        self.application.add_handler(CommandHandler("project_create", self._with_auth(clickup_handlers.project_create_command)))
-        self.application.add_handler(CommandHandler("task_add", self._with_auth(clickup_handlers.task_add_command)))
-        self.application.add_handler(CommandHandler("upload_doc", self._with_auth(clickup_handlers.upload_doc_command)))
-        self.application.add_handler(CommandHandler("comment_add", self._with_auth(clickup_handlers.comment_add_command)))
+        self._add_command("clickup", "clickup_handlers:clickup_command")
+        self._add_command("project_create", "clickup_handlers:project_create_command")
+        self._add_command("task_add", "clickup_handlers:task_add_command")
+        self._add_command("upload_doc", "clickup_handlers:upload_doc_command")
+        self._add_command("comment_add", "clickup_handlers:comment_add_command")
         
         # AI-powered commands
-        self.application.add_handler(CommandHandler("chat", self._with_auth(ai_handlers.chat_command)))
-        self.application.add_handler(CommandHandler("analyze", self._with_auth(ai_handlers.analyze_command)))
-        self.application.add_handler(CommandHandler("recommend", self._with_auth(ai_handlers.recommend_command)))
-        self.application.add_handler(CommandHandler("question", self._with_auth(ai_handlers.question_command)))
+        self._add_command("chat", "ai_handlers:chat_command", "llm")
+        self._add_command("analyze", "ai_handlers:analyze_command", "llm")
+        self._add_command("recommend", "ai_handlers:recommend_command", "llm")
+        self._add_command("question", "ai_handlers:question_command", "llm")
         
         # Voice message handler - choose between serverless and local dual services
         serverless_config = self.config.get('serverless', {})
         if serverless_config.get('enable_serverless_transcription', False):
-            from bot.handlers import serverless_voice_handlers
-            serverless_voice_handlers.initialize_voice_handler(self.config)
-            self.application.add_handler(MessageHandler(filters.VOICE, self._with_auth(serverless_voice_handlers.voice_message_handler)))
+            voice_ref = "serverless_voice_handlers:voice_message_handler"
         else:
-            from bot.handlers import dual_voice_handlers
-            dual_voice_handlers.initialize_voice_handler(self.config)
-            self.application.add_handler(MessageHandler(filters.VOICE, self._with_auth(dual_voice_handlers.voice_message_handler)))
+            voice_ref = "dual_voice_handlers:voice_message_handler"
+        self.application.add_handler(MessageHandler(filters.VOICE, self._with_auth(self.handlers.handler(voice_ref), "voice", "message:voice")))
         
         # General text message handler (for conversational AI)
-        self.application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self._with_auth(ai_handlers.text_message_handler)))
+        self.application.add_handler(MessageHandler(
+            filters.TEXT & ~filters.COMMAND,
+            self._with_auth(self.handlers.handler("ai_handlers:text_message_handler"), "llm", "message:text")
+        ))
         
         # Callback query handler for inline keyboards
-        from telegram.ext import CallbackQueryHandler
-        self.application.add_handler(CallbackQueryHandler(self._with_auth(menu_handlers.handle_callback_query)))
+        self.application.add_handler(CallbackQueryHandler(
+            self._with_auth(self.handlers.handler("menu_handlers:handle_callback_query"))
+        ))
         
         # Admin commands
         if self.admin_users:
-            self.application.add_handler(CommandHandler("admin", self._with_auth(system_handlers.admin_command)))
-            self.application.add_handler(CommandHandler("test_notification", self._with_auth(system_handlers.test_notification_command)))
+            self._add_command("admin", "system_handlers:admin_command")
+            self._add_command("test_notification", "system_handlers:test_notification_command")
+            self._add_command("voice_stats", "system_handlers:voice_stats_command")
     
     async def _error_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle errors in the bot."""
@@ -159,6 +169,8 @@ class PersonalSystemBot:
         await self.application.updater.start_polling()
         
         self.logger.info("Bot started successfully!")
+        log_startup_profile(self.logger)
+        self.handler_metrics.start_loop_probe()
         
         # Send startup notification to admin users
         await self._send_startup_notification()
@@ -174,6 +186,8 @@ class PersonalSystemBot:
     
     async def stop(self):
         """Stop the bot."""
+        await self.handler_metrics.stop_loop_probe()
+        
         if self.application:
             await self.application.updater.stop()
             await self.application.stop()
@@ -257,11 +271,28 @@ The bot will be back online shortly! 🔄
         """Check if user is an admin."""
         return user_id in self.admin_users
     
-    def _with_auth(self, handler_func):
-        """Wrapper to add authentication to handlers."""
+    def _with_auth(self, handler_func, rate_class: str = "cheap", metric_name: str = None):
+        """Wrapper to add authentication, rate limiting and latency metrics to handlers.
+        
+        Without a ``metric_name`` (callback queries) the name is taken from the
+        callback data.
+        """
         async def wrapped_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
-            # Run authentication middleware
-            await self.auth_middleware(update, context)
-            # Call the original handler
-            return await handler_func(update, context)
+            # Run authentication middleware; stop if the user is denied or throttled
+            if not await self.auth_middleware(update, context, rate_class):
+                return None
+            
+            # Call the original handler, recording its latency and failures
+            name = metric_name or callback_metric_name(update)
+            started = time.perf_counter()
+            failed = False
+            try:
+                return await handler_func(update, context)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                failed = True
+                raise
+            finally:
+                self.handler_metrics.observe(name, time.perf_counter() - started, failed)
         return wrapped_handler
@@ -0,0 +1,62 @@
+"""
+Lazy handler registry for the Personal System Telegram Bot.
+
+Handlers are registered by name (``"module:function"``) and their modules are
+only imported the first time an update reaches them, so integrations that are
+never used (OpenAI, ClickUp, n8n, ...) never slow down startup.
+"""
+
+from types import ModuleType
+from typing import Any, Awaitable, Callable, Dict, List
+
+from telegram import Update
+from telegram.ext import ContextTypes
+
+from utils.import_profiler import import_module
+from utils.logger import get_logger
+
+
+HandlerFunc = Callable[[Update, ContextTypes.DEFAULT_TYPE], Awaitable[Any]]
+
+
+class LazyHandlerRegistry:
+    """Resolves handler references to functions, importing modules on first use."""
+
+    def __init__(self, config: Dict[str, Any], package: str = "bot.handlers"):
+        self.config = config
+        self.package = package
+        self.logger = get_logger(__name__)
+        self._modules: Dict[str, ModuleType] = {}
+        self._initializers: Dict[str, str] = {}
+
+    def on_import(self, module_name: str, initializer: str):
+        """Call ``module.initializer(config)`` when the module is first loaded."""
+        self._initializers[module_name] = initializer
+
+    def module(self, module_name: str) -> ModuleType:
+        """Import a handler module, running its initializer once."""
+        module = self._modules.get(module_name)
+        if module is None:
+            module = import_module(f"{self.package}.{module_name}")
+            initializer = self._initializers.get(module_name)
+            if initializer:
+                getattr(module, initializer)(self.config)
+            self._modules[module_name] = module
+            self.logger.info(f"Loaded handler module {module_name}")
+        return module
+
+    def resolve(self, ref: str) -> HandlerFunc:
+        module_name, func_name = ref.split(":", 1)
+        return getattr(self.module(module_name), func_name)
+
+    def handler(self, ref: str) -> HandlerFunc:
+        """An async handler that imports and calls ``ref`` on first use."""
+        async def lazy_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
+            return await self.resolve(ref)(update, context)
+
+        lazy_handler.__qualname__ = lazy_handler.__name__ = ref.replace(":", ".")
+        return lazy_handler
+
+    @property
+    def loaded_modules(self) -> List[str]:
+        return list(self._modules)
@@ -13,6 +13,20 @@ from telegram.ext import ContextTypes
 from utils.logger import get_logger, log_command
 from integrations.ai_assistant import AIAssistant
 from integrations.personal_system import PersonalSystemIntegration
+from utils.telegram_streaming import stream_reply
+
+
+# Shared assistant so the LLM client is built once
+ai_assistant = None
+
+def initialize_ai_handler(config: Dict[str, Any]):
+    """Initialize the shared AI assistant with config."""
+    global ai_assistant
+    ai_assistant = AIAssistant(config)
+
+
+def _get_ai_assistant() -> AIAssistant:
+    return ai_assistant or AIAssistant({})
 
 
 async def chat_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -48,11 +62,8 @@ async def chat_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
     
     try:
-        # Get AI response
-        ai_assistant = AIAssistant({})
-        response = await ai_assistant.get_response(message_text, user_id)
-        
-        await update.message.reply_text(response, parse_mode='Markdown')
+        # Stream the AI response into the reply as it is generated
+        await stream_reply(update.message, _get_ai_assistant().stream_response(message_text, user_id))
         
     except Exception as e:
         get_logger(__name__).error(f"Error in AI chat: {e}")
@@ -108,7 +119,7 @@ async def voice_message_handler(update: Update, context: ContextTypes.DEFAULT_TY
             f"🤖 **AI Response:**\n\n{response}",
             parse_mode='Markdown'
         )
-        
+    
     except Exception as e:
         get_logger(__name__).error(f"Error processing voice message: {e}")
         await update.message.reply_text(
@@ -150,7 +161,7 @@ async def analyze_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         analysis = await ai_assistant.analyze_data(message_text, user_id)
         
         await update.message.reply_text(analysis, parse_mode='Markdown')
-        
+    
     except Exception as e:
         get_logger(__name__).error(f"Error in data analysis: {e}")
         await update.message.reply_text(
@@ -192,7 +203,7 @@ async def recommend_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         recommendations = await ai_assistant.get_recommendations(message_text, user_id)
         
         await update.message.reply_text(recommendations, parse_mode='Markdown')
-        
+    
     except Exception as e:
         get_logger(__name__).error(f"Error getting recommendations: {e}")
         await update.message.reply_text(
@@ -233,7 +244,7 @@ async def question_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         answer = await ai_assistant.answer_question(message_text, user_id)
         
         await update.message.reply_text(answer, parse_mode='Markdown')
-        
+    
     except Exception as e:
         get_logger(__name__).error(f"Error answering question: {e}")
         await update.message.reply_text(
@@ -253,11 +264,8 @@ async def text_message_handler(update: Update, context: ContextTypes.DEFAULT_TYP
     await context.bot.send_chat_action(chat_id=update.effective_chat.id, action="typing")
     
     try:
-        # Get AI response
-        ai_assistant = AIAssistant({})
-        response = await ai_assistant.get_response(message_text, user_id)
-        
-        await update.message.reply_text(response, parse_mode='Markdown')
+        # Stream the AI response into the reply as it is generated
+        await stream_reply(update.message, _get_ai_assistant().stream_response(message_text, user_id))
         
     except Exception as e:
         get_logger(__name__).error(f"Error in text message handling: {e}")
@@ -14,6 +14,8 @@ from telegram import Update
 from telegram.ext import ContextTypes
 from openai import OpenAI
 
+from utils.voice_tracing import VoiceTrace, get_voice_tracer
+
 logger = logging.getLogger(__name__)
 
 class DualVoiceHandler:
@@ -51,6 +53,8 @@ class DualVoiceHandler:
         
         if not self.elevenlabs_available and not self.openai_available:
             self.logger.error("No transcription services configured")
+        
+        self.tracer = get_voice_tracer()
     
     def _detect_language(self, text: str) -> str:
         """Detect if text is Russian or English. Only supports these two languages."""
@@ -82,6 +86,15 @@ class DualVoiceHandler:
     
     async def handle_voice_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle incoming voice messages with dual transcription services."""
+        trace = self.tracer.start_trace(update.effective_user.id if update.effective_user else None)
+        ok = False
+        try:
+            ok = await self._handle_voice_message(update, context, trace)
+        finally:
+            trace.finish(ok)
+    
+    async def _handle_voice_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE, trace: VoiceTrace) -> bool:
+        """Run the voice pipeline, timing each stage as a span of ``trace``. Returns False on failure."""
         try:
             voice = update.message.voice
             user_id = update.effective_user.id
@@ -94,13 +107,14 @@ class DualVoiceHandler:
                 await processing_msg.edit_text(
                     "❌ Voice transcription not available. Please configure ElevenLabs or OpenAI API key in settings."
                 )
-                return
+                return False
             
             # Download voice file
-            voice_file = await context.bot.get_file(voice.file_id)
+            with trace.span("download", "get_file"):
+                voice_file = await context.bot.get_file(voice.file_id)
             
             # Transcribe using dual services
-            result = await self._transcribe_voice(voice_file, voice.mime_type or 'audio/ogg')
+            result = await self._transcribe_voice(voice_file, voice.mime_type or 'audio/ogg', trace)
             
             if not result or not result.get('transcription'):
                 await processing_msg.edit_text(
@@ -110,11 +124,13 @@ class DualVoiceHandler:
                     "• Sending a shorter message\n"
                     "• Using text instead"
                 )
-                return
+                return False
             
             transcription = result['transcription']
             service = result.get('service', 'unknown')
-            detected_language = self._detect_language(transcription)
+            with trace.span("language_detection") as span:
+                detected_language = self._detect_language(transcription)
+                span.detail = detected_language
             
             # Handle unsupported languages
             if detected_language == 'unsupported':
@@ -125,7 +141,7 @@ class DualVoiceHandler:
                     f"*Transcription:* \"{transcription}\"",
                     parse_mode='Markdown'
                 )
-                return
+                return True
             
             # Show transcription with service indicator and language
             language_emoji = "🇷🇺" if detected_language == 'ru' else "🇺🇸" if detected_language == 'en' else "🌍"
@@ -138,22 +154,29 @@ class DualVoiceHandler:
             await processing_msg.edit_text(f"{service_indicator}:\n\n\"{transcription}\"")
             
             # Process the transcription for commands with language awareness
-            await self._process_transcription(update, context, transcription, detected_language)
+            await self._process_transcription(update, context, transcription, detected_language, trace)
+            return True
             
         except Exception as e:
-            self.logger.error(f"Error handling voice message: {e}")
+            self.logger.error(f"Error handling voice message (trace {trace.trace_id}): {e}")
             await update.message.reply_text(f"❌ Error processing voice message: {str(e)}")
+            return False
     
-    async def _transcribe_voice(self, voice_file, mime_type: str) -> Optional[Dict[str, Any]]:
+    async def _transcribe_voice(self, voice_file, mime_type: str,
+                                trace: Optional[VoiceTrace] = None) -> Optional[Dict[str, Any]]:
         """Transcribe voice file using ElevenLabs Scribe with OpenAI fallback."""
+        trace = trace or self.tracer.start_trace()
         try:
             # Download to temporary file
             with tempfile.NamedTemporaryFile(suffix='.ogg', delete=False) as temp_file:
-                await voice_file.download_to_drive(temp_file.name)
+                with trace.span("download", "file"):
+                    await voice_file.download_to_drive(temp_file.name)
                 
                 # Try ElevenLabs Scribe first (if available)
                 if self.elevenlabs_available:
-                    transcription = await self._transcribe_with_elevenlabs(temp_file.name)
+                    with trace.span("transcribe", "elevenlabs_scribe") as span:
+                        transcription = await self._transcribe_with_elevenlabs(temp_file.name)
+                        span.ok = bool(transcription)
                     if transcription:
                         return {
                             'transcription': transcription,
@@ -162,7 +185,9 @@ class DualVoiceHandler:
                 
                 # Fallback to OpenAI Whisper if ElevenLabs failed or not available
                 if self.openai_available:
-                    transcription = await self._transcribe_with_openai(temp_file.name)
+                    with trace.span("transcribe", "openai_whisper") as span:
+                        transcription = await self._transcribe_with_openai(temp_file.name)
+                        span.ok = bool(transcription)
                     if transcription:
                         return {
                             'transcription': transcription,
@@ -240,18 +265,23 @@ class DualVoiceHandler:
             self.logger.error(f"Error transcribing with OpenAI: {e}")
             return None
     
-    async def _process_transcription(self, update: Update, context: ContextTypes.DEFAULT_TYPE, text: str, language: str = 'en'):
+    async def _process_transcription(self, update: Update, context: ContextTypes.DEFAULT_TYPE, text: str, language: str = 'en',
+                                     trace: Optional[VoiceTrace] = None):
         """Process the transcribed text for commands and actions with language support."""
+        trace = trace or self.tracer.start_trace()
         try:
             # Try LLM-based parsing first for complex commands
             try:
                 from .llm_voice_parser import LLMVoiceParser
-                llm_parser = LLMVoiceParser(self.config)
-                parsed_result = await llm_parser.parse_voice_command(text, language)
+                with trace.span("parse", "llm") as span:
+                    llm_parser = LLMVoiceParser(self.config)
+                    parsed_result = await llm_parser.parse_voice_command(text, language)
+                    span.detail = f"confidence={parsed_result.get('confidence', 0)}"
                 
                 if parsed_result.get('confidence', 0) > 0.7:
                     self.logger.info(f"LLM parsing successful: {parsed_result['primary_action']} (confidence: {parsed_result['confidence']})")
-                    await self._handle_parsed_command(update, context, parsed_result, text)
+                    with trace.span("action", parsed_result.get('primary_action')):
+                        await self._handle_parsed_command(update, context, parsed_result, text)
                     return
                 else:
                     self.logger.info(f"LLM parsing low confidence ({parsed_result.get('confidence', 0)}), falling back to keyword matching")
@@ -263,10 +293,11 @@ class DualVoiceHandler:
             text_lower = text.lower().strip()
             
             # Process based on detected language
-            if language == 'ru':
-                await self._process_russian_text(update, context, text, text_lower)
-            else:
-                await self._process_english_text(update, context, text, text_lower)
+            with trace.span("action", f"keywords_{language}"):
+                if language == 'ru':
+                    await self._process_russian_text(update, context, text, text_lower)
+                else:
+                    await self._process_english_text(update, context, text, text_lower)
             
         except Exception as e:
             self.logger.error(f"Error processing transcription: {e}")
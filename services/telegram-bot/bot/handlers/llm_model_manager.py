@@ -3,11 +3,17 @@ LLM Model Manager for Personal System Telegram Bot
 Manages different LLM models for different use cases with cost optimization
 """
 
+import hashlib
 import json
 import logging
-from typing import Dict, Any, Optional, List
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Optional, List, AsyncIterator, Tuple
 from enum import Enum
 
+from utils.storage import get_log_store
+
 logger = logging.getLogger(__name__)
 
 class ModelUseCase(Enum):
@@ -22,6 +28,108 @@ class ModelUseCase(Enum):
     LEARNING_ANALYSIS = "learning_analysis"
     GENERAL_CHAT = "general_chat"
 
+# Rough cost estimates per 1K tokens (as of 2024)
+COST_PER_1K_TOKENS = {
+    "gpt-4o": {"input": 0.005, "output": 0.015},
+    "gpt-4o-mini": {"input": 0.00015, "output": 0.0006},
+    "gpt-4-turbo": {"input": 0.01, "output": 0.03},
+    "gpt-3.5-turbo": {"input": 0.0015, "output": 0.002}
+}
+
+
+class ResponseCache:
+    """Bounded LRU cache of LLM responses with per-entry expiry."""
+    
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(request_params: Dict[str, Any]) -> str:
+        """Hash the model, messages and sampling parameters of a request."""
+        params = {k: v for k, v in request_params.items() if k != "stream"}
+        payload = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+    
+    def set(self, key: str, value: str, ttl: float):
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class UsageLedger:
+    """Token and cost ledger persisted to data/storage/llm_usage.json."""
+    
+    def __init__(self, filename: str = "llm_usage.json"):
+        self.store = get_log_store(filename)
+        self._day = datetime.now().strftime('%Y-%m-%d')
+        self._daily_costs: Dict[str, float] = {}
+        self._daily_tokens: Dict[str, int] = {}
+        
+        # Rebuild today's totals so budgets survive restarts
+        for entry in self.store.read_all():
+            if entry.get('timestamp', '').startswith(self._day):
+                self._add_to_totals(entry)
+    
+    def record(self, use_case: ModelUseCase, model: str, input_tokens: int, output_tokens: int,
+               cost: float, cached: bool = False):
+        """Persist one usage entry and update today's totals."""
+        self._roll_day()
+        entry = {
+            "timestamp": datetime.now().isoformat(),
+            "use_case": use_case.value,
+            "model": model,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cost": cost,
+            "cached": cached
+        }
+        self.store.append(entry)
+        self._add_to_totals(entry)
+    
+    def daily_cost(self, use_case: ModelUseCase) -> float:
+        self._roll_day()
+        return self._daily_costs.get(use_case.value, 0.0)
+    
+    def daily_summary(self) -> Dict[str, Any]:
+        self._roll_day()
+        return {
+            "date": self._day,
+            "costs": dict(self._daily_costs),
+            "tokens": dict(self._daily_tokens),
+            "total_cost": sum(self._daily_costs.values())
+        }
+    
+    def _add_to_totals(self, entry: Dict[str, Any]):
+        use_case = entry.get('use_case', 'unknown')
+        self._daily_costs[use_case] = self._daily_costs.get(use_case, 0.0) + entry.get('cost', 0.0)
+        self._daily_tokens[use_case] = (self._daily_tokens.get(use_case, 0)
+                                        + entry.get('input_tokens', 0) + entry.get('output_tokens', 0))
+    
+    def _roll_day(self):
+        today = datetime.now().strftime('%Y-%m-%d')
+        if today != self._day:
+            self._day = today
+            self._daily_costs = {}
+            self._daily_tokens = {}
+
+
 class LLMModelManager:
     """Manages different LLM models for different use cases with cost optimization."""
     
@@ -32,10 +140,11 @@ class LLMModelManager:
         # Initialize OpenAI client if available
         self.openai_available = False
         try:
-            from openai import OpenAI
+            from openai import OpenAI, AsyncOpenAI
             openai_config = config.get('openai', {})
             if openai_config.get('api_key'):
                 self.openai_client = OpenAI(api_key=openai_config['api_key'])
+                self.async_openai_client = AsyncOpenAI(api_key=openai_config['api_key'])
                 self.openai_available = True
                 self.logger.info("OpenAI client initialized for model management")
             else:
@@ -44,9 +153,13 @@ class LLMModelManager:
             self.logger.warning("OpenAI library not available - using fallback methods")
         
         # Load model configurations
-        from ...config.model_config_loader import ModelConfigLoader
+        from config.model_config_loader import ModelConfigLoader
         self.config_loader = ModelConfigLoader()
         self.model_configs = self._load_model_configs()
+        
+        # Response cache and usage accounting
+        self.response_cache = ResponseCache()
+        self.usage_ledger = UsageLedger()
     
     def _load_model_configs(self) -> Dict[ModelUseCase, Dict[str, Any]]:
         """Load model configurations for different use cases."""
@@ -180,17 +293,92 @@ class LLMModelManager:
             # Override with any provided kwargs
             request_params.update(kwargs)
             
-            self.logger.info(f"Generating response for {use_case.value} using {model_config['model']}")
+            # Downgrade or refuse when today's budget for this use case is spent
+            model = self._select_model_within_budget(use_case, request_params["model"])
+            if model is None:
+                return None
+            request_params["model"] = model
+            
+            cache_key = ResponseCache.make_key(request_params)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"Cache hit for {use_case.value} using {model}")
+                self._record_usage(use_case, model, 0, 0, cached=True)
+                return cached
+            
+            self.logger.info(f"Generating response for {use_case.value} using {model}")
             
             # Make the API call
             response = self.openai_client.chat.completions.create(**request_params)
             
-            return response.choices[0].message.content.strip()
+            if getattr(response, 'usage', None):
+                self._record_usage(use_case, model, response.usage.prompt_tokens, response.usage.completion_tokens)
+            
+            content = response.choices[0].message.content.strip()
+            self.response_cache.set(cache_key, content, self._get_cache_ttl(use_case))
+            return content
             
         except Exception as e:
             self.logger.error(f"Error generating response for {use_case.value}: {e}")
             return None
     
+    async def stream_response(self,
+                              use_case: ModelUseCase,
+                              messages: List[Dict[str, str]],
+                              **kwargs) -> AsyncIterator[str]:
+        """Stream a response token by token using the appropriate model for the use case."""
+        
+        if not self.openai_available:
+            self.logger.warning("OpenAI not available, cannot stream LLM response")
+            return
+        
+        model_config = self.get_model_config(use_case)
+        
+        request_params = {
+            "model": model_config["model"],
+            "messages": messages,
+            "temperature": model_config["temperature"],
+            "max_tokens": model_config["max_tokens"],
+            "stream": True
+        }
+        request_params.update(kwargs)
+        
+        model = self._select_model_within_budget(use_case, request_params["model"])
+        if model is None:
+            return
+        request_params["model"] = model
+        
+        cache_key = ResponseCache.make_key(request_params)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            self.logger.info(f"Cache hit for {use_case.value} using {model}")
+            self._record_usage(use_case, model, 0, 0, cached=True)
+            yield cached
+            return
+        
+        # Ask for a final usage chunk; passed through extra_body since the pinned openai client has no stream_options argument
+        request_params["extra_body"] = {**request_params.get("extra_body", {}), "stream_options": {"include_usage": True}}
+        
+        self.logger.info(f"Streaming response for {use_case.value} using {model}")
+        
+        try:
+            stream = await self.async_openai_client.chat.completions.create(**request_params)
+            parts = []
+            async for chunk in stream:
+                if getattr(chunk, 'usage', None):
+                    self._record_usage(use_case, model, chunk.usage.prompt_tokens, chunk.usage.completion_tokens)
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
+            
+            self.response_cache.set(cache_key, "".join(parts).strip(), self._get_cache_ttl(use_case))
+                    
+        except Exception as e:
+            self.logger.error(f"Error streaming response for {use_case.value}: {e}")
+    
     async def parse_voice_intent(self, transcription: str, language: str = 'en') -> Dict[str, Any]:
         """Parse voice command intent using the appropriate model."""
         
@@ -379,17 +567,9 @@ Respond ONLY in JSON format:
         model_config = self.get_model_config(use_case)
         model = model_config["model"]
         
-        # Rough cost estimates (as of 2024)
-        cost_per_1k_tokens = {
-            "gpt-4o": {"input": 0.005, "output": 0.015},
-            "gpt-4o-mini": {"input": 0.00015, "output": 0.0006},
-            "gpt-4-turbo": {"input": 0.01, "output": 0.03},
-            "gpt-3.5-turbo": {"input": 0.0015, "output": 0.002}
-        }
-        
-        if model in cost_per_1k_tokens:
-            input_cost = (input_tokens / 1000) * cost_per_1k_tokens[model]["input"]
-            output_cost = (output_tokens / 1000) * cost_per_1k_tokens[model]["output"]
+        if model in COST_PER_1K_TOKENS:
+            input_cost = (input_tokens / 1000) * COST_PER_1K_TOKENS[model]["input"]
+            output_cost = (output_tokens / 1000) * COST_PER_1K_TOKENS[model]["output"]
             total_cost = input_cost + output_cost
             
             return {
@@ -410,6 +590,55 @@ Respond ONLY in JSON format:
             "cost_tier": model_config.get("cost_tier", "unknown")
         }
     
+    def get_usage_summary(self) -> Dict[str, Any]:
+        """Get today's token and cost totals plus cache statistics."""
+        summary = self.usage_ledger.daily_summary()
+        summary["cache_hits"] = self.response_cache.hits
+        summary["cache_misses"] = self.response_cache.misses
+        return summary
+    
+    def _get_cache_ttl(self, use_case: ModelUseCase) -> float:
+        """Get the response cache TTL in seconds for a use case (0 disables caching)."""
+        cache_config = self.config_loader.load_config().get("response_cache", {})
+        if not cache_config.get("enabled", True):
+            return 0
+        return cache_config.get("ttl_seconds", {}).get(use_case.value, 0)
+    
+    def _record_usage(self, use_case: ModelUseCase, model: str, input_tokens: int, output_tokens: int,
+                      cached: bool = False):
+        """Record actual token usage and cost in the ledger. Cache hits are recorded with zero tokens."""
+        try:
+            prices = COST_PER_1K_TOKENS.get(model, {"input": 0.0, "output": 0.0})
+            cost = (input_tokens / 1000) * prices["input"] + (output_tokens / 1000) * prices["output"]
+            self.usage_ledger.record(use_case, model, input_tokens, output_tokens, cost, cached=cached)
+        except Exception as e:
+            self.logger.warning(f"Failed to record LLM usage for {use_case.value}: {e}")
+    
+    def _select_model_within_budget(self, use_case: ModelUseCase, model: str) -> Optional[str]:
+        """Return the model to use given today's spend, or None to skip the LLM call."""
+        cost_limits = self.config_loader.get_cost_limits()
+        daily_limit = cost_limits.get("daily_limits", {}).get(use_case.value)
+        
+        if daily_limit is None or self.usage_ledger.daily_cost(use_case) < daily_limit:
+            return model
+        
+        behavior = cost_limits.get("fallback_behavior", "use_fallback_parsing")
+        self.logger.warning(f"Daily budget of ${daily_limit:.2f} reached for {use_case.value} ({behavior})")
+        
+        if behavior != "use_cheaper_model":
+            return None
+        
+        current_price = COST_PER_1K_TOKENS.get(model, {}).get("output")
+        for fallback in self.config_loader.get_fallback_models(model):
+            if fallback == "fallback_parsing":
+                return None
+            fallback_price = COST_PER_1K_TOKENS.get(fallback, {}).get("output")
+            if current_price is None or (fallback_price is not None and fallback_price < current_price):
+                self.logger.info(f"Downgrading {use_case.value} from {model} to {fallback}")
+                return fallback
+        
+        return None
+    
     def update_model_config(self, use_case: ModelUseCase, new_config: Dict[str, Any]) -> bool:
         """Update model configuration for a specific use case."""
         try:
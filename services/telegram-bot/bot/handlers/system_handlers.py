@@ -414,3 +414,42 @@ If you received this message, the bot's notification system is working correctly
             f"❌ **Test Failed**\n\nError sending test notification: {str(e)}",
             parse_mode='Markdown'
         )
+
+
+async def voice_stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /voice_stats command: voice pipeline latency per stage and provider."""
+    user_id = context.user_data.get('user_id')
+    username = context.user_data.get('username', 'unknown')
+    
+    log_command(get_logger(__name__), user_id, username, "/voice_stats")
+    
+    if not context.user_data.get('is_admin', False):
+        await update.message.reply_text(
+            "🔒 **Access Denied**\n\n"
+            "Admin commands are restricted to administrators only.",
+            parse_mode='Markdown'
+        )
+        return
+    
+    from utils.voice_tracing import STAGE_ORDER, get_voice_tracer
+    
+    stats = get_voice_tracer().stage_stats()
+    if not stats:
+        await update.message.reply_text("🎤 No voice traces recorded in the last 7 days.")
+        return
+    
+    def order(row):
+        stage = row['stage']
+        rank = STAGE_ORDER.index(stage) if stage in STAGE_ORDER else len(STAGE_ORDER)
+        return rank, stage, row['provider'] or ''
+    
+    lines = ["🎤 **Voice Pipeline (last 7 days)**\n"]
+    for row in sorted(stats, key=order):
+        name = row['stage'] + (f" ({row['provider']})" if row['provider'] else "")
+        errors = f", {row['errors']} failed" if row['errors'] else ""
+        lines.append(
+            f"• `{name}`: p50 {row['p50_ms']:.0f}ms, p95 {row['p95_ms']:.0f}ms "
+            f"— {row['count']} runs{errors}"
+        )
+    
+    await update.message.reply_text("\n".join(lines), parse_mode='Markdown')
@@ -1,29 +1,93 @@
 """
 Authentication middleware for the Personal System Telegram Bot.
-Handles user access control and privacy protection.
+Handles user access control, privacy protection and per-user rate limiting.
 """
 
 import logging
-from typing import List, Optional
+import math
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
 from telegram import Update
 from telegram.ext import ContextTypes
 from utils.logger import get_logger, log_privacy_event
 
 
+# Command classes with separate budgets: burst capacity and sustained refill rate
+DEFAULT_RATE_LIMITS = {
+    "cheap": {"capacity": 20, "refill_per_minute": 30},
+    "llm": {"capacity": 5, "refill_per_minute": 6},
+    "voice": {"capacity": 3, "refill_per_minute": 4},
+}
+
+RATE_CLASS_LABELS = {
+    "cheap": "commands",
+    "llm": "AI requests",
+    "voice": "voice messages",
+}
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``refill_rate`` tokens per second."""
+    
+    __slots__ = ("capacity", "refill_rate", "tokens", "updated", "notified")
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.notified = False
+    
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+        self.updated = now
+    
+    def try_acquire(self) -> Tuple[bool, float]:
+        """Take one token. Returns (allowed, seconds until a token is available)."""
+        now = time.monotonic()
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True, 0.0
+        if self.refill_rate <= 0:
+            return False, math.inf
+        return False, (1 - self.tokens) / self.refill_rate
+    
+    def is_full(self) -> bool:
+        self._refill(time.monotonic())
+        return self.tokens >= self.capacity
+
+
 class AuthMiddleware:
     """Middleware for handling user authentication and access control."""
     
-    def __init__(self, allowed_users: List[int], admin_users: List[int]):
-        self.allowed_users = allowed_users
-        self.admin_users = admin_users
+    # Idle buckets are pruned once this many are tracked
+    MAX_TRACKED_BUCKETS = 10000
+    
+    def __init__(self, allowed_users: Iterable[int], admin_users: Iterable[int],
+                 rate_limits: Optional[Dict[str, Dict[str, float]]] = None):
+        self.allowed_users = frozenset(allowed_users or ())
+        self.admin_users = frozenset(admin_users or ())
         self.logger = get_logger(__name__)
+        
+        self.rate_limits = {name: dict(limits) for name, limits in DEFAULT_RATE_LIMITS.items()}
+        for name, limits in (rate_limits or {}).items():
+            self.rate_limits.setdefault(name, {}).update(limits)
+        
+        self._buckets: Dict[Tuple[int, str], TokenBucket] = {}
+        self.stats = {name: {"allowed": 0, "throttled": 0} for name in self.rate_limits}
+        self.unauthorized_count = 0
     
-    async def __call__(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Process update through authentication middleware."""
+    async def __call__(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
+                       rate_class: str = "cheap") -> bool:
+        """Process update through authentication middleware.
+        
+        Returns True if the handler should run.
+        """
         
         # Skip authentication for certain update types
         if not update.effective_user:
-            return
+            return True
         
         user_id = update.effective_user.id
         username = update.effective_user.username or "unknown"
@@ -40,8 +104,13 @@ class AuthMiddleware:
         
         # Check if user is allowed
         if not self._is_user_allowed(user_id):
+            self.unauthorized_count += 1
             await self._handle_unauthorized_access(update, user_id, username)
-            return
+            return False
+        
+        # Check the user's budget for this class of command
+        if not await self._check_rate_limit(update, user_id, rate_class):
+            return False
         
         # Add user info to context for handlers
         context.user_data['user_id'] = user_id
@@ -63,6 +132,73 @@ class AuthMiddleware:
         """Check if user is an admin."""
         return user_id in self.admin_users
     
+    def _get_bucket(self, user_id: int, rate_class: str) -> TokenBucket:
+        key = (user_id, rate_class)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.MAX_TRACKED_BUCKETS:
+                self._prune_buckets()
+            limits = self.rate_limits[rate_class]
+            bucket = TokenBucket(limits["capacity"], limits["refill_per_minute"] / 60.0)
+            self._buckets[key] = bucket
+        return bucket
+    
+    def _prune_buckets(self):
+        """Forget buckets that have refilled completely; they carry no state."""
+        for key in [key for key, bucket in self._buckets.items() if bucket.is_full()]:
+            del self._buckets[key]
+    
+    async def _check_rate_limit(self, update: Update, user_id: int, rate_class: str) -> bool:
+        """Take a token for the command class, replying briefly if the user is throttled."""
+        if rate_class not in self.rate_limits:
+            rate_class = "cheap"
+        
+        bucket = self._get_bucket(user_id, rate_class)
+        allowed, retry_after = bucket.try_acquire()
+        if allowed:
+            bucket.notified = False
+            self.stats[rate_class]["allowed"] += 1
+            return True
+        
+        self.stats[rate_class]["throttled"] += 1
+        
+        # Reply once per throttled stretch so a flood doesn't turn into a reply flood
+        if not bucket.notified:
+            bucket.notified = True
+            log_privacy_event(
+                self.logger,
+                "rate_limited",
+                user_id,
+                f"Throttled {rate_class} request, retry in {retry_after:.0f}s"
+            )
+            await self._handle_throttled(update, rate_class, retry_after)
+        return False
+    
+    async def _handle_throttled(self, update: Update, rate_class: str, retry_after: float):
+        """Tell the user to slow down instead of queueing the work."""
+        label = RATE_CLASS_LABELS.get(rate_class, "requests")
+        wait = "a moment" if math.isinf(retry_after) else f"{max(1, math.ceil(retry_after))}s"
+        text = f"⏳ Too many {label}. Please try again in {wait}."
+        
+        try:
+            if update.callback_query:
+                await update.callback_query.answer(text)
+            elif update.effective_message:
+                await update.effective_message.reply_text(text)
+        except Exception as e:
+            self.logger.warning(f"Could not send throttle notice: {e}")
+    
+    def get_throttle_stats(self) -> Dict[str, Any]:
+        """Per-class allowed/throttled counters for the health endpoint."""
+        return {
+            "classes": {
+                name: {**self.stats.get(name, {"allowed": 0, "throttled": 0}), **limits}
+                for name, limits in self.rate_limits.items()
+            },
+            "unauthorized": self.unauthorized_count,
+            "tracked_buckets": len(self._buckets),
+        }
+    
     async def _handle_unauthorized_access(self, update: Update, user_id: int, username: str):
         """Handle unauthorized access attempts."""
         log_privacy_event(
@@ -10,7 +10,7 @@ import os
 import signal
 import sys
 from datetime import datetime
-from typing import Dict, Any
+from typing import Callable, Dict, Any
 import json
 import psutil
 from aiohttp import web, ClientSession
@@ -33,6 +33,27 @@ class HealthCheckServer:
         self.start_time = datetime.now()
         self.bot_status = "unknown"
         self.last_check = None
+        self.metrics_providers: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self.health_providers = set()
+        
+    def register_metrics(self, name: str, provider: Callable[[], Dict[str, Any]],
+                         include_in_health: bool = True):
+        """Expose in-process counters (e.g. rate limits) under /metrics, and /health unless disabled"""
+        self.metrics_providers[name] = provider
+        if include_in_health:
+            self.health_providers.add(name)
+    
+    def collect_provider_metrics(self, health_only: bool = False) -> Dict[str, Any]:
+        """Snapshot registered metrics providers"""
+        collected = {}
+        for name, provider in self.metrics_providers.items():
+            if health_only and name not in self.health_providers:
+                continue
+            try:
+                collected[name] = provider()
+            except Exception as e:
+                collected[name] = {"error": str(e)}
+        return collected
         
     def setup_routes(self):
         """Setup HTTP routes for health checks"""
@@ -67,6 +88,7 @@ class HealthCheckServer:
                 "version": "1.0.0",
                 "environment": os.getenv('ENVIRONMENT', 'production')
             }
+            health_data.update(self.collect_provider_metrics(health_only=True))
             
             status_code = 200 if bot_running else 503
             return web.json_response(health_data, status=status_code)
@@ -142,6 +164,7 @@ class HealthCheckServer:
                     "uptime": str(datetime.now() - self.start_time)
                 }
             }
+            metrics_data.update(self.collect_provider_metrics())
             
             return web.json_response(metrics_data)
             
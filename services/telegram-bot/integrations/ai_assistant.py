@@ -8,16 +8,39 @@ import re
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, AsyncIterator
 from utils.logger import get_logger
+from utils.intent_router import KeywordIntentRouter
 
 
 class AIAssistant:
     """AI-powered assistant for personal system interactions."""
     
+    # Fallback intents, checked in priority order
+    FALLBACK_ROUTER = KeywordIntentRouter([
+        ('shadow', ['shadow', 'archetype', 'archetypes']),
+        ('projects', ['project', 'work on', 'priority', 'today', 'list my projects']),
+        ('health', ['health', 'fitness', 'wellness']),
+        ('learning', ['learn', 'study', 'education']),
+        ('journal', ['journal', 'pattern', 'insight']),
+        ('goals', ['goal', 'progress', 'achievement']),
+        ('values', ['value', 'values', 'core values']),
+        ('tasks', ['task', 'todo', 'what should i do']),
+        ('help', ['help', 'what can you do']),
+        ('habit_tracker', ['habit tracker', 'habit tracking', 'tracking habits']),
+        ('deep_connection', ['deep connection', 'connection app']),
+    ])
+    
+    CHAT_SYSTEM_PROMPT = (
+        "You are the user's personal system assistant. You help with shadow work, projects and tasks, "
+        "health, learning, journaling, goals and core values. Answer concisely using Telegram Markdown."
+    )
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.logger = get_logger(__name__)
         self.config = config or {}
+        self._multilingual_agent = None
+        self._model_manager = None
         
         # Load user's personal system data
         self.base_path = Path(config.get('paths', {}).get('base_path', '../../../'))
@@ -58,13 +81,45 @@ class AIAssistant:
     
     async def get_response(self, message: str, user_id: int) -> str:
         """Get an intelligent response to a user message."""
+        response = await self._get_routed_response(message, user_id)
+        if response is not None:
+            return response
+        return self._get_general_response(message)
+    
+    async def stream_response(self, message: str, user_id: int) -> AsyncIterator[str]:
+        """Stream a response to a user message.
+        
+        Recognised intents yield their prepared answer in one chunk; anything
+        else is streamed from the LLM, falling back to the general response.
+        """
+        response = await self._get_routed_response(message, user_id)
+        if response is not None:
+            yield response
+            return
+        
+        model_manager = self._get_model_manager()
+        if model_manager is not None:
+            from bot.handlers.llm_model_manager import ModelUseCase
+            
+            messages = [
+                {"role": "system", "content": self.CHAT_SYSTEM_PROMPT},
+                {"role": "user", "content": message}
+            ]
+            streamed = False
+            async for chunk in model_manager.stream_response(ModelUseCase.GENERAL_CHAT, messages):
+                streamed = True
+                yield chunk
+            if streamed:
+                return
+        
+        yield self._get_general_response(message)
+    
+    async def _get_routed_response(self, message: str, user_id: int) -> Optional[str]:
+        """Answer a message with a recognised intent, or None if no intent matched."""
         
         # Try multilingual processing first
         try:
-            from .simple_multilingual_agent import SimpleMultilingualAgent
-            
-            multilingual_agent = SimpleMultilingualAgent(self.config)
-            result = await multilingual_agent.process_message(message, user_id, "text")
+            result = await self._get_multilingual_agent().process_message(message, user_id, "text")
             
             if result["confidence"] > 0.5:
                 self.logger.info(f"✅ Multilingual processed message with intent: {result['intent']} (confidence: {result['confidence']})")
@@ -75,45 +130,53 @@ class AIAssistant:
         except Exception as e:
             self.logger.warning(f"Multilingual processing failed, falling back to local: {e}")
         
-        # Fallback to original logic
-        message_lower = message.lower()
+        # Fallback to local keyword routing
+        intent = self.FALLBACK_ROUTER.route(message)
         
-        # Check for specific question types
-        if any(word in message_lower for word in ['shadow', 'archetype', 'archetypes']):
+        if intent == 'shadow':
             return self._get_shadow_archetypes_response()
-        
-        elif any(word in message_lower for word in ['project', 'work on', 'priority', 'today', 'list my projects']):
+        elif intent == 'projects':
             return self._get_project_recommendations()
-        
-        elif any(word in message_lower for word in ['health', 'fitness', 'wellness']):
+        elif intent == 'health':
             return self._get_health_insights(user_id)
-        
-        elif any(word in message_lower for word in ['learn', 'study', 'education']):
+        elif intent == 'learning':
             return self._get_learning_insights(user_id)
-        
-        elif any(word in message_lower for word in ['journal', 'pattern', 'insight']):
+        elif intent == 'journal':
             return self._get_journal_insights(user_id)
-        
-        elif any(word in message_lower for word in ['goal', 'progress', 'achievement']):
+        elif intent == 'goals':
             return self._get_goal_insights(user_id)
-        
-        elif any(word in message_lower for word in ['value', 'values', 'core values']):
+        elif intent == 'values':
             return self._get_values_response()
-        
-        elif any(word in message_lower for word in ['task', 'todo', 'what should i do']):
+        elif intent == 'tasks':
             return self._get_task_recommendations()
-        
-        elif any(word in message_lower for word in ['help', 'what can you do']):
+        elif intent == 'help':
             return self._get_help_response()
-        
-        elif any(word in message_lower for word in ['habit tracker', 'habit tracking', 'tracking habits']):
+        elif intent == 'habit_tracker':
             return self._get_habit_tracker_info()
-        
-        elif any(word in message_lower for word in ['deep connection', 'connection app']):
+        elif intent == 'deep_connection':
             return self._get_deep_connection_app_info()
-        
-        else:
-            return self._get_general_response(message)
+        return None
+    
+    def _get_multilingual_agent(self):
+        """Get the shared multilingual agent, creating it on first use."""
+        if self._multilingual_agent is None:
+            from .simple_multilingual_agent import SimpleMultilingualAgent
+            self._multilingual_agent = SimpleMultilingualAgent(self.config)
+        return self._multilingual_agent
+    
+    def _get_model_manager(self):
+        """Get the LLM model manager, or None if OpenAI is not configured."""
+        if self._model_manager is None:
+            try:
+                from bot.handlers.llm_model_manager import LLMModelManager
+                from config.secure_config import SecureConfigManager
+                
+                openai_config = SecureConfigManager().get_openai_config({'openai': dict(self.config.get('openai', {}))})
+                self._model_manager = LLMModelManager({**self.config, 'openai': openai_config})
+            except Exception as e:
+                self.logger.warning(f"LLM model manager unavailable: {e}")
+                return None
+        return self._model_manager if self._model_manager.openai_available else None
     
     async def transcribe_voice(self, voice_path: str) -> Optional[str]:
         """Transcribe voice message to text using OpenAI Whisper."""
@@ -162,7 +225,7 @@ class AIAssistant:
                 return transcript.strip()
             else:
                 return "❌ Could not transcribe the voice message. Please try again or send a text message."
-                
+        
         except ImportError:
             return "❌ OpenAI library not available. Please install: pip install openai"
         except Exception as e:
@@ -388,7 +451,7 @@ I can answer questions about:
 • "What are my core values?"
 
 Or use commands like `/help` to see everything I can do!"""
-        
+
         elif any(word in message_lower for word in ['hello', 'hi', 'hey', 'start']):
             return """👋 **Hello! I'm your personal AI assistant.**
 
@@ -402,7 +465,7 @@ I'm here to help you with your personal system, shadow work, and personal develo
 • Core values and life direction
 
 Just ask me anything naturally, or use `/help` to see all my capabilities!"""
-        
+
         else:
             responses = [
                 "I'm here to help you with your personal system! Try asking me about your shadow archetypes, projects, health, or learning progress.",
@@ -487,7 +550,7 @@ Based on your personal system and shadow work, here are the core values that gui
 • Make decisions that align with your ethical impact goals
 
 💡 **Remember:** Your values are your compass. When you're uncertain, ask yourself: 'Does this choice align with my core values?'"""
-    
+
     def _get_task_recommendations(self) -> str:
         """Get task recommendations for today."""
         return """📋 **Today's Task Recommendations**
@@ -516,7 +579,7 @@ Based on your personal system and shadow work, here are the core values that gui
 • Practice gratitude for your progress
 
 🎯 **Focus Tip:** Choose 2-3 tasks that align with your highest priorities and energy level."""
-    
+
     def _get_help_response(self) -> str:
         """Get help response about what the AI can do."""
         return """🤖 **I'm Your Personal AI Assistant!**
@@ -595,7 +658,7 @@ Based on your shadow work and values:
 • Align habits with your core values and goals
 
 💡 **Tip:** Start with 3-5 core habits rather than trying to track everything. Focus on consistency over perfection!"""
-    
+
     def _get_deep_connection_app_info(self) -> str:
         """Get information about the Deep Connection App project."""
         return """🤝 **Deep Connections App Project**
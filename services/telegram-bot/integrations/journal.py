@@ -3,12 +3,12 @@ Journal integration for the Personal System Telegram Bot.
 Handles journal entries, ideas, and task management.
 """
 
-import json
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from utils.logger import get_logger
+from utils.storage import get_log_store
 
 
 class JournalIntegration:
@@ -218,23 +218,8 @@ class JournalIntegration:
         return None
     
     def _save_log_entry(self, filename: str, entry: Dict[str, Any]):
-        """Save a log entry to a JSON file."""
-        log_file = Path("data/storage") / filename
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Load existing entries
-        if log_file.exists():
-            with open(log_file, 'r', encoding='utf-8') as f:
-                entries = json.load(f)
-        else:
-            entries = []
-        
-        # Add new entry
-        entries.append(entry)
-        
-        # Save updated entries
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(entries, f, indent=2, ensure_ascii=False)
+        """Append a log entry to the storage log for the given file name."""
+        get_log_store(filename).append(entry)
     
     def _save_to_daily_journal(self, content: str):
         """Save to daily journal file."""
@@ -267,77 +252,55 @@ class JournalIntegration:
         except Exception as e:
             self.logger.error(f"Error saving to ideas file: {e}")
     
-    def get_recent_entries(self, user_id: int, limit: int = 5) -> List[Dict[str, Any]]:
+    def get_recent_entries(self, user_id: int, limit: int = 5,
+                           cursor: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get recent journal entries for a user."""
         try:
-            log_file = Path("data/storage") / "journal_entries.json"
-            
-            if not log_file.exists():
-                return []
-            
-            with open(log_file, 'r', encoding='utf-8') as f:
-                entries = json.load(f)
-            
-            # Filter by user and sort by timestamp
-            user_entries = [entry for entry in entries if entry.get('user_id') == user_id]
-            user_entries.sort(key=lambda x: x['timestamp'], reverse=True)
-            
-            return user_entries[:limit]
+            entries, _ = get_log_store("journal_entries.json").query(user_id, limit=limit, cursor=cursor)
+            return entries
             
         except Exception as e:
             self.logger.error(f"Error getting recent entries: {e}")
             return []
     
-    def get_ideas(self, user_id: int, category: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_ideas(self, user_id: int, category: Optional[str] = None, limit: Optional[int] = None,
+                  cursor: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get ideas for a user, optionally filtered by category."""
         try:
-            log_file = Path("data/storage") / "ideas.json"
-            
-            if not log_file.exists():
-                return []
-            
-            with open(log_file, 'r', encoding='utf-8') as f:
-                ideas = json.load(f)
-            
-            # Filter by user
-            user_ideas = [idea for idea in ideas if idea.get('user_id') == user_id]
-            
-            # Filter by category if specified
-            if category:
-                user_ideas = [idea for idea in user_ideas if idea.get('category') == category]
-            
-            # Sort by timestamp
-            user_ideas.sort(key=lambda x: x['timestamp'], reverse=True)
-            
-            return user_ideas
+            ideas, _ = get_log_store("ideas.json").query(user_id, limit=limit, cursor=cursor, category=category)
+            return ideas
             
         except Exception as e:
             self.logger.error(f"Error getting ideas: {e}")
             return []
     
-    def get_tasks(self, user_id: int, status: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get tasks for a user, optionally filtered by status."""
+    def get_tasks(self, user_id: int, status: Optional[str] = None, limit: Optional[int] = None,
+                  cursor: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get tasks for a user, optionally filtered by status.
+        
+        The full list is sorted by priority and timestamp; pages requested with
+        limit/cursor stay in newest-first timeline order so they line up across calls.
+        """
         try:
-            log_file = Path("data/storage") / "tasks.json"
-            
-            if not log_file.exists():
-                return []
-            
-            with open(log_file, 'r', encoding='utf-8') as f:
-                tasks = json.load(f)
-            
-            # Filter by user
-            user_tasks = [task for task in tasks if task.get('user_id') == user_id]
-            
-            # Filter by status if specified
-            if status:
-                user_tasks = [task for task in user_tasks if task.get('status') == status]
+            tasks, _ = get_log_store("tasks.json").query(user_id, limit=limit, cursor=cursor, status=status)
             
             # Sort by priority and timestamp
-            user_tasks.sort(key=lambda x: (x.get('priority', 'medium'), x['timestamp']), reverse=True)
+            if limit is None and cursor is None:
+                tasks.sort(key=lambda x: (x.get('priority', 'medium'), x['timestamp']), reverse=True)
             
-            return user_tasks
+            return tasks
             
         except Exception as e:
             self.logger.error(f"Error getting tasks: {e}")
             return []
+    
+    def get_page(self, filename: str, user_id: int, limit: int = 10, cursor: Optional[str] = None,
+                 **filters) -> Dict[str, Any]:
+        """Get a newest-first page of a user's entries with a cursor for the next page."""
+        try:
+            items, next_cursor = get_log_store(filename).query(user_id, limit=limit, cursor=cursor, **filters)
+            return {"items": items, "next_cursor": next_cursor}
+            
+        except Exception as e:
+            self.logger.error(f"Error getting page from {filename}: {e}")
+            return {"items": [], "next_cursor": None}
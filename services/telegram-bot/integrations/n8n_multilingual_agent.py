@@ -5,6 +5,8 @@ Now uses the n8n framework for better maintainability and reusability
 """
 
 import asyncio
+import json
+from datetime import datetime, date
 from typing import Dict, Any, Optional
 from pathlib import Path
 from utils.logger import get_logger
@@ -13,6 +15,8 @@ from utils.logger import get_logger
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent.parent / "automation" / "integrations"))
 from n8n_framework import N8nIntegration
+sys.path.append(str(Path(__file__).parent.parent.parent.parent / "automation" / "scripts" / "daily_operations"))
+from record_store import open_store
 
 
 class N8nMultilingualAgent:
@@ -161,12 +165,10 @@ class N8nMultilingualAgent:
             # Load from user's data files
             base_path = Path(self.config.get('paths', {}).get('base_path', '../../../'))
             
+            daily_ops_outputs = base_path / "automation/scripts/daily_operations/outputs"
+            
             # Load recent activities
-            tasks_file = base_path / "automation/outputs/tasks.json"
-            if tasks_file.exists():
-                with open(tasks_file, 'r', encoding='utf-8') as f:
-                    tasks_data = json.load(f)
-                    context["current_projects"] = tasks_data.get('active_tasks', [])[:5]
+            context["current_projects"] = open_store("tasks", daily_ops_outputs).query(status='pending')[:5]
             
             # Load shadow work data
             shadow_file = base_path / "automation/outputs/shadow_work_data.json"
@@ -176,11 +178,9 @@ class N8nMultilingualAgent:
                     context["shadow_work_progress"] = shadow_data.get('progress', {})
             
             # Load health data
-            health_file = base_path / "automation/outputs/health_data.json"
-            if health_file.exists():
-                with open(health_file, 'r', encoding='utf-8') as f:
-                    health_data = json.load(f)
-                    context["health_metrics"] = health_data.get('metrics', {})
+            health_entry = open_store("health", daily_ops_outputs).get(date.today().isoformat())
+            if health_entry:
+                context["health_metrics"] = health_entry.get('metrics', {})
             
         except Exception as e:
             self.logger.warning(f"Could not load user context: {e}")
@@ -6,12 +6,32 @@ Connects to the user's existing automation scripts and system.
 import json
 import os
 import shutil
-import subprocess
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from utils.logger import get_logger
+from utils.storage import get_log_store
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DAILY_OPERATIONS_PATH = PROJECT_ROOT / "automation" / "scripts" / "daily_operations"
+
+_daily_summary_generator = None
+
+
+def _load_daily_summary_generator():
+    """Import DailySummaryGenerator once so summaries run in-process."""
+    global _daily_summary_generator
+    if _daily_summary_generator is None:
+        if str(DAILY_OPERATIONS_PATH) not in sys.path:
+            sys.path.append(str(DAILY_OPERATIONS_PATH))
+        try:
+            from daily_summary import DailySummaryGenerator
+        except ImportError:
+            return None
+        _daily_summary_generator = DailySummaryGenerator
+    return _daily_summary_generator
 
 
 class PersonalSystemIntegration:
@@ -24,59 +44,71 @@ class PersonalSystemIntegration:
         self.automation_scripts = Path(config.get('paths', {}).get('automation_scripts', '../../../automation/scripts/'))
     
     def get_daily_summary(self) -> str:
-        """Get daily summary using the existing automation script or generate one."""
+        """Get the daily summary from the in-process summary generator, or a default one."""
         try:
-            # Try to run the daily summary script if it exists
-            script_path = self.automation_scripts / "daily_summary.py"
-            
-            if script_path.exists():
-                # Run the script and capture output
-                result = subprocess.run(
-                    [sys.executable, str(script_path)],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.automation_scripts
-                )
-                
-                if result.returncode == 0:
-                    # Parse the output and format for Telegram
-                    summary = self._format_summary_for_telegram(result.stdout)
-                    return summary
-                else:
-                    return self._generate_default_summary()
-            else:
-                # Generate a basic summary if script doesn't exist
-                return self._generate_default_summary()
+            data = self.get_daily_summary_data()
+            if data and data.get('has_real_data'):
+                return self._format_summary_for_telegram(data)
+            return self._generate_default_summary()
                 
         except Exception as e:
             self.logger.error(f"Error getting daily summary: {e}")
             return self._generate_default_summary()
     
-    def _format_summary_for_telegram(self, summary_text: str) -> str:
-        """Format the summary text for Telegram display."""
-        # This is a simplified formatter - you can enhance it based on your summary format
-        lines = summary_text.split('\n')
-        formatted_lines = []
+    def get_daily_summary_data(self) -> Optional[Dict[str, Any]]:
+        """Structured daily summary, cached per day until a data file changes."""
+        generator_class = _load_daily_summary_generator()
+        if generator_class is None:
+            return None
+        return generator_class(base_path=str(PROJECT_ROOT), verbose=False).get_summary_data()
+    
+    def _format_summary_for_telegram(self, data: Dict[str, Any]) -> str:
+        """Render structured summary data as Telegram Markdown."""
+        today = datetime.strptime(data['date'], '%Y-%m-%d')
+        sections = data.get('sections', {})
+        lines = [f"📊 **Daily Summary - {today.strftime('%B %d, %Y')}**"]
         
-        for line in lines:
-            if line.strip():
-                # Add emojis and formatting for better readability
-                if 'health' in line.lower():
-                    line = f"🏃‍♂️ {line}"
-                elif 'productivity' in line.lower():
-                    line = f"⚡ {line}"
-                elif 'learning' in line.lower():
-                    line = f"📚 {line}"
-                elif 'finance' in line.lower():
-                    line = f"💰 {line}"
-                elif 'insights' in line.lower():
-                    line = f"💡 {line}"
-                elif 'recommendations' in line.lower():
-                    line = f"🎯 {line}"
-                
-                formatted_lines.append(line)
+        health = sections.get('health')
+        if health:
+            lines.append("\n🏃‍♂️ **Health & Wellness**")
+            for name, value in health['metrics'].items():
+                if isinstance(value, float) and value.is_integer():
+                    value = int(value)
+                lines.append(f"• {name.replace('_', ' ').title()}: {value}")
+        
+        productivity = sections.get('productivity')
+        if productivity:
+            lines.append("\n⚡ **Productivity**")
+            lines.append(f"• Completed today: {len(productivity['completed_today'])}")
+            lines.extend(f"  ✅ {title}" for title in productivity['completed_today'][:5])
+            lines.append(f"• Pending: {productivity['pending']} ({productivity['high_priority_pending']} high priority)")
+            if productivity['due_today']:
+                lines.append(f"• Due today: {productivity['due_today']}")
+            if productivity['overdue']:
+                lines.append(f"• Overdue: {productivity['overdue']}")
+        
+        learning = sections.get('learning')
+        if learning:
+            lines.append("\n📚 **Learning & Growth**")
+            lines.append(f"• Total: {learning['total_minutes']:g} minutes")
+            for activity in learning['activities']:
+                description = f" - {activity['description']}" if activity.get('description') else ""
+                lines.append(f"• {str(activity['type']).title()}: {activity['duration']:g} min{description}")
+        
+        finance = sections.get('finance')
+        if finance:
+            lines.append("\n💰 **Finance**")
+            lines.extend(f"• {key.replace('_', ' ').title()}: {value}" for key, value in finance.items())
         
-        return '\n'.join(formatted_lines)
+        if data.get('insights'):
+            lines.append("\n💡 **Insights**")
+            lines.extend(f"• {insight}" for insight in data['insights'])
+        
+        if data.get('recommendations'):
+            lines.append("\n🎯 **Recommendations**")
+            lines.extend(f"{i}. {rec}" for i, rec in enumerate(data['recommendations'], 1))
+        
+        return '\n'.join(lines)
     
     def _generate_default_summary(self) -> str:
         """Generate a default daily summary."""
@@ -245,23 +277,8 @@ Use the bot commands to log data and track progress.
         return tags
     
     def _save_log_entry(self, filename: str, entry: Dict[str, Any]):
-        """Save a log entry to a JSON file."""
-        log_file = Path("data/storage") / filename
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Load existing entries
-        if log_file.exists():
-            with open(log_file, 'r', encoding='utf-8') as f:
-                entries = json.load(f)
-        else:
-            entries = []
-        
-        # Add new entry
-        entries.append(entry)
-        
-        # Save updated entries
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(entries, f, indent=2, ensure_ascii=False)
+        """Append a log entry to the storage log for the given file name."""
+        get_log_store(filename).append(entry)
     
     def create_backup(self) -> str:
         """Create a backup of the system."""
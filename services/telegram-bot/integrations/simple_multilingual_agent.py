@@ -9,11 +9,39 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 from pathlib import Path
 from utils.logger import get_logger
+from utils.intent_router import KeywordIntentRouter
 
 
 class SimpleMultilingualAgent:
     """Simple multilingual AI agent for intent detection and response generation."""
     
+    # Russian patterns
+    RUSSIAN_PATTERNS = {
+        'tasks': ['задачи', 'задач', 'задачу', 'работа', 'дела', 'сегодня', 'что делать', 'приоритет', 'подготовить', 'презентацию', 'презентация', 'встрече', 'встреча', 'встречи', 'проект', 'проекты', 'планировать', 'планирование'],
+        'health': ['здоровье', 'здоровья', 'фитнес', 'тренировка', 'спорт', 'вес', 'диета', 'шаги', 'сон', 'настроение', 'энергия', 'вода', 'упражнения'],
+        'learning': ['учёба', 'обучение', 'курс', 'курсы', 'изучение', 'знания', 'прогресс', 'изучил', 'изучал', 'книга', 'статья', 'видео', 'урок'],
+        'shadow_work': ['тень', 'архетип', 'архетипы', 'теневая работа', 'саморазвитие', 'теневая', 'работа'],
+        'journal': ['журнал', 'дневник', 'запись', 'записи', 'размышления', 'паттерны', 'заметка', 'заметки', 'идея', 'мысли'],
+        'goals': ['цели', 'цель', 'достижения', 'прогресс', 'планы', 'мечты', 'результаты'],
+        'values': ['ценности', 'принципы', 'жизнь', 'направление', 'смысл', 'направления'],
+        'help': ['помощь', 'помоги', 'что умеешь', 'возможности', 'команды', 'что делать']
+    }
+    
+    # English patterns
+    ENGLISH_PATTERNS = {
+        'tasks': ['tasks', 'work', 'project', 'priority', 'today', 'what to do', 'list'],
+        'health': ['health', 'fitness', 'workout', 'sport', 'weight', 'diet', 'wellness'],
+        'learning': ['learning', 'course', 'courses', 'study', 'knowledge', 'progress', 'education'],
+        'shadow_work': ['shadow', 'archetype', 'archetypes', 'shadow work', 'personal development'],
+        'journal': ['journal', 'diary', 'entry', 'entries', 'reflection', 'patterns', 'insights'],
+        'goals': ['goals', 'goal', 'achievements', 'progress', 'plans', 'dreams'],
+        'values': ['values', 'principles', 'life', 'direction', 'meaning', 'purpose'],
+        'help': ['help', 'assist', 'what can you do', 'capabilities', 'commands']
+    }
+    
+    RUSSIAN_ROUTER = KeywordIntentRouter(RUSSIAN_PATTERNS.items())
+    ENGLISH_ROUTER = KeywordIntentRouter(ENGLISH_PATTERNS.items())
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = get_logger(__name__)
@@ -34,46 +62,15 @@ class SimpleMultilingualAgent:
         """Simple multilingual intent detection using pattern matching."""
         text_lower = text.lower()
         
-        # Russian patterns
-        russian_patterns = {
-            'tasks': ['задачи', 'задач', 'задачу', 'работа', 'дела', 'сегодня', 'что делать', 'приоритет', 'подготовить', 'презентацию', 'презентация', 'встрече', 'встреча', 'встречи', 'проект', 'проекты', 'планировать', 'планирование'],
-            'health': ['здоровье', 'здоровья', 'фитнес', 'тренировка', 'спорт', 'вес', 'диета', 'шаги', 'сон', 'настроение', 'энергия', 'вода', 'упражнения'],
-            'learning': ['учёба', 'обучение', 'курс', 'курсы', 'изучение', 'знания', 'прогресс', 'изучил', 'изучал', 'книга', 'статья', 'видео', 'урок'],
-            'shadow_work': ['тень', 'архетип', 'архетипы', 'теневая работа', 'саморазвитие', 'теневая', 'работа'],
-            'journal': ['журнал', 'дневник', 'запись', 'записи', 'размышления', 'паттерны', 'заметка', 'заметки', 'идея', 'мысли'],
-            'goals': ['цели', 'цель', 'достижения', 'прогресс', 'планы', 'мечты', 'результаты'],
-            'values': ['ценности', 'принципы', 'жизнь', 'направление', 'смысл', 'направления'],
-            'help': ['помощь', 'помоги', 'что умеешь', 'возможности', 'команды', 'что делать']
-        }
-        
-        # English patterns
-        english_patterns = {
-            'tasks': ['tasks', 'work', 'project', 'priority', 'today', 'what to do', 'list'],
-            'health': ['health', 'fitness', 'workout', 'sport', 'weight', 'diet', 'wellness'],
-            'learning': ['learning', 'course', 'courses', 'study', 'knowledge', 'progress', 'education'],
-            'shadow_work': ['shadow', 'archetype', 'archetypes', 'shadow work', 'personal development'],
-            'journal': ['journal', 'diary', 'entry', 'entries', 'reflection', 'patterns', 'insights'],
-            'goals': ['goals', 'goal', 'achievements', 'progress', 'plans', 'dreams'],
-            'values': ['values', 'principles', 'life', 'direction', 'meaning', 'purpose'],
-            'help': ['help', 'assist', 'what can you do', 'capabilities', 'commands']
-        }
-        
         # Detect language and intent
         detected_language = self._detect_language(text)
-        patterns = russian_patterns if detected_language == 'ru' else english_patterns
-        
-        # Find matching intent
-        intent = 'unknown'
-        confidence = 0.0
-        matched_patterns = []
+        router = self.RUSSIAN_ROUTER if detected_language == 'ru' else self.ENGLISH_ROUTER
         
-        for intent_name, pattern_list in patterns.items():
-            for pattern in pattern_list:
-                if pattern in text_lower:
-                    matched_patterns.append(pattern)
-                    confidence = min(0.9, confidence + 0.2)  # Increase confidence for each match
-                    if intent == 'unknown':
-                        intent = intent_name
+        # Find matching intents in a single pass over the text
+        matches = router.matches(text_lower)
+        intent = matches[0][0] if matches else 'unknown'
+        matched_patterns = [pattern for _, pattern in matches]
+        confidence = min(0.9, 0.2 * len(matched_patterns))  # Increase confidence for each match
         
         # Generate response
         response_text = self._generate_response(intent, detected_language, text)
@@ -14,11 +14,18 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
-from bot.bot import PersonalSystemBot
-from config.config_manager import ConfigManager
-from utils.logger import setup_logging
-from scheduler import PersonalSystemScheduler
-from health_check import HealthCheckServer
+# Imported first so the startup profile measures from here
+from utils.import_profiler import timed_import
+
+with timed_import("bot.bot"):
+    from bot.bot import PersonalSystemBot
+with timed_import("config.config_manager"):
+    from config.config_manager import ConfigManager
+from utils.logger import setup_logging, get_logging_stats
+with timed_import("scheduler"):
+    from scheduler import PersonalSystemScheduler
+with timed_import("health_check"):
+    from health_check import HealthCheckServer
 
 
 async def main():
@@ -47,6 +54,9 @@ async def main():
         # Create health check server
         health_port = int(os.getenv('HEALTH_CHECK_PORT', '8000'))
         health_check = HealthCheckServer(health_port)
+        health_check.register_metrics("rate_limits", bot.auth_middleware.get_throttle_stats)
+        health_check.register_metrics("logging", get_logging_stats)
+        health_check.register_metrics("handlers", bot.handler_metrics.snapshot, include_in_health=False)
         
         logger.info("Bot, scheduler, and health check initialized successfully. Starting...")
         
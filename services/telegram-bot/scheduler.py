@@ -6,15 +6,15 @@ Handles automated tasks like morning routine reminders.
 
 import asyncio
 import logging
-import tempfile
-import os
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
 from typing import Dict, Any
 import pytz
 import requests
 
 from bot.bot import PersonalSystemBot
 from utils.logger import get_logger
+from utils.job_scheduler import JobScheduler
+from utils.audio_cache import AudioCache
 from services.task_integration import get_top_3_tasks, format_tasks_for_morning_routine
 
 
@@ -34,6 +34,9 @@ class PersonalSystemScheduler:
         # Morning routine time (6:00 AM)
         self.morning_routine_time = time(6, 0)
         
+        # Jobs run from a heap ordered by next due time
+        self.job_scheduler = JobScheduler(self.timezone)
+        
         # Get allowed users for notifications
         self.allowed_users = config['telegram'].get('allowed_users', [])
         
@@ -45,9 +48,37 @@ class PersonalSystemScheduler:
             self.tts_enabled = True
             self.elevenlabs_api_key = self.elevenlabs_config['api_key']
             self.voice_id = self.elevenlabs_config.get('voice_id', '21m00Tcm4TlvDq8ikWAM')
+            self.tts_model_id = self.elevenlabs_config.get('model_id', 'eleven_monolingual_v1')
+            self.audio_cache = AudioCache(
+                max_bytes=int(self.elevenlabs_config.get('audio_cache_max_mb', 200)) * 1024 * 1024
+            )
             self.logger.info("ElevenLabs TTS enabled for voice messages")
         else:
             self.logger.warning("ElevenLabs TTS not configured - voice messages will be text-only")
+        
+        # Job registration depends on tts_enabled
+        self._register_jobs()
+    
+    def _register_jobs(self):
+        """Register scheduled jobs."""
+        # Morning routine every day; if the bot was down at that time,
+        # still send it when it comes back within two hours.
+        self.job_scheduler.add_cron_job(
+            "morning_routine",
+            self._send_morning_routine,
+            f"{self.morning_routine_time.minute} {self.morning_routine_time.hour} * * *",
+            catch_up_window=timedelta(hours=2)
+        )
+        
+        # Render the voice guide well ahead of time so sending is a file upload
+        if self.tts_enabled:
+            prerender_at = (datetime.combine(datetime.today(), self.morning_routine_time)
+                            - timedelta(minutes=45)).time()
+            self.job_scheduler.add_cron_job(
+                "morning_routine_prerender",
+                self._prerender_morning_audio,
+                f"{prerender_at.minute} {prerender_at.hour} * * *"
+            )
     
     async def start(self):
         """Start the scheduler."""
@@ -55,9 +86,7 @@ class PersonalSystemScheduler:
         self.logger.info("Scheduler started")
         
         try:
-            while self.running:
-                await self._check_scheduled_tasks()
-                await asyncio.sleep(60)  # Check every minute
+            await self.job_scheduler.run()
         except Exception as e:
             self.logger.error(f"Error in scheduler: {e}")
         finally:
@@ -66,90 +95,81 @@ class PersonalSystemScheduler:
     async def stop(self):
         """Stop the scheduler."""
         self.running = False
+        await self.job_scheduler.stop()
         self.logger.info("Scheduler stopped")
     
-    async def _check_scheduled_tasks(self):
-        """Check and execute scheduled tasks."""
-        current_time = datetime.now(self.timezone)
-        current_time_only = current_time.time()
-        
-        # Check if it's time for morning routine (6:00 AM)
-        if (current_time_only.hour == self.morning_routine_time.hour and 
-            current_time_only.minute == self.morning_routine_time.minute):
-            await self._send_morning_routine()
+    def get_job_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get run counts and durations for every scheduled job."""
+        return self.job_scheduler.get_metrics()
     
     async def _send_morning_routine(self):
         """Send morning routine to all allowed users."""
         self.logger.info("Sending morning routine to users")
         
+        # The routine is the same for every user, so build it once
+        routine_text = self._get_morning_routine_text()
+        voice_guide = self._get_voice_guide_text()
+        audio_path = None
+        
+        if self.tts_enabled:
+            try:
+                audio_path = await self._get_voice_guide_audio(voice_guide)
+            except Exception as tts_error:
+                self.logger.error(f"TTS error: {tts_error}")
+        
         for user_id in self.allowed_users:
             try:
                 # Send morning routine text message
-                routine_text = self._get_morning_routine_text()
-                
                 await self.bot.application.bot.send_message(
                     chat_id=user_id,
                     text=routine_text,
                     parse_mode='Markdown'
                 )
                 
-                # Send voice message if TTS is enabled
-                if self.tts_enabled:
-                    try:
-                        voice_guide = self._get_voice_guide_text()
-                        audio_data = self._generate_speech(voice_guide)
-                        
-                        if audio_data:
-                            # Send as voice message
-                            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-                                temp_file.write(audio_data)
-                                temp_file.flush()
-                                
-                                await self.bot.application.bot.send_voice(
-                                    chat_id=user_id,
-                                    voice=open(temp_file.name, 'rb'),
-                                    caption="🎤 Your morning routine voice guide"
-                                )
-                                
-                                # Clean up temp file
-                                os.unlink(temp_file.name)
-                                
-                            self.logger.info(f"Voice message sent to user {user_id}")
-                        else:
-                            # Fallback to text if TTS fails
-                            await self.bot.application.bot.send_message(
-                                chat_id=user_id,
-                                text=f"🎤 **Voice Guide Version:**\n\n{voice_guide}\n\n"
-                                     "💡 **Tip:** Use your phone's text-to-speech feature to read this aloud!",
-                                parse_mode='Markdown'
-                            )
-                            self.logger.warning(f"TTS failed for user {user_id}, sent text fallback")
-                            
-                    except Exception as tts_error:
-                        self.logger.error(f"TTS error for user {user_id}: {tts_error}")
-                        # Fallback to text
-                        voice_guide = self._get_voice_guide_text()
-                        await self.bot.application.bot.send_message(
+                if audio_path:
+                    # Send as voice message
+                    with open(audio_path, 'rb') as audio_file:
+                        await self.bot.application.bot.send_voice(
                             chat_id=user_id,
-                            text=f"🎤 **Voice Guide Version:**\n\n{voice_guide}\n\n"
-                                 "💡 **Tip:** Use your phone's text-to-speech feature to read this aloud!",
-                            parse_mode='Markdown'
+                            voice=audio_file,
+                            caption="🎤 Your morning routine voice guide"
                         )
+                    self.logger.info(f"Voice message sent to user {user_id}")
                 else:
-                    # Send voice guide as text if TTS not enabled
-                    voice_guide = self._get_voice_guide_text()
+                    # Send voice guide as text if TTS is disabled or failed
                     await self.bot.application.bot.send_message(
                         chat_id=user_id,
                         text=f"🎤 **Voice Guide Version:**\n\n{voice_guide}\n\n"
                              "💡 **Tip:** Use your phone's text-to-speech feature to read this aloud!",
                         parse_mode='Markdown'
                     )
+                    if self.tts_enabled:
+                        self.logger.warning(f"TTS failed for user {user_id}, sent text fallback")
                 
                 self.logger.info(f"Morning routine sent to user {user_id}")
                 
             except Exception as e:
                 self.logger.error(f"Error sending morning routine to user {user_id}: {e}")
     
+    async def _prerender_morning_audio(self):
+        """Render today's voice guide into the audio cache ahead of sending."""
+        voice_guide = self._get_voice_guide_text()
+        audio_path = await self._get_voice_guide_audio(voice_guide)
+        if audio_path:
+            self.logger.info(f"Morning voice guide pre-rendered: {audio_path.name}")
+        else:
+            self.logger.warning("Morning voice guide pre-render failed; will retry at send time")
+    
+    async def _get_voice_guide_audio(self, text: str):
+        """Get the audio file for a text, rendering it off the event loop on a cache miss."""
+        key = AudioCache.make_key(text, self.voice_id, self.tts_model_id)
+        cached = self.audio_cache.get(key)
+        if cached:
+            self.logger.info(f"Using cached voice guide audio {cached.name}")
+            return cached
+        
+        return await asyncio.to_thread(self._stream_speech_to_cache, text, key)
+    
     def _get_morning_routine_text(self):
         """Get the formatted morning routine text."""
         # Get top 3 tasks for today
@@ -282,7 +302,7 @@ You've got this! Start your day with intention and purpose.
             
             payload = {
                 "text": text,
-                "model_id": "eleven_monolingual_v1",
+                "model_id": self.tts_model_id,
                 "voice_settings": voice_settings
             }
             
@@ -318,6 +338,51 @@ You've got this! Start your day with intention and purpose.
             self.logger.error(f"Error generating speech: {e}")
             return None
     
+    def _stream_speech_to_cache(self, text: str, key: str):
+        """Stream speech from ElevenLabs straight into the audio cache.
+
+        Uses the streaming endpoint so audio is written to disk as it is
+        generated instead of being buffered in memory first.
+        """
+        if not self.tts_enabled:
+            return None
+
+        payload = {
+            "text": text,
+            "model_id": self.tts_model_id,
+            "voice_settings": {
+                "stability": 0.5,
+                "similarity_boost": 0.8,
+                "style": 0.0,
+                "use_speaker_boost": True
+            }
+        }
+        headers = {
+            "Accept": "audio/mpeg",
+            "Content-Type": "application/json",
+            "xi-api-key": self.elevenlabs_api_key
+        }
+        url = f"https://api.elevenlabs.io/v1/text-to-speech/{self.voice_id}/stream"
+
+        try:
+            self.logger.info(f"Streaming speech for {len(text)} characters")
+            with requests.post(url, json=payload, headers=headers, stream=True, timeout=60) as response:
+                if response.status_code != 200:
+                    self.logger.error(f"ElevenLabs API error: {response.status_code} - {response.text}")
+                    return None
+                path = self.audio_cache.put_stream(key, response.iter_content(chunk_size=16 * 1024))
+
+            if path:
+                self.logger.info(f"Streamed audio: {path.stat().st_size} bytes")
+            return path
+
+        except requests.exceptions.Timeout:
+            self.logger.error("ElevenLabs request timed out")
+            return None
+        except Exception as e:
+            self.logger.error(f"Error streaming speech: {e}")
+            return None
+    
     async def send_morning_routine_now(self, user_id: int):
         """Send morning routine immediately to a specific user."""
         try:
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark for AIAssistant / SimpleMultilingualAgent intent routing.
+Compares the per-keyword `any(word in text ...)` scans with the compiled
+KeywordIntentRouter on a mix of English and Russian messages.
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+# Add the parent directory to the path so we can import the modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from integrations.ai_assistant import AIAssistant
+from integrations.simple_multilingual_agent import SimpleMultilingualAgent
+
+
+SAMPLE_MESSAGES = [
+    "What should I work on today?",
+    "How am I doing with my goals and overall progress this month?",
+    "Tell me about my shadow archetypes",
+    "I want to set up habit tracking for my morning routine",
+    "Какие у меня задачи на сегодня?",
+    "Нужно подготовить презентацию к встрече по проекту",
+    "Расскажи про мой прогресс в обучении и курсы",
+    "Just saying hello, nothing in particular here at all",
+]
+
+
+def legacy_route(message: str) -> str:
+    """The original if/elif chain of substring scans."""
+    message_lower = message.lower()
+    for intent, keywords in AIAssistant.FALLBACK_ROUTER.intents:
+        if any(word in message_lower for word in keywords):
+            return intent
+    return None
+
+
+def legacy_matches(text: str, patterns: dict) -> list:
+    """The original nested loop over every pattern of every intent."""
+    text_lower = text.lower()
+    matched = []
+    for intent_name, pattern_list in patterns.items():
+        for pattern in pattern_list:
+            if pattern in text_lower:
+                matched.append((intent_name, pattern))
+    return matched
+
+
+def main():
+    router = AIAssistant.FALLBACK_ROUTER
+    ru_patterns = SimpleMultilingualAgent.RUSSIAN_PATTERNS
+    en_patterns = SimpleMultilingualAgent.ENGLISH_PATTERNS
+    ru_router = SimpleMultilingualAgent.RUSSIAN_ROUTER
+    en_router = SimpleMultilingualAgent.ENGLISH_ROUTER
+
+    # Sanity check: both implementations must agree.
+    for message in SAMPLE_MESSAGES:
+        assert legacy_route(message) == router.route(message), message
+        assert legacy_matches(message, ru_patterns) == ru_router.matches(message.lower()), message
+        assert legacy_matches(message, en_patterns) == en_router.matches(message.lower()), message
+
+    number = 2000
+    cases = [
+        ("AIAssistant fallback (before)", lambda: [legacy_route(m) for m in SAMPLE_MESSAGES]),
+        ("AIAssistant fallback (after)", lambda: [router.route(m) for m in SAMPLE_MESSAGES]),
+        ("Multilingual ru+en (before)", lambda: [
+            (legacy_matches(m, ru_patterns), legacy_matches(m, en_patterns)) for m in SAMPLE_MESSAGES
+        ]),
+        ("Multilingual ru+en (after)", lambda: [
+            (ru_router.matches(m.lower()), en_router.matches(m.lower())) for m in SAMPLE_MESSAGES
+        ]),
+    ]
+
+    print("🧪 Intent routing benchmark")
+    print("=" * 50)
+    for name, func in cases:
+        elapsed = min(timeit.repeat(func, number=number, repeat=5))
+        per_message_us = elapsed / (number * len(SAMPLE_MESSAGES)) * 1e6
+        print(f"{name:<32} {per_message_us:8.2f} µs/message")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,14 @@ Task Integration Service
 Integrates with various task management systems to provide top priority tasks
 """
 
+import heapq
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 import sys
 import os
 
@@ -16,8 +19,32 @@ import os
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.append(str(project_root))
 
+# Home of the daily operations trackers and their shared record store
+DAILY_OPERATIONS_PATH = project_root / "automation" / "scripts" / "daily_operations"
+
 logger = logging.getLogger(__name__)
 
+PRIORITY_ORDER = {'high': 3, 'medium': 2, 'low': 1, 'urgent': 4, 'critical': 5}
+
+
+def _due_ordinal(task: Dict[str, Any]) -> Optional[int]:
+    """Day ordinal of a task's due date, or None if it has none or it is unparseable."""
+    due = task.get('due_date')
+    if not due:
+        return None
+    try:
+        return date.fromisoformat(str(due)[:10]).toordinal()
+    except ValueError:
+        return None
+
+
+def task_rank(task: Dict[str, Any]) -> tuple:
+    """Sort key, larger is more important: priority, then earliest due date, undated last."""
+    priority = PRIORITY_ORDER.get(str(task.get('priority') or 'low').lower(), 0)
+    due = _due_ordinal(task)
+    return (priority, due is not None, -due if due is not None else 0)
+
+
 class TaskIntegrationService:
     """Service to integrate with task management systems and get top priority tasks."""
     
@@ -31,20 +58,18 @@ class TaskIntegrationService:
             self._get_startup_tasks,
             self._get_general_tasks
         ]
+        
+        # Parsed tasks per (source, file), reused while mtime and size are unchanged
+        self._file_cache: Dict[tuple, tuple] = {}
+        self._cache_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=len(self.task_sources),
+                                            thread_name_prefix="task-sources")
+        self._daily_store = None
     
     def get_top_3_tasks(self) -> Dict[str, Any]:
         """Get the top 3 priority tasks for today."""
         try:
-            all_tasks = []
-            
-            # Collect tasks from all sources
-            for source_func in self.task_sources:
-                try:
-                    tasks = source_func()
-                    if tasks:
-                        all_tasks.extend(tasks)
-                except Exception as e:
-                    self.logger.warning(f"Failed to get tasks from {source_func.__name__}: {e}")
+            all_tasks = self._collect_tasks()
             
             if not all_tasks:
                 return {
@@ -54,11 +79,8 @@ class TaskIntegrationService:
                     'count': 0
                 }
             
-            # Sort by priority and select top 3
-            priority_order = {'high': 3, 'medium': 2, 'low': 1, 'urgent': 4, 'critical': 5}
-            all_tasks.sort(key=lambda x: priority_order.get(x.get('priority', 'low').lower(), 0), reverse=True)
-            
-            top_3_tasks = all_tasks[:3]
+            # nlargest is stable, so ties keep source order
+            top_3_tasks = [dict(task) for task in heapq.nlargest(3, all_tasks, key=task_rank)]
             
             return {
                 'success': True,
@@ -77,25 +99,84 @@ class TaskIntegrationService:
                 'count': 0
             }
     
+    def _collect_tasks(self) -> List[Dict[str, Any]]:
+        """Load all sources concurrently, keeping the source order in the result."""
+        futures = [(source_func, self._executor.submit(source_func)) for source_func in self.task_sources]
+        
+        all_tasks = []
+        for source_func, future in futures:
+            try:
+                tasks = future.result()
+                if tasks:
+                    all_tasks.extend(tasks)
+            except Exception as e:
+                self.logger.warning(f"Failed to get tasks from {source_func.__name__}: {e}")
+        return all_tasks
+    
+    def _load_cached(self, source: str, path: Path,
+                     extract: Callable[[Any], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Parse a JSON file through ``extract``, reusing the result while the
+        file's mtime and size are unchanged. Missing files yield no tasks.
+        """
+        key = (source, path)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            with self._cache_lock:
+                self._file_cache.pop(key, None)
+            return []
+        
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._cache_lock:
+            cached = self._file_cache.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+        
+        with open(path, 'r') as f:
+            tasks = extract(json.load(f))
+        
+        with self._cache_lock:
+            self._file_cache[key] = (signature, tasks)
+        return tasks
+    
+    def _get_daily_store(self):
+        """The daily operations task store, opened once."""
+        if self._daily_store is None:
+            if str(DAILY_OPERATIONS_PATH) not in sys.path:
+                sys.path.append(str(DAILY_OPERATIONS_PATH))
+            from record_store import open_store
+            self._daily_store = open_store("tasks", DAILY_OPERATIONS_PATH / "outputs")
+        return self._daily_store
+    
+    def _load_store_cached(self, source: str, store: Any,
+                           extract: Callable[[Any], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Like ``_load_cached`` for a record store, keyed on the store's write signature."""
+        key = (source, None)
+        signature = store.signature()
+        with self._cache_lock:
+            cached = self._file_cache.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+        
+        tasks = extract(store.query(status='pending'))
+        
+        with self._cache_lock:
+            self._file_cache[key] = (signature, tasks)
+        return tasks
+    
     def _get_automation_tasks(self) -> List[Dict[str, Any]]:
         """Get tasks from automation task manager."""
+        def extract(tasks):
+            # Filter for pending tasks and add source information
+            return [
+                {**task, 'source': 'automation', 'category': task.get('category', 'improvement')}
+                for task in tasks if task.get('status') == 'pending'
+            ]
+        
         try:
             tasks_file = project_root / "automation" / "outputs" / "tasks.json"
-            if not tasks_file.exists():
-                return []
-            
-            with open(tasks_file, 'r') as f:
-                tasks = json.load(f)
-            
-            # Filter for pending tasks
-            pending_tasks = [task for task in tasks if task.get('status') == 'pending']
-            
-            # Add source information
-            for task in pending_tasks:
-                task['source'] = 'automation'
-                task['category'] = task.get('category', 'improvement')
-            
-            return pending_tasks
+            return self._load_cached('automation', tasks_file, extract)
             
         except Exception as e:
             self.logger.warning(f"Error loading automation tasks: {e}")
@@ -103,32 +184,32 @@ class TaskIntegrationService:
     
     def _get_startup_tasks(self) -> List[Dict[str, Any]]:
         """Get tasks from startup project manager."""
+        def extract(project_data):
+            # Extract tasks from project
+            project_name = project_data.get('name', 'Unknown Project')
+            return [
+                {**task, 'source': 'startup', 'project': project_name}
+                for task in project_data.get('tasks', []) if task.get('status') != 'completed'
+            ]
+        
         try:
-            # Look for startup project files
-            startup_dir = project_root / "domains" / "my-startups"
-            if not startup_dir.exists():
+            # Check for Tango.Vision project tasks
+            tango_dir = project_root / "domains" / "my-startups" / "Tango.Vision" / "projects"
+            if not tango_dir.is_dir():
                 return []
             
-            tasks = []
+            project_files = sorted(
+                Path(entry.path) for entry in os.scandir(tango_dir)
+                if entry.name.endswith('.json') and entry.is_file()
+            )
+            self._forget_missing('startup', set(project_files))
             
-            # Check for Tango.Vision project tasks
-            tango_dir = startup_dir / "Tango.Vision" / "projects"
-            if tango_dir.exists():
-                # Look for project files
-                for project_file in tango_dir.glob("*.json"):
-                    try:
-                        with open(project_file, 'r') as f:
-                            project_data = json.load(f)
-                        
-                        # Extract tasks from project
-                        if 'tasks' in project_data:
-                            for task in project_data['tasks']:
-                                if task.get('status') != 'completed':
-                                    task['source'] = 'startup'
-                                    task['project'] = project_data.get('name', 'Unknown Project')
-                                    tasks.append(task)
-                    except Exception as e:
-                        self.logger.warning(f"Error loading project {project_file}: {e}")
+            tasks = []
+            for project_file in project_files:
+                try:
+                    tasks.extend(self._load_cached('startup', project_file, extract))
+                except Exception as e:
+                    self.logger.warning(f"Error loading project {project_file}: {e}")
             
             return tasks
             
@@ -136,37 +217,41 @@ class TaskIntegrationService:
             self.logger.warning(f"Error loading startup tasks: {e}")
             return []
     
+    def _forget_missing(self, source: str, present: set):
+        """Drop cache entries for files of a source that no longer exist."""
+        with self._cache_lock:
+            for key in [key for key in self._file_cache if key[0] == source and key[1] not in present]:
+                del self._file_cache[key]
+    
     def _get_general_tasks(self) -> List[Dict[str, Any]]:
         """Get general tasks from various sources."""
+        def extract_daily(daily_tasks):
+            return [
+                {**task, 'source': 'daily_operations'}
+                for task in daily_tasks if task.get('status') == 'pending'
+            ]
+        
+        def extract_health(health_data):
+            # Add health-related tasks if any
+            if not isinstance(health_data, dict):
+                return []
+            return [
+                {**task, 'source': 'health', 'category': 'health'}
+                for task in health_data.get('pending_tasks', [])
+            ]
+        
         try:
             tasks = []
             
             # Check for daily operations tasks
-            daily_tasks_file = project_root / "automation" / "scripts" / "daily_operations" / "outputs" / "tasks.json"
-            if daily_tasks_file.exists():
-                with open(daily_tasks_file, 'r') as f:
-                    daily_tasks = json.load(f)
-                
-                for task in daily_tasks:
-                    if task.get('status') == 'pending':
-                        task['source'] = 'daily_operations'
-                        tasks.append(task)
+            tasks.extend(self._load_store_cached('daily_operations', self._get_daily_store(), extract_daily))
             
             # Check for health tracking tasks
             health_file = project_root / "automation" / "outputs" / "health_data.json"
-            if health_file.exists():
-                try:
-                    with open(health_file, 'r') as f:
-                        health_data = json.load(f)
-                    
-                    # Add health-related tasks if any
-                    if 'pending_tasks' in health_data:
-                        for task in health_data['pending_tasks']:
-                            task['source'] = 'health'
-                            task['category'] = 'health'
-                            tasks.append(task)
-                except:
-                    pass
+            try:
+                tasks.extend(self._load_cached('health', health_file, extract_health))
+            except Exception:
+                pass
             
             return tasks
             
@@ -212,14 +297,7 @@ class TaskIntegrationService:
     def get_task_summary(self) -> str:
         """Get a brief summary of all available tasks."""
         try:
-            all_tasks = []
-            for source_func in self.task_sources:
-                try:
-                    tasks = source_func()
-                    if tasks:
-                        all_tasks.extend(tasks)
-                except:
-                    pass
+            all_tasks = self._collect_tasks()
             
             if not all_tasks:
                 return "📊 **Task Summary:** No tasks found"
@@ -0,0 +1,106 @@
+"""
+Content-addressed on-disk cache for generated speech audio.
+
+Audio is stored under a hash of the text, voice and model, so identical
+scripts are rendered once. The cache is bounded by total size and evicts the
+least recently used files first.
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+from utils.logger import get_logger
+
+
+class AudioCache:
+    """Size-bounded, content-addressed store of rendered audio files."""
+
+    def __init__(self, cache_dir: str = "data/cache/tts", max_bytes: int = 200 * 1024 * 1024,
+                 suffix: str = ".mp3"):
+        self.logger = get_logger(__name__)
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(text: str, voice_id: str, model_id: str) -> str:
+        payload = "\0".join([model_id, voice_id, text.strip()])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the cached file path, marking it recently used, or None."""
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key: str, audio_data: bytes) -> Path:
+        """Store audio atomically and evict old entries if over budget."""
+        path = self.path_for(key)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(audio_data)
+        os.replace(tmp_path, path)
+        self.evict()
+        return path
+
+    def put_stream(self, key: str, chunks: Iterable[bytes]) -> Optional[Path]:
+        """Write streamed audio chunks straight to disk, publishing the file atomically.
+
+        Returns None, leaving no partial file behind, if the stream was empty
+        or raised.
+        """
+        path = self.path_for(key)
+        tmp_path = path.with_name(path.name + ".tmp")
+        size = 0
+        try:
+            with open(tmp_path, 'wb') as f:
+                for chunk in chunks:
+                    if chunk:
+                        f.write(chunk)
+                        size += len(chunk)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        if not size:
+            tmp_path.unlink(missing_ok=True)
+            return None
+
+        os.replace(tmp_path, path)
+        self.evict()
+        return path
+
+    def evict(self):
+        """Delete least recently used files until the cache fits in max_bytes."""
+        with self._lock:
+            entries = []
+            total = 0
+            for path in self.cache_dir.glob(f"*{self.suffix}"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                self.logger.info(f"Evicted cached audio {path.name} ({size} bytes)")
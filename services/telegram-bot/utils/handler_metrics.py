@@ -0,0 +1,130 @@
+"""
+Handler latency metrics for the Personal System Telegram Bot.
+
+Records per-command and per-callback latency histograms and error counts,
+plus event-loop lag measured by a periodic sleep probe, for the health check
+server's /metrics endpoint.
+"""
+
+import asyncio
+import bisect
+from typing import Any, Dict, List, Optional
+
+from utils.logger import get_logger
+
+
+# Histogram bucket upper bounds in milliseconds; the last bucket is open-ended
+LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000]
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with count, sum and max."""
+
+    def __init__(self, buckets: List[float] = LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float):
+        self.counts[bisect.bisect_left(self.buckets, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th percentile, capped at the observed max."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(float(self.buckets[index]), self.max_ms) if index < len(self.buckets) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"le_{bound}" for bound in self.buckets] + ["le_inf"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else None,
+            "max_ms": round(self.max_ms, 2),
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class HandlerMetrics:
+    """Latency and error counters keyed by handler name, plus event-loop lag."""
+
+    # Cap on distinct handler names so arbitrary callback data can't grow memory
+    MAX_NAMES = 200
+
+    def __init__(self, probe_interval: float = 0.5):
+        self.logger = get_logger(__name__)
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.errors: Dict[str, int] = {}
+        self.loop_lag = LatencyHistogram()
+        self.last_loop_lag_ms = 0.0
+        self.probe_interval = probe_interval
+        self._probe_task: Optional[asyncio.Task] = None
+
+    def observe(self, name: str, seconds: float, error: bool = False):
+        if name not in self.latency:
+            if len(self.latency) >= self.MAX_NAMES:
+                name = "other"
+            self.latency.setdefault(name, LatencyHistogram())
+        self.latency[name].observe(seconds * 1000)
+        if error:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def start_loop_probe(self):
+        """Start measuring event-loop lag on the running loop."""
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = asyncio.create_task(self._probe_loop())
+
+    async def stop_loop_probe(self):
+        if self._probe_task:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+            self._probe_task = None
+
+    async def _probe_loop(self):
+        """Sleep for a fixed interval; any extra delay is time the loop was blocked."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.probe_interval
+            await asyncio.sleep(self.probe_interval)
+            lag_ms = max(0.0, (loop.time() - expected) * 1000)
+            self.last_loop_lag_ms = lag_ms
+            self.loop_lag.observe(lag_ms)
+            if lag_ms > 1000:
+                self.logger.warning(f"Event loop blocked for {lag_ms:.0f}ms")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "handlers": {
+                name: {**histogram.snapshot(), "errors": self.errors.get(name, 0)}
+                for name, histogram in sorted(self.latency.items())
+            },
+            "event_loop_lag": {
+                **self.loop_lag.snapshot(),
+                "last_ms": round(self.last_loop_lag_ms, 2),
+                "probe_interval_s": self.probe_interval,
+            },
+        }
+
+
+def callback_metric_name(update: Any) -> str:
+    """Metric name for a callback query: its data up to the first ':'."""
+    query = getattr(update, "callback_query", None)
+    if query is None or not query.data:
+        return "callback"
+    return "callback:" + query.data.split(":", 1)[0][:48]
@@ -0,0 +1,63 @@
+"""
+Import-time profiling for the Personal System Telegram Bot.
+
+Records how long each startup and lazily loaded module took to import, and
+how long it took from process start until the bot began polling. Import this
+module first in the entry point so the start time is taken before the heavy
+imports.
+"""
+
+import importlib
+import logging
+import time
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Dict, List, Optional, Tuple
+
+
+PROCESS_START = time.perf_counter()
+
+_import_times: Dict[str, float] = {}
+_startup_duration: Optional[float] = None
+
+
+@contextmanager
+def timed_import(name: str):
+    """Time the imports made inside the block and record them under ``name``."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _import_times[name] = _import_times.get(name, 0.0) + time.perf_counter() - started
+
+
+def import_module(name: str) -> ModuleType:
+    """``importlib.import_module`` that records the import time on first load."""
+    with timed_import(name):
+        return importlib.import_module(name)
+
+
+def get_import_profile() -> List[Tuple[str, float]]:
+    """Recorded import times, slowest first. Nested imports count toward the outer module."""
+    return sorted(_import_times.items(), key=lambda item: item[1], reverse=True)
+
+
+def mark_startup_complete() -> float:
+    """Record the time from process start to now, once, and return it."""
+    global _startup_duration
+    if _startup_duration is None:
+        _startup_duration = time.perf_counter() - PROCESS_START
+    return _startup_duration
+
+
+def get_startup_duration() -> Optional[float]:
+    return _startup_duration
+
+
+def log_startup_profile(logger: logging.Logger, top: int = 10):
+    """Log time to polling and the slowest imports seen so far."""
+    duration = mark_startup_complete()
+    profile = get_import_profile()[:top]
+    logger.info(f"Startup profile: {duration:.2f}s from process start to polling")
+    for name, seconds in profile:
+        logger.info(f"  import {name:<40} {seconds * 1000:8.1f} ms")
@@ -0,0 +1,103 @@
+"""
+Keyword intent routing for the Personal System Telegram Bot.
+
+Compiles every intent's keyword list into a single regex so a message is
+scanned once, instead of once per keyword per intent.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class KeywordIntentRouter:
+    """Map free text to intents by substring keywords, with priority by declaration order."""
+
+    def __init__(self, intents: Iterable[Tuple[str, Iterable[str]]]):
+        self._pairs: List[Tuple[str, str]] = []
+        owners: Dict[str, List[Tuple[int, str]]] = {}
+
+        for priority, (intent, keywords) in enumerate(intents):
+            for keyword in keywords:
+                keyword = keyword.lower()
+                self._pairs.append((intent, keyword))
+                owners.setdefault(keyword, []).append((priority, intent))
+
+        # The alternation is built as a prefix trie, so the regex engine can
+        # skip ahead to offsets starting with a keyword's first character and
+        # then branch once per character. Each search takes the longest keyword
+        # at the earliest offset and the next search restarts one character
+        # later; shorter keywords hidden inside a match are recovered through
+        # the substring closure below. Together this gives the same answer as
+        # a plain `keyword in text` check for every keyword.
+        self._pattern = re.compile(_trie_pattern(owners)) if owners else None
+
+        self._contained: Dict[str, Set[str]] = {
+            keyword: {other for other in owners if other in keyword}
+            for keyword in owners
+        }
+        self._positions: Dict[str, List[int]] = {}
+        for position, (_, keyword) in enumerate(self._pairs):
+            self._positions.setdefault(keyword, []).append(position)
+        self._owners = owners
+
+    @property
+    def intents(self) -> List[Tuple[str, List[str]]]:
+        """Return the (intent, keywords) table in priority order."""
+        table: Dict[str, List[str]] = {}
+        for intent, keyword in self._pairs:
+            table.setdefault(intent, []).append(keyword)
+        return list(table.items())
+
+    def keywords_in(self, text: str) -> Set[str]:
+        """Return every registered keyword that occurs in the text."""
+        if self._pattern is None:
+            return set()
+        text = text.lower()
+        search = self._pattern.search
+        found: Set[str] = set()
+        match = search(text)
+        while match:
+            keyword = match.group()
+            if keyword not in found:
+                found |= self._contained[keyword]
+            match = search(text, match.start() + 1)
+        return found
+
+    def matches(self, text: str) -> List[Tuple[str, str]]:
+        """Return (intent, keyword) pairs present in the text, in declaration order."""
+        positions = sorted(
+            position
+            for keyword in self.keywords_in(text)
+            for position in self._positions[keyword]
+        )
+        return [self._pairs[position] for position in positions]
+
+    def route(self, text: str, default: Optional[str] = None) -> Optional[str]:
+        """Return the highest-priority intent with a keyword in the text."""
+        best = None
+        for keyword in self.keywords_in(text):
+            for priority, intent in self._owners[keyword]:
+                if best is None or priority < best[0]:
+                    best = (priority, intent)
+        return best[1] if best else default
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Build a regex alternation that prefers the longest keyword, factored by prefix."""
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def render(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Keywords ending here are optional suffix points; the greedy `?`
+        # keeps the longest continuation first.
+        return '(?:' + body + ')?' if '' in node else body
+
+    return render(trie)
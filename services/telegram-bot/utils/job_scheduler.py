@@ -0,0 +1,330 @@
+"""
+Priority-queue job scheduler for the Personal System Telegram Bot.
+
+Jobs are kept in a min-heap ordered by their next run time and the loop sleeps
+until the earliest one is due. Supports cron-like, interval and one-shot
+schedules, timezone-aware via pytz, with missed-run catch-up across restarts
+and per-job run-duration metrics.
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+import pytz
+
+from utils.logger import get_logger
+
+
+class CronSchedule:
+    """Cron-like schedule: ``minute hour day-of-month month day-of-week``.
+
+    Each field accepts ``*``, numbers, lists (``1,15``), ranges (``1-5``) and
+    steps (``*/15``). Day of week runs 0-6 starting on Monday, like
+    ``datetime.weekday()``.
+    """
+
+    FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)]
+
+    def __init__(self, expression: str, timezone: pytz.BaseTzInfo):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: {expression!r}")
+        self.expression = expression
+        self.timezone = timezone
+        self.minutes, self.hours, self.days, self.months, self.weekdays = [
+            self._parse_field(field, low, high)
+            for field, (low, high) in zip(fields, self.FIELD_RANGES)
+        ]
+        self._sorted_times = sorted((h, m) for h in self.hours for m in self.minutes)
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> Set[int]:
+        values: Set[int] = set()
+        for part in field.split(','):
+            step = 1
+            if '/' in part:
+                part, step_text = part.split('/', 1)
+                step = int(step_text)
+            if part == '*':
+                start, end = low, high
+            elif '-' in part:
+                start_text, end_text = part.split('-', 1)
+                start, end = int(start_text), int(end_text)
+            else:
+                start = end = int(part)
+            if start < low or end > high or start > end:
+                raise ValueError(f"Cron field {field!r} out of range {low}-{high}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def next_after(self, after: datetime) -> Optional[datetime]:
+        local = after.astimezone(self.timezone)
+        day = local.date()
+        after_hm = (local.hour, local.minute)
+
+        for offset in range(366 * 4):
+            candidate_day = day + timedelta(days=offset)
+            if (candidate_day.month not in self.months or candidate_day.day not in self.days
+                    or candidate_day.weekday() not in self.weekdays):
+                continue
+            for hour, minute in self._sorted_times:
+                if offset == 0 and (hour, minute) <= after_hm:
+                    continue
+                naive = datetime(candidate_day.year, candidate_day.month, candidate_day.day, hour, minute)
+                return self.timezone.normalize(self.timezone.localize(naive))
+        return None
+
+    def __repr__(self):
+        return f"cron({self.expression})"
+
+
+class IntervalSchedule:
+    """Run every ``seconds`` seconds."""
+
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise ValueError("Interval must be positive")
+        self.interval = timedelta(seconds=seconds)
+
+    def next_after(self, after: datetime) -> Optional[datetime]:
+        return after + self.interval
+
+    def __repr__(self):
+        return f"every({self.interval.total_seconds():g}s)"
+
+
+class OneShotSchedule:
+    """Run once at a fixed moment."""
+
+    def __init__(self, run_at: datetime):
+        self.run_at = run_at
+
+    def next_after(self, after: datetime) -> Optional[datetime]:
+        return self.run_at if self.run_at > after else None
+
+    def __repr__(self):
+        return f"at({self.run_at.isoformat()})"
+
+
+class Job:
+    """A scheduled coroutine plus its run statistics."""
+
+    def __init__(self, name: str, func: Callable[[], Awaitable[Any]], schedule,
+                 catch_up_window: Optional[timedelta] = None):
+        self.name = name
+        self.func = func
+        self.schedule = schedule
+        self.catch_up_window = catch_up_window
+        self.next_run: Optional[datetime] = None
+        self.last_run: Optional[datetime] = None
+        self.running = False
+
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self.total_duration = 0.0
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "schedule": repr(self.schedule),
+            "next_run": self.next_run.isoformat() if self.next_run else None,
+            "last_run": self.last_run.isoformat() if self.last_run else None,
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped_overlapping": self.skipped,
+            "last_duration": round(self.last_duration, 3),
+            "max_duration": round(self.max_duration, 3),
+            "avg_duration": round(self.total_duration / self.runs, 3) if self.runs else 0.0,
+        }
+
+
+class JobScheduler:
+    """Runs jobs from a min-heap keyed by next run time."""
+
+    # Upper bound on a single sleep so wall-clock jumps are noticed.
+    MAX_SLEEP = 300.0
+
+    def __init__(self, timezone: pytz.BaseTzInfo, state_file: str = "data/storage/scheduler_state.json"):
+        self.logger = get_logger(__name__)
+        self.timezone = timezone
+        self.state_file = Path(state_file)
+        self.jobs: Dict[str, Job] = {}
+        self._heap: List[tuple] = []
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._tasks: Set[asyncio.Task] = set()
+        self.running = False
+        self._state = self._load_state()
+
+    def now(self) -> datetime:
+        return datetime.now(self.timezone)
+
+    # ------------------------------------------------------------------
+    # Job registration
+    # ------------------------------------------------------------------
+
+    def add_cron_job(self, name: str, func: Callable[[], Awaitable[Any]], expression: str,
+                     catch_up_window: Optional[timedelta] = None) -> Job:
+        return self.add_job(Job(name, func, CronSchedule(expression, self.timezone), catch_up_window))
+
+    def add_interval_job(self, name: str, func: Callable[[], Awaitable[Any]], seconds: float) -> Job:
+        return self.add_job(Job(name, func, IntervalSchedule(seconds)))
+
+    def add_one_shot_job(self, name: str, func: Callable[[], Awaitable[Any]], run_at: datetime) -> Job:
+        if run_at.tzinfo is None:
+            run_at = self.timezone.localize(run_at)
+        return self.add_job(Job(name, func, OneShotSchedule(run_at)))
+
+    def add_job(self, job: Job) -> Job:
+        """Register a job, scheduling a catch-up run if its last slot was missed."""
+        now = self.now()
+        last_run = self._state.get(job.name)
+        job.last_run = datetime.fromisoformat(last_run) if last_run else None
+
+        missed = None
+        if job.catch_up_window and job.last_run:
+            # The latest slot due since the last run; earlier missed slots are not replayed
+            slot = job.schedule.next_after(job.last_run)
+            while slot and slot <= now:
+                following = job.schedule.next_after(slot)
+                if not following or following > now:
+                    break
+                slot = following
+            if slot and slot <= now and now - slot <= job.catch_up_window:
+                missed = slot
+
+        if missed:
+            self.logger.info(f"Job {job.name} missed its {missed.isoformat()} run, catching up")
+            job.next_run = now
+        else:
+            job.next_run = job.schedule.next_after(now)
+
+        self.jobs[job.name] = job
+        self._push(job)
+        return job
+
+    def remove_job(self, name: str):
+        """Remove a job; its stale heap entry is discarded lazily."""
+        job = self.jobs.pop(name, None)
+        if job:
+            job.next_run = None
+
+    # ------------------------------------------------------------------
+    # Main loop
+    # ------------------------------------------------------------------
+
+    async def run(self):
+        """Run until stop() is called."""
+        self.running = True
+        self.logger.info(f"Job scheduler started with {len(self.jobs)} jobs")
+
+        while self.running:
+            self._discard_stale_entries()
+            if self._heap:
+                delay = self._heap[0][0] - time.time()
+            else:
+                delay = self.MAX_SLEEP
+
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=min(delay, self.MAX_SLEEP))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, job, scheduled_for = heapq.heappop(self._heap)
+            if job.running:
+                job.skipped += 1
+                self.logger.warning(f"Job {job.name} still running, skipping {scheduled_for.isoformat()} run")
+            else:
+                task = asyncio.create_task(self._run_job(job, scheduled_for))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+            # Schedule from the slot, not from completion, so slow jobs don't drift.
+            job.next_run = job.schedule.next_after(max(scheduled_for, self.now()))
+            if job.next_run:
+                self._push(job)
+            else:
+                self.jobs.pop(job.name, None)
+
+    async def stop(self):
+        self.running = False
+        self._wakeup.set()
+        for task in list(self._tasks):
+            task.cancel()
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        return {name: job.metrics() for name, job in self.jobs.items()}
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _run_job(self, job: Job, scheduled_for: datetime):
+        job.running = True
+        started = time.perf_counter()
+        lag = (self.now() - scheduled_for).total_seconds()
+        cancelled = False
+        try:
+            self.logger.info(f"Running job {job.name} (scheduled {scheduled_for.isoformat()}, lag {lag:.2f}s)")
+            await job.func()
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        except Exception as e:
+            job.failures += 1
+            self.logger.error(f"Job {job.name} failed: {e}")
+        finally:
+            duration = time.perf_counter() - started
+            job.running = False
+            job.runs += 1
+            job.last_duration = duration
+            job.total_duration += duration
+            job.max_duration = max(job.max_duration, duration)
+            if cancelled:
+                self.logger.info(f"Job {job.name} cancelled after {duration:.2f}s")
+            else:
+                # Only a completed run counts, so a cancelled slot can still be caught up
+                job.last_run = scheduled_for
+                self._state[job.name] = scheduled_for.isoformat()
+                self._save_state()
+                self.logger.info(f"Job {job.name} finished in {duration:.2f}s")
+
+    def _push(self, job: Job):
+        heapq.heappush(self._heap, (job.next_run.timestamp(), next(self._counter), job, job.next_run))
+        self._wakeup.set()
+
+    def _discard_stale_entries(self):
+        while self._heap:
+            _, _, job, scheduled_for = self._heap[0]
+            if self.jobs.get(job.name) is job and job.next_run == scheduled_for:
+                return
+            heapq.heappop(self._heap)
+
+    def _load_state(self) -> Dict[str, str]:
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_state(self):
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.state_file.with_name(self.state_file.name + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._state, f, indent=2)
+            os.replace(tmp_path, self.state_file)
+        except Exception as e:
+            self.logger.warning(f"Could not save scheduler state: {e}")
@@ -2,25 +2,95 @@
 Logging utilities for the Personal System Telegram Bot.
 """
 
+import atexit
+import copy
+import json
 import logging
 import logging.handlers
 import os
+import queue
+import threading
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Dict, Optional
 
 
-def setup_logging(log_level: str = "INFO", log_file: str = "logs/bot.log"):
-    """Setup logging configuration for the bot."""
+class JsonLineFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full."""
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self.dropped_by_level: Dict[str, int] = {}
+        self._count_lock = threading.Lock()
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge args into the message but keep the traceback separate for the formatter."""
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._count_lock:
+                self.dropped += 1
+                self.dropped_by_level[record.levelname] = self.dropped_by_level.get(record.levelname, 0) + 1
+
+
+_exception_formatter = logging.Formatter()
+_queue_handler: Optional[DroppingQueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging(log_level: str = "INFO", log_file: str = "logs/bot.log",
+                  json_format: Optional[bool] = None, queue_size: int = 10000):
+    """Setup logging configuration for the bot.
+    
+    Handlers only enqueue records; a listener thread does the file and console
+    I/O, so logging never blocks the event loop. Set ``json_format`` (or
+    ``LOG_FORMAT=json``) for one JSON object per line.
+    """
+    global _queue_handler, _listener
+    
+    if json_format is None:
+        json_format = os.getenv('LOG_FORMAT', '').lower() == 'json'
     
     # Create logs directory if it doesn't exist
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Configure logging format
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    if json_format:
+        formatter = JsonLineFormatter()
+    else:
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
     
     # Setup file handler with rotation
     file_handler = logging.handlers.RotatingFileHandler(
@@ -35,6 +105,14 @@ def setup_logging(log_level: str = "INFO", log_file: str = "logs/bot.log"):
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
     
+    # Replace any previous listener so repeated setup doesn't leak writer threads
+    shutdown_logging()
+    
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    _queue_handler = DroppingQueueHandler(log_queue)
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+    _listener.start()
+    
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
@@ -44,8 +122,7 @@ def setup_logging(log_level: str = "INFO", log_file: str = "logs/bot.log"):
         root_logger.removeHandler(handler)
     
     # Add handlers
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(_queue_handler)
     
     # Set specific logger levels
     logging.getLogger('telegram').setLevel(logging.WARNING)
@@ -53,6 +130,32 @@ def setup_logging(log_level: str = "INFO", log_file: str = "logs/bot.log"):
     logging.getLogger('urllib3').setLevel(logging.WARNING)
 
 
+def shutdown_logging():
+    """Flush queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+def get_logging_stats() -> Dict[str, Any]:
+    """Queue depth and drop counters, for the health endpoint."""
+    if _queue_handler is None:
+        return {"queued": False}
+    return {
+        "queued": True,
+        "queue_depth": _queue_handler.queue.qsize(),
+        "queue_capacity": _queue_handler.queue.maxsize,
+        "dropped": _queue_handler.dropped,
+        "dropped_by_level": dict(_queue_handler.dropped_by_level),
+    }
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance with the given name."""
     return logging.getLogger(name)
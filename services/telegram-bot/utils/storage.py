@@ -0,0 +1,377 @@
+"""
+Append-only JSONL storage engine for the Personal System Telegram Bot.
+
+Each logical log (e.g. ``journal_entries.json``) is stored as a directory of
+JSONL segments. Appends write a single line to the active segment, fsyncs are
+batched, full segments are rotated, and sealed segments are periodically
+compacted into one. Reads return the same list-of-dicts shape as the legacy
+JSON array files.
+
+Per-user reads go through ``UserTimelineIndex``, an in-memory index that is
+rebuilt from the log on first use and kept current on every append.
+"""
+
+import atexit
+import bisect
+import copy
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from utils.logger import get_logger
+
+
+SEGMENT_SUFFIX = ".jsonl"
+
+
+class UserTimelineIndex:
+    """Time-ordered entries per user, plus lazily built per-field sub-indexes."""
+
+    def __init__(self):
+        self._timelines: Dict[Tuple, Tuple[List[Tuple[str, int]], List[Dict[str, Any]]]] = {}
+        self._fields: set = set()
+        self._seq = 0
+
+    def add(self, entry: Dict[str, Any]):
+        """Index one entry under its user and every tracked field value."""
+        key = (entry.get('timestamp', ''), self._seq)
+        self._seq += 1
+        user_id = entry.get('user_id')
+
+        self._insert((user_id,), key, entry)
+        for field in self._fields:
+            self._insert((user_id, field, entry.get(field)), key, entry)
+
+    def track_field(self, field: str):
+        """Start maintaining a (user_id, field, value) sub-index."""
+        if field in self._fields:
+            return
+        self._fields.add(field)
+        for timeline_key, (keys, entries) in list(self._timelines.items()):
+            if len(timeline_key) != 1:
+                continue
+            for sort_key, entry in zip(keys, entries):
+                self._insert((timeline_key[0], field, entry.get(field)), sort_key, entry)
+
+    def query(self, user_id: Any, limit: Optional[int] = None, cursor: Optional[str] = None,
+              **filters) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Return newest-first copies of a user's entries and the cursor for the next page."""
+        filters = {field: value for field, value in filters.items() if value is not None}
+
+        timeline_key: Tuple = (user_id,)
+        if filters:
+            field, value = next(iter(filters.items()))
+            self.track_field(field)
+            timeline_key = (user_id, field, value)
+
+        keys, entries = self._timelines.get(timeline_key, ([], []))
+        pos = len(keys)
+        if cursor:
+            pos = bisect.bisect_left(keys, self._decode_cursor(cursor))
+
+        results = []
+        last_key = None
+        while pos > 0 and (limit is None or len(results) < limit):
+            pos -= 1
+            entry = entries[pos]
+            if all(entry.get(field) == value for field, value in filters.items()):
+                results.append(copy.deepcopy(entry))
+                last_key = keys[pos]
+
+        next_cursor = None
+        if pos > 0 and last_key is not None:
+            next_cursor = f"{last_key[0]}|{last_key[1]}"
+        return results, next_cursor
+
+    def _insert(self, timeline_key: Tuple, sort_key: Tuple[str, int], entry: Dict[str, Any]):
+        keys, entries = self._timelines.setdefault(timeline_key, ([], []))
+        if not keys or keys[-1] <= sort_key:
+            keys.append(sort_key)
+            entries.append(entry)
+        else:
+            pos = bisect.bisect_right(keys, sort_key)
+            keys.insert(pos, sort_key)
+            entries.insert(pos, entry)
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[str, int]:
+        timestamp, _, seq = cursor.rpartition('|')
+        return timestamp, int(seq)
+
+
+class JsonlLogStore:
+    """Append-only log of JSON entries split into rotating segments."""
+
+    def __init__(self, legacy_file: Path, fsync_every: int = 16, fsync_interval: float = 1.0,
+                 max_segment_bytes: int = 4 * 1024 * 1024, compact_threshold: int = 8):
+        self.logger = get_logger(__name__)
+        self.legacy_file = Path(legacy_file)
+        self.segment_dir = self.legacy_file.with_suffix('')
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.max_segment_bytes = max_segment_bytes
+        self.compact_threshold = compact_threshold
+
+        self._lock = threading.RLock()
+        self._handle = None
+        self._active: Optional[Tuple[int, int]] = None
+        self._active_size = 0
+        self._pending_sync = 0
+        self._last_sync = time.monotonic()
+        self._index: Optional[UserTimelineIndex] = None
+
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        self._migrate_legacy_file()
+        self._drop_covered_segments()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def append(self, entry: Dict[str, Any]):
+        """Append one entry. Cost is independent of the history size."""
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        data = line.encode('utf-8')
+
+        with self._lock:
+            handle = self._active_handle()
+            handle.write(data)
+            handle.flush()
+            self._active_size += len(data)
+            self._pending_sync += 1
+
+            if (self._pending_sync >= self.fsync_every
+                    or time.monotonic() - self._last_sync >= self.fsync_interval):
+                self._sync()
+
+            if self._active_size >= self.max_segment_bytes:
+                self._rotate()
+
+            if self._index is not None:
+                self._index.add(entry)
+
+    def read_all(self) -> List[Dict[str, Any]]:
+        """Return every entry in insertion order, like the legacy JSON array."""
+        with self._lock:
+            if self._handle:
+                self._handle.flush()
+            entries = []
+            for _, path in self._list_segments():
+                entries.extend(self._read_segment(path))
+            return entries
+
+    def query(self, user_id: Any, limit: Optional[int] = None, cursor: Optional[str] = None,
+              **filters) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Return a newest-first page of a user's entries, optionally filtered by field values."""
+        with self._lock:
+            if self._index is None:
+                self._index = UserTimelineIndex()
+                for entry in self.read_all():
+                    self._index.add(entry)
+            return self._index.query(user_id, limit=limit, cursor=cursor, **filters)
+
+    def flush(self):
+        """Force pending writes to disk."""
+        with self._lock:
+            if self._handle and self._pending_sync:
+                self._sync()
+
+    def close(self):
+        """Flush and close the active segment."""
+        with self._lock:
+            if self._handle:
+                self._sync()
+                self._handle.close()
+                self._handle = None
+                self._active = None
+
+    def compact(self):
+        """Merge all sealed segments into a single segment."""
+        with self._lock:
+            sealed = [seg for seg in self._list_segments() if seg[0] != self._active]
+            if len(sealed) < 2:
+                return
+
+            first, last = sealed[0][0][0], sealed[-1][0][1]
+            target = self._segment_path((first, last))
+            tmp_path = target.with_name(target.name + ".tmp")
+
+            with open(tmp_path, 'wb') as out:
+                for _, path in sealed:
+                    for entry in self._read_segment(path):
+                        out.write((json.dumps(entry, ensure_ascii=False) + "\n").encode('utf-8'))
+                out.flush()
+                os.fsync(out.fileno())
+
+            # The merged segment covers every range it replaces, so a crash
+            # before the unlinks below is repaired by _drop_covered_segments.
+            os.replace(tmp_path, target)
+            self._fsync_dir()
+            for (seg_range, path) in sealed:
+                if seg_range != (first, last):
+                    path.unlink(missing_ok=True)
+
+            self.logger.info(f"Compacted {len(sealed)} segments of {self.segment_dir.name}")
+
+    # ------------------------------------------------------------------
+    # Segment management
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, seg_range: Tuple[int, int]) -> Path:
+        return self.segment_dir / f"{seg_range[0]:08d}-{seg_range[1]:08d}{SEGMENT_SUFFIX}"
+
+    def _list_segments(self) -> List[Tuple[Tuple[int, int], Path]]:
+        segments = []
+        for path in self.segment_dir.glob(f"*{SEGMENT_SUFFIX}"):
+            try:
+                start, end = path.stem.split('-', 1)
+                segments.append(((int(start), int(end)), path))
+            except ValueError:
+                continue
+        segments.sort(key=lambda seg: seg[0])
+        return segments
+
+    def _drop_covered_segments(self):
+        """Remove segments left behind by an interrupted compaction."""
+        segments = self._list_segments()
+        for seg_range, path in segments:
+            covered = any(
+                other != seg_range and other[0] <= seg_range[0] and seg_range[1] <= other[1]
+                for other, _ in segments
+            )
+            if covered:
+                path.unlink(missing_ok=True)
+
+    def _active_handle(self):
+        if self._handle is None:
+            segments = self._list_segments()
+            if segments:
+                seg_range, path = segments[-1]
+                self._active = seg_range
+                self._active_size = self._truncate_torn_tail(path)
+            else:
+                self._active = (0, 0)
+                self._active_size = 0
+            self._handle = open(self._segment_path(self._active), 'ab')
+        return self._handle
+
+    def _truncate_torn_tail(self, path: Path) -> int:
+        """Cut a partially written last line so new appends start cleanly."""
+        with open(path, 'rb+') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return 0
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return size
+
+            # Walk back to the last complete line.
+            pos = size
+            while pos > 0:
+                step = min(4096, pos)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                newline = chunk.rfind(b"\n")
+                if newline != -1:
+                    pos += newline + 1
+                    break
+            f.truncate(pos)
+            self.logger.warning(f"Truncated torn write at end of {path.name}")
+            return pos
+
+    def _rotate(self):
+        """Seal the active segment and start a new one."""
+        self._sync()
+        self._handle.close()
+
+        next_seq = self._active[1] + 1
+        self._active = (next_seq, next_seq)
+        self._handle = open(self._segment_path(self._active), 'xb')
+        self._active_size = 0
+        self._fsync_dir()
+
+        sealed_count = len(self._list_segments()) - 1
+        if sealed_count >= self.compact_threshold:
+            self.compact()
+
+    def _sync(self):
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._pending_sync = 0
+        self._last_sync = time.monotonic()
+
+    def _fsync_dir(self):
+        if not hasattr(os, 'O_DIRECTORY'):
+            return
+        fd = os.open(self.segment_dir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _read_segment(self, path: Path) -> Iterator[Dict[str, Any]]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        # Torn write from a crash; the entry was never acknowledged.
+                        break
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        self.logger.warning(f"Skipping corrupt line in {path.name}")
+        except FileNotFoundError:
+            return
+
+    def _migrate_legacy_file(self):
+        """Convert a legacy JSON array file into the first segment."""
+        if not self.legacy_file.exists() or self._list_segments():
+            return
+
+        with open(self.legacy_file, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+
+        target = self._segment_path((0, 0))
+        tmp_path = target.with_name(target.name + ".tmp")
+        with open(tmp_path, 'wb') as out:
+            for entry in entries:
+                out.write((json.dumps(entry, ensure_ascii=False) + "\n").encode('utf-8'))
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp_path, target)
+        self._fsync_dir()
+
+        self.legacy_file.rename(self.legacy_file.with_name(self.legacy_file.name + ".migrated"))
+        self.logger.info(f"Migrated {len(entries)} entries from {self.legacy_file.name}")
+
+
+_stores: Dict[Path, JsonlLogStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_log_store(filename: str, base_dir: str = "data/storage") -> JsonlLogStore:
+    """Get the shared store for a storage file name such as ``tasks.json``."""
+    path = (Path(base_dir) / filename).resolve()
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = JsonlLogStore(path)
+            _stores[path] = store
+        return store
+
+
+def close_all_stores():
+    """Flush and close every open store."""
+    with _stores_lock:
+        for store in _stores.values():
+            store.close()
+
+
+atexit.register(close_all_stores)
@@ -0,0 +1,111 @@
+"""
+Progressive Telegram replies for streamed text.
+
+Sends a placeholder right away and edits it as chunks arrive, throttled to
+stay inside Telegram's per-chat edit rate limits.
+"""
+
+import asyncio
+import time
+from typing import AsyncIterator, Optional
+
+from telegram import Message
+from telegram.error import BadRequest, RetryAfter
+
+from utils.logger import get_logger
+
+
+TELEGRAM_MESSAGE_LIMIT = 4096
+
+logger = get_logger(__name__)
+
+
+async def stream_reply(message: Message,
+                       chunks: AsyncIterator[str],
+                       placeholder: str = "⏳ ...",
+                       min_edit_interval: float = 1.0,
+                       parse_mode: Optional[str] = 'Markdown',
+                       cursor: str = " ▌") -> str:
+    """Reply to a message with streamed text, editing it in place as chunks arrive.
+
+    The first chunk is shown immediately; later edits are at most one per
+    ``min_edit_interval`` seconds. Intermediate edits are plain text because
+    partial Markdown is usually invalid; the final edit applies ``parse_mode``.
+    Text longer than one Telegram message continues in a new message.
+
+    Returns the full streamed text.
+    """
+    sent = await message.reply_text(placeholder)
+    full_text = ""
+    message_start = 0
+    shown = placeholder
+    last_edit = 0.0
+
+    async for chunk in chunks:
+        full_text += chunk
+        current = full_text[message_start:]
+
+        if len(current) + len(cursor) > TELEGRAM_MESSAGE_LIMIT:
+            # A large chunk can overflow more than one message
+            while len(current) + len(cursor) > TELEGRAM_MESSAGE_LIMIT:
+                split_at = _split_point(current, TELEGRAM_MESSAGE_LIMIT)
+                await _finalize(sent, current[:split_at], parse_mode)
+                message_start += split_at
+                current = full_text[message_start:]
+                preview = current[:TELEGRAM_MESSAGE_LIMIT - len(cursor)]
+                sent = await message.reply_text(preview + cursor if preview.strip() else placeholder)
+                shown = preview if preview.strip() else placeholder
+            last_edit = time.monotonic()
+            continue
+
+        now = time.monotonic()
+        first_edit = shown == placeholder
+        if current.strip() and current != shown and (first_edit or now - last_edit >= min_edit_interval):
+            await _safe_edit(sent, current + cursor, None)
+            shown = current
+            last_edit = time.monotonic()
+
+    final = full_text[message_start:]
+    if final.strip():
+        await _finalize(sent, final, parse_mode)
+    elif not full_text.strip():
+        await _safe_edit(sent, "❌ No response received. Please try again.", None)
+
+    return full_text
+
+
+async def _finalize(sent: Message, text: str, parse_mode: Optional[str]):
+    """Write the final text, falling back to plain text if the markup is invalid."""
+    if parse_mode and await _safe_edit(sent, text, parse_mode):
+        return
+    await _safe_edit(sent, text, None)
+
+
+async def _safe_edit(sent: Message, text: str, parse_mode: Optional[str]) -> bool:
+    """Edit a message, honouring flood-control waits. Returns False on a bad request."""
+    for _ in range(3):
+        try:
+            await sent.edit_text(text, parse_mode=parse_mode)
+            return True
+        except RetryAfter as e:
+            retry_after = e.retry_after
+            if hasattr(retry_after, 'total_seconds'):
+                retry_after = retry_after.total_seconds()
+            logger.warning(f"Telegram edit rate limited, retrying after {retry_after}s")
+            await asyncio.sleep(retry_after)
+        except BadRequest as e:
+            if 'not modified' in str(e).lower():
+                return True
+            logger.debug(f"Edit rejected: {e}")
+            return False
+    return False
+
+
+def _split_point(text: str, limit: int) -> int:
+    """Find a paragraph, line or word boundary to split an overlong message at."""
+    window = text[:limit]
+    for separator in ("\n\n", "\n", " "):
+        index = window.rfind(separator)
+        if index > limit // 2:
+            return index + len(separator)
+    return limit
@@ -0,0 +1,185 @@
+"""
+Span tracing for the voice command pipeline.
+
+Each voice message gets a trace ID; every stage (download, transcription,
+language detection, parsing, action) is timed as a span. Spans are kept in a
+small SQLite table that is pruned to the most recent rows, and summarized as
+p50/p95 latency per stage and provider.
+"""
+
+import math
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from utils.logger import get_logger
+
+
+class Span:
+    """One timed pipeline stage."""
+
+    __slots__ = ("stage", "provider", "started_at", "duration_ms", "ok", "detail")
+
+    def __init__(self, stage: str, provider: Optional[str] = None):
+        self.stage = stage
+        self.provider = provider
+        self.started_at = time.time()
+        self.duration_ms = 0.0
+        self.ok = True
+        self.detail: Optional[str] = None
+
+
+class VoiceTrace:
+    """Spans for a single voice message, written together when the trace finishes."""
+
+    def __init__(self, tracer: "VoiceTracer", user_id: Optional[int] = None):
+        self.tracer = tracer
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.user_id = user_id
+        self.spans: List[Span] = []
+        self._started = time.perf_counter()
+        self._finished = False
+
+    @contextmanager
+    def span(self, stage: str, provider: Optional[str] = None):
+        """Time a stage; the span is marked failed if the block raises."""
+        span = Span(stage, provider)
+        started = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.ok = False
+            span.detail = type(e).__name__
+            raise
+        finally:
+            span.duration_ms = (time.perf_counter() - started) * 1000
+            self.spans.append(span)
+
+    def finish(self, ok: bool = True):
+        """Record a 'total' span and persist the trace. Safe to call more than once."""
+        if self._finished:
+            return
+        self._finished = True
+        total = Span("total")
+        total.duration_ms = (time.perf_counter() - self._started) * 1000
+        # A failed primary transcription that fell back successfully is not a failed trace
+        total.ok = ok
+        self.spans.append(total)
+        self.tracer.record(self)
+
+
+class VoiceTracer:
+    """Stores voice pipeline spans in SQLite, keeping only the newest ``max_spans`` rows."""
+
+    def __init__(self, db_path: str = "data/storage/voice_traces.db", max_spans: int = 20000):
+        self.logger = get_logger(__name__)
+        self.db_path = Path(db_path)
+        self.max_spans = max_spans
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS spans ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " trace_id TEXT NOT NULL,"
+            " user_id INTEGER,"
+            " stage TEXT NOT NULL,"
+            " provider TEXT,"
+            " started_at REAL NOT NULL,"
+            " duration_ms REAL NOT NULL,"
+            " ok INTEGER NOT NULL,"
+            " detail TEXT)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_spans_started ON spans (started_at)")
+        self._conn.commit()
+
+    def start_trace(self, user_id: Optional[int] = None) -> VoiceTrace:
+        return VoiceTrace(self, user_id)
+
+    def record(self, trace: VoiceTrace):
+        rows = [
+            (trace.trace_id, trace.user_id, span.stage, span.provider, span.started_at,
+             span.duration_ms, int(span.ok), span.detail)
+            for span in trace.spans
+        ]
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT INTO spans (trace_id, user_id, stage, provider, started_at, duration_ms, ok, detail)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._writes += 1
+                # Ring-buffer semantics: trim the oldest rows every so often
+                if self._writes % 50 == 0:
+                    self._conn.execute(
+                        "DELETE FROM spans WHERE id <= (SELECT MAX(id) FROM spans) - ?",
+                        (self.max_spans,)
+                    )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not record voice trace {trace.trace_id}: {e}")
+
+        summary = ", ".join(f"{span.stage}={span.duration_ms:.0f}ms" for span in trace.spans)
+        self.logger.info(f"Voice trace {trace.trace_id}: {summary}")
+
+    def stage_stats(self, since_hours: float = 24 * 7) -> List[Dict[str, Any]]:
+        """Count, error count and p50/p95 latency per (stage, provider)."""
+        since = time.time() - since_hours * 3600
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT stage, COALESCE(provider, ''), duration_ms, ok FROM spans"
+                " WHERE started_at >= ? ORDER BY stage, provider, duration_ms",
+                (since,)
+            ).fetchall()
+
+        groups: Dict[tuple, Dict[str, Any]] = {}
+        for stage, provider, duration_ms, ok in rows:
+            group = groups.setdefault((stage, provider), {"durations": [], "errors": 0})
+            group["durations"].append(duration_ms)
+            if not ok:
+                group["errors"] += 1
+
+        stats = []
+        for (stage, provider), group in groups.items():
+            durations = group["durations"]  # already sorted by the query
+            stats.append({
+                "stage": stage,
+                "provider": provider or None,
+                "count": len(durations),
+                "errors": group["errors"],
+                "p50_ms": _percentile(durations, 0.50),
+                "p95_ms": _percentile(durations, 0.95),
+            })
+        return stats
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(sorted_values) - 1, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+# Pipeline order used when presenting stats
+STAGE_ORDER = ["download", "transcribe", "language_detection", "parse", "action", "total"]
+
+_tracer: Optional[VoiceTracer] = None
+
+
+def get_voice_tracer() -> VoiceTracer:
+    """Shared tracer, created on first use."""
+    global _tracer
+    if _tracer is None:
+        _tracer = VoiceTracer()
+    return _tracer